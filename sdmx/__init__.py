@@ -1,7 +1,7 @@
 import logging
 from importlib.metadata import PackageNotFoundError, version
 
-from sdmx.client import Client, Request, read_url
+from sdmx.client import AsyncClient, Client, Request, read_url
 from sdmx.convert.pandas import to_pandas
 from sdmx.format.xml.common import install_schemas, validate_xml
 from sdmx.reader import read_sdmx, to_sdmx
@@ -11,6 +11,7 @@ from sdmx.writer.csv import to_csv
 from sdmx.writer.xml import to_xml
 
 __all__ = [
+    "AsyncClient",
     "Client",
     "Request",
     "Resource",
@@ -1,26 +1,50 @@
+import asyncio
 import logging
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import partial
-from typing import IO, TYPE_CHECKING, Any
+from itertools import chain, islice
+from typing import IO, TYPE_CHECKING, Any, cast
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
 from warnings import warn
+from weakref import WeakKeyDictionary, finalize
 
+import pandas as pd
 import requests
+import requests.adapters
 
-from sdmx.model import common
+from sdmx.convert.pandas import to_pandas
+from sdmx.model import common, v21, v30
 from sdmx.model.v21 import DataStructureDefinition
 from sdmx.reader import get_reader
-from sdmx.rest import Resource
-from sdmx.session import ResponseIO, Session
+from sdmx.reader.xml import Reader as XMLReader
+from sdmx.reader.xml import read_series_keys
+from sdmx.rest import Resource, plan
+from sdmx.rest.common import RESPONSE_CODE, QueryParameter
+from sdmx.session import HTTPAdapter, RateLimit, ResponseIO, Session
 from sdmx.source import NoSource, get_source, list_sources
+from sdmx.source import Source as BaseSource
+from sdmx.util.cache import MessageCache, StructureCache, request_key
+from sdmx.util.metrics import Metrics
 
 if TYPE_CHECKING:
+    import concurrent.futures
     import io
     import os
 
     import sdmx.message
+    import sdmx.reader.base
     import sdmx.source
 
 log = logging.getLogger(__name__)
 
+#: Response headers that validate a cached message, and the corresponding request
+#: headers for a conditional request.
+CONDITIONAL_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
 
 def Request(*args, **kwargs):
     """Compatibility function for :class:`Client`.
@@ -47,7 +71,16 @@ class Client:
         :meth:`list_sources`.
     session :
         :class:`.requests.Session` instance. If not supplied, an instance of
-        :class:`.Session` is created.
+        :class:`.Session` is created. For a :class:`.Session`, requests to a source
+        with a :attr:`.Source.rate_limit` are limited using :meth:`.Session.limit`.
+    cache :
+        :class:`.MessageCache` instance for messages retrieved with
+        :py:`use_cache=True`. If not supplied, an instance with default limits is
+        created. To reuse parsed messages across processes, give an instance with a
+        :class:`.PersistentMessageCache` as its `persist` argument.
+    structure_cache :
+        :class:`.StructureCache` instance for structures used to validate :class:`dict`
+        keys in data queries. If not supplied, these are not stored persistently.
     log_level : int
         Override the package-wide logger with one of the
         :ref:`standard logging levels <py:levels>`.
@@ -59,7 +92,11 @@ class Client:
         :class:`.requests_cache.CachedSession` and its backend classes (if installed).
     """
 
-    cache: dict[str, "sdmx.message.Message"] = {}
+    #: Messages retrieved with :py:`use_cache=True`, keyed by :func:`.request_key`.
+    cache: MessageCache
+
+    #: Persistent cache of structures for :class:`dict` keys, if any.
+    structure_cache: StructureCache | None
 
     #: :class:`.source.Source` for requests sent from the instance.
     source: "sdmx.source.Source"
@@ -68,13 +105,22 @@ class Client:
     session: requests.Session
 
     # Stored keyword arguments "allow_redirects" and "timeout" for pre-requests.
-    _send_kwargs: dict[str, Any] = {}
+    _send_kwargs: dict[str, Any]
+
+    # Lock for :attr:`_send_kwargs` and attributes of :attr:`session`
+    _lock: threading.Lock
+
+    # Thread-local storage. In :meth:`get_many`, "send_kwargs" holds keyword arguments
+    # for :meth:`requests.Session.send` that apply to one request only.
+    _local: threading.local
 
     def __init__(
         self,
         source=None,
         *,
         session: "requests.Session | None" = None,
+        cache: MessageCache | None = None,
+        structure_cache: StructureCache | None = None,
         log_level=None,
         **session_opts,
     ):
@@ -93,6 +139,19 @@ class Client:
             # Create an HTTP Session object to reuse a connection for multiple requests
             self.session = Session(**session_opts)
 
+        # Limit the rate of requests to the source, shared with other Clients
+        if self.source.rate_limit and isinstance(self.session, Session):
+            key = urlsplit(self.source.url).netloc
+            self.session.limit(
+                self.source.url, RateLimit.shared(key, **self.source.rate_limit)
+            )
+
+        self.cache = MessageCache() if cache is None else cache
+        self.structure_cache = structure_cache
+        self._send_kwargs = dict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
         if log_level:
             message = "Client(…, log_level=…) parameter"
             log.warning(f"Deprecated: {message}")
@@ -138,19 +197,44 @@ class Client:
         )
         self.session.timeout = value
 
-    def series_keys(self, flow_id, use_cache=True):
+    def series_keys(self, flow_id, use_cache=True, *, frame: bool = False):
         """Return all :class:`.SeriesKey` for *flow_id*.
 
+        Parameters
+        ----------
+        frame : bool, optional
+            If :obj:`True`, return a :class:`pandas.DataFrame` with one column for each
+            dimension and one row for each series key, the same as
+            :py:`sdmx.to_pandas(list(keys))`. An SDMX-ML response is read using
+            :func:`.reader.xml.read_series_keys`, without constructing SDMX objects;
+            this is much faster for dataflows with many series. This is not done if
+            the :attr:`source` has a :meth:`~.Source.finish_message` hook; the message
+            is then parsed and passed to the hook. The result is not stored in
+            :attr:`cache`, but a message already there is used if `use_cache` is
+            :obj:`True`.
+
         Returns
         -------
-        list
+        list or pandas.DataFrame
         """
         # download an empty dataset with all available series keys
-        return (
-            self.data(flow_id, params={"detail": "serieskeysonly"}, use_cache=use_cache)
-            .data[0]
-            .series.keys()
-        )
+        params = {"detail": "serieskeysonly"}
+        if not frame:
+            return (
+                self.data(flow_id, params=params, use_cache=use_cache)
+                .data[0]
+                .series.keys()
+            )
+
+        req, kwargs = self._prepare(Resource.data, flow_id, dict(params=params))
+        if (msg := self._from_cache(req, use_cache, False)) is None:
+            Reader, response, content = self._open(self._send(req, Resource.data))
+            if issubclass(Reader, XMLReader) and not _has_finish_message(self.source):
+                return read_series_keys(content, kwargs.get("dsd"))
+            msg = self._convert(Reader, response, content, kwargs)
+
+        keys = list(cast("sdmx.message.DataMessage", msg).data[0].series)
+        return to_pandas(keys) if keys else pd.DataFrame()
 
     def _make_key(self, resource_type, resource_id, key, dsd):
         """Validate `key` if possible.
@@ -165,32 +249,132 @@ class Client:
         ):
             return key, dsd
 
+        dsd = self._resolve_dsd(resource_id, dsd)
+
+        # Make a ContentConstraint from the key
+        cc = dsd.make_constraint(key)
+
+        return cc.to_query_string(dsd), dsd
+
+    def _resolve_dsd(self, resource_id, dsd=None):
+        """Return `dsd`, or retrieve or construct a DSD for the data `resource_id`."""
         # Select validation method based on agency capabilities
         if dsd:
             # DSD was provided
-            pass
+            return dsd
         elif self.source.supports[Resource.datastructure]:
             # Retrieve the DataStructureDefinition
-            dsd = (
-                self.dataflow(
-                    resource_id, params=dict(references="all"), use_cache=True
-                )
-                .dataflow[resource_id]
-                .structure
-            )
-
-            if dsd.is_external_reference:
-                # DataStructureDefinition was not retrieved with the Dataflow query;
-                # retrieve it explicitly
-                dsd = self.get(resource=dsd, use_cache=True).structure[dsd.id]
+            return self._get_dsd(resource_id)
         else:
             # Construct a DSD from the keys
-            dsd = DataStructureDefinition.from_keys(self.series_keys(resource_id))
+            keys = self.series_keys(resource_id, frame=True)
+            return DataStructureDefinition.from_values(keys.to_dict("series"))
+
+    def _supply_dsd(self, kwargs: dict) -> None:
+        """Supply a DSD in `kwargs` for a data query, if none is given.
+
+        With a DSD, :meth:`.Source.modify_request_args` can request structure-specific
+        data, which is faster to parse. If the `key` is a :class:`dict`, the DSD is
+        needed to validate it in any case, so it is retrieved using
+        :meth:`_resolve_dsd`. Otherwise, it is supplied only if the :attr:`source`
+        supports structure-specific data and the DSD is available from
+        :attr:`structure_cache` or :attr:`cache`; see :meth:`_known_dsd`.
+        """
+        resource_id = kwargs.get("resource_id")
+        if not (
+            kwargs.get("resource_type") == Resource.data
+            and resource_id
+            and kwargs.get("dsd") is None
+        ):
+            return
 
-        # Make a ContentConstraint from the key
-        cc = dsd.make_constraint(key)
+        if isinstance(kwargs.get("key"), dict):
+            kwargs["dsd"] = self._resolve_dsd(resource_id)
+        elif self.source.supports["structure-specific data"] and (
+            dsd := self._known_dsd(resource_id)
+        ):
+            log.debug(f"Use {dsd!r} from cache for structure-specific data")
+            kwargs["dsd"] = dsd
 
-        return cc.to_query_string(dsd), dsd
+    def _known_dsd(self, flow_id: str):
+        """Return the DSD for the dataflow `flow_id`, if known.
+
+        The DSD is returned only if it was retrieved earlier and stored in
+        :attr:`structure_cache` or :attr:`cache`, for instance to validate a
+        :class:`dict` key; no query is sent. Returns :obj:`None` if the DSD is not
+        known.
+        """
+        try:
+            return self._get_dsd(flow_id, fetch=False)
+        except (KeyError, NotImplementedError, requests.HTTPError) as e:
+            log.info(f"No DSD for {flow_id!r}: {e!r}")
+            return None
+
+    def _get_dsd(self, flow_id: str, fetch: bool = True):
+        """Retrieve the DSD for the dataflow `flow_id`.
+
+        If :attr:`structure_cache` is set, it is used instead of querying the
+        :attr:`source`, and updated with the results of any query. Errors reading from
+        or writing to the cache are logged as warnings; the source is then queried, and
+        the result not cached.
+
+        If `fetch` is :obj:`False`, no query is sent: :obj:`None` is returned unless the
+        DSD is in :attr:`structure_cache` or :attr:`cache`.
+        """
+        urn = (
+            "urn:sdmx:org.sdmx.infomodel.datastructure.Dataflow="
+            f"{self.source.id}:{flow_id}(latest)"
+        )
+        sc = self.structure_cache
+        try:
+            msg = sc.get(self.source.id, urn) if sc else None
+            if msg is not None:
+                return _flow_dsd(msg, flow_id)
+        except Exception as e:
+            log.warning(f"Ignore {urn} in structure cache: {e!r}")
+            sc = None
+
+        msg = self._get_structure(
+            fetch, self.dataflow, flow_id, params=dict(references="all")
+        )
+        if msg is None:
+            return None
+        dfd = msg.dataflow[flow_id]
+
+        if dfd.structure.is_external_reference:
+            # DataStructureDefinition was not retrieved with the Dataflow query;
+            # retrieve it explicitly
+            if (
+                dsd_msg := self._get_structure(fetch, self.get, resource=dfd.structure)
+            ) is None:
+                return None
+            # Combine in a new message; don't modify the one stored in `cache`
+            msg = type(dsd_msg)(header=dsd_msg.header)
+            for obj in chain(dsd_msg.iter_objects(), [dfd]):
+                msg.add(obj)
+
+        if sc:
+            try:
+                sc.put(self.source.id, urn, msg)
+            except Exception as e:
+                log.warning(f"Could not store {urn} in structure cache: {e!r}")
+
+        return _flow_dsd(msg, flow_id)
+
+    def _get_structure(
+        self, fetch: bool, func, *args, **kwargs
+    ) -> "sdmx.message.StructureMessage | None":
+        """Return :py:`func(*args, **kwargs, use_cache=True)`.
+
+        `func` is :meth:`get` or a method like :meth:`dataflow`. If `fetch` is
+        :obj:`False` and the message is not in :attr:`cache`, return :obj:`None`
+        instead of querying the :attr:`source`.
+        """
+        if not fetch:
+            req = func(*args, dry_run=True, **kwargs)
+            if request_key(req) not in self.cache:
+                return None
+        return func(*args, use_cache=True, **kwargs)
 
     def _request_from_args(self, kwargs):
         """Validate arguments and prepare pieces for a request."""
@@ -221,12 +405,15 @@ class Client:
         kwargs.clear()
 
         if isinstance(key, dict):
-            # Make the key, and retain the DSD (if any) for use in parsing
+            # Make the key
             key, dsd = self._make_key(resource_type, resource_id, key, dsd)
-            kwargs["dsd"] = dsd
         elif not (key is None or isinstance(key, str)):
             raise TypeError(f"key must be str or dict; got {key.__class__.__name__}")
 
+        if dsd is not None:
+            # Retain the DSD for use in parsing
+            kwargs["dsd"] = dsd
+
         if key is not None:
             kw.update(key=key)
 
@@ -252,8 +439,8 @@ class Client:
         parameters = kwargs.pop("params", {})
         headers = kwargs.pop("headers", {})
 
-        # kwargs with values other than None are an error
-        extra_args = dict(filter(lambda i: i[1] is not None, kwargs.items()))
+        # kwargs with values other than None are an error, except `dsd` for parsing
+        extra_args = {k: v for k, v in kwargs.items() if v is not None and k != "dsd"}
         if len(extra_args):
             raise ValueError(f"{repr(extra_args)} supplied with get(url=...)")
 
@@ -298,6 +485,8 @@ class Client:
                 f"{resource_type!r} API endpoint. Use force=True to override"
             )
 
+        self._supply_dsd(kwargs)
+
         # Allow Source class to modify request args
         # TODO this should occur after most processing, defaults, checking etc. are
         #      performed, so that core code does most of the work.
@@ -307,26 +496,36 @@ class Client:
         def _collect(*keywords):
             return {kw: kwargs.pop(kw) for kw in keywords if kw in kwargs}
 
-        # Update session attributes. These changes persist.
-        for name, value in _collect("cert", "proxies", "stream", "verify").items():
-            # Log if the new value is different from the old
-            old_value = getattr(self.session, name)
-            if value != old_value:
-                log.debug(f"Client.session.{name}={value} replaces {old_value}")
-
-            # Store
-            setattr(self.session, name, value)
-
+        session_attrs = _collect("cert", "proxies", "stream", "verify")
         # Separate kwargs for requests.Session.send()
         send_kwargs = _collect("allow_redirects", "timeout")
-        if (
-            len(send_kwargs)
-            and len(self._send_kwargs)
-            and send_kwargs != self._send_kwargs
-        ):
-            log.debug(f"Client.get() args {send_kwargs} replace {self._send_kwargs}")
 
-        self._send_kwargs.update(send_kwargs)
+        if (local := getattr(self._local, "send_kwargs", None)) is not None:
+            # Request from get_many(): apply to this request only
+            local.update(session_attrs, **send_kwargs)
+            return kwargs
+
+        with self._lock:
+            # Update session attributes. These changes persist.
+            for name, value in session_attrs.items():
+                # Log if the new value is different from the old
+                old_value = getattr(self.session, name)
+                if value != old_value:
+                    log.debug(f"Client.session.{name}={value} replaces {old_value}")
+
+                # Store
+                setattr(self.session, name, value)
+
+            if (
+                len(send_kwargs)
+                and len(self._send_kwargs)
+                and send_kwargs != self._send_kwargs
+            ):
+                log.debug(
+                    f"Client.get() args {send_kwargs} replace {self._send_kwargs}"
+                )
+
+            self._send_kwargs.update(send_kwargs)
 
         # Return remaining kwargs
         return kwargs
@@ -338,6 +537,7 @@ class Client:
         tofile: "os.PathLike | IO | None" = None,
         use_cache: bool = False,
         dry_run: bool = False,
+        revalidate: bool = False,
         **kwargs,
     ) -> "sdmx.message.Message | requests.Request":
         """Retrieve SDMX data or metadata.
@@ -372,6 +572,15 @@ class Client:
         relevant :class:`DSD <.BaseDataStructureDefinition>`, either given with the
         `dsd` keyword argument, or retrieved from the web service before the main query.
 
+        If a DSD is given or retrieved, and the :attr:`source` :attr:`supports
+        <.Source.supports>` it, structure-specific data are requested; these are faster
+        to parse than generic data. For data queries with :class:`str` or no `key`,
+        the DSD is supplied automatically if it is already known: either from
+        :attr:`structure_cache`, if set, or from :attr:`cache`. Other HTTP headers,
+        such as ``Accept`` for other resource types, are taken from
+        :attr:`.Source.headers`. Responses are requested with gzip compression, the
+        default of :class:`requests.Session`.
+
         For the optional `param` keyword argument, some useful parameters are:
 
         - 'startperiod', 'endperiod': restrict the time range of data to retrieve.
@@ -393,13 +602,22 @@ class Client:
             If :obj:`True`, prepare and return a :class:`requests.Request` object, but
             do not execute the query. The prepared URL and headers can be examined by
             inspecting the returned object.
+        revalidate : bool, optional
+            If :obj:`True` and `use_cache` is :obj:`True`, a message found in
+            :attr:`cache` is not returned directly. Instead, a conditional request is
+            sent with ``If-None-Match`` and/or ``If-Modified-Since`` headers, using the
+            ``ETag`` and ``Last-Modified`` headers of the cached message's
+            :attr:`~.Message.response`. If the web service responds with HTTP status 304
+            ("No changes"), the cached message is returned; otherwise the new response
+            is parsed and replaces it.
         **kwargs
             Other, optional parameters (below).
 
         Other Parameters
         ----------------
         dsd : :class:`DataStructureDefinition <.BaseDataStructureDefinition>`
-            Existing object used to validate the `key` argument. If not provided, an
+            Existing object used to validate the `key` argument, to request
+            structure-specific data, and to parse the response. If not provided, an
             additional query executed to retrieve a DSD in order to validate the `key`.
         force : bool
             If :obj:`True`, execute the query even if the :attr:`source` does not
@@ -408,10 +626,20 @@ class Client:
             HTTP headers. Given headers will overwrite instance-wide headers passed to
             the constructor. Default: :obj:`None` to use the default headers of the
             :attr:`source`.
-        key : str or dict
+        key : str or dict or list of dict
             For queries with `resource_type='data'`. :class:`str` values are not
             validated; :class:`dict` values are validated using
             :meth:`~.DataStructureDefinition.make_constraint`.
+
+            If the query string for a :class:`dict` key would be longer than
+            :attr:`.Source.max_url_length`, or select more than
+            :attr:`.Source.max_series`, the query is split into several that are
+            within these limits. A :class:`list` of :class:`dict` keys is first
+            combined into as few keys as possible; see :func:`.rest.plan.coalesce`.
+            The resulting queries are executed concurrently using :meth:`get_many`,
+            and the data are merged into a single message using
+            :meth:`.DataMessage.merge`. With `dry_run`, a list of prepared requests is
+            returned.
         params : dict
             Query parameters. The `SDMX REST web service guidelines <https://\
             github.com/sdmx-twg/sdmx-rest/tree/master/v2_1/ws/rest/docs>`_
@@ -428,9 +656,26 @@ class Client:
             other providers, but do not provide any (meta)data themselves.
         resource : :class:`~.MaintainableArtefact` subclass
             Object to retrieve. If given, `resource_type` and `resource_id` are ignored.
+        stream : bool
+            If :obj:`True`, parse the response as it is received, writing it to `tofile`
+            at the same time, instead of first reading the entire response into memory.
+            The :attr:`~requests.Response.content` of :attr:`.Message.response` is then
+            not available. The value is stored as :attr:`requests.Session.stream` of
+            :attr:`session`, and applies to later queries (except with
+            :meth:`get_many`).
+        time_chunks : str or pandas.DateOffset
+            For queries with `resource_type='data'`. Length of time windows, for
+            instance "5Y" or "6M", into which the range from the `start_period` to the
+            `end_period` query parameter (default: the current date) is divided; see
+            :func:`.rest.plan.periods`. One query is made for each window (and each
+            planned `key`, above), and the data are merged into a single message as
+            described for `key`.
         version : str
             :attr:`~.VersionableArtefact.version>` of a resource to retrieve. Default:
             the keyword 'latest'.
+        workers : int
+            Maximum number of planned queries (see `key` and `time_chunks`) executed at
+            the same time. Default: 4.
 
         Returns
         -------
@@ -444,9 +689,304 @@ class Client:
             If the :attr:`source` does not support the given `resource_type` and `force`
             is not :obj:`True`.
         """
+        if self._needs_plan(resource_type, kwargs):
+            return self._get_planned(  # type: ignore [return-value]
+                resource_id, tofile, use_cache, dry_run, kwargs
+            )
+
+        # Only used for planned queries
+        kwargs.pop("workers", None)
+
+        metrics = Metrics()
+        req_prepared, kwargs = self._prepare(resource_type, resource_id, kwargs)
+        if dry_run:
+            return req_prepared  # type: ignore [return-value]
+        metrics.mark("prepared")
+        metrics.url = req_prepared.url
+
+        # Now get the SDMX message via HTTP
+        log.info(f"Request {req_prepared.url}")
+        log.info(f"with headers {req_prepared.headers}")
+
+        # Try to get resource from memory cache if specified
+        cached = self._from_cache(req_prepared, use_cache, revalidate)
+        if cached is not None and not revalidate:
+            return _cache_hit(cached, metrics)
+
+        response = self._send(req_prepared, resource_type, metrics)
+        if cached is not None and response.status_code == 304:
+            log.info(f"{RESPONSE_CODE[304]}; use cached message")
+            return _cache_hit(cached, metrics)
+
+        msg = self._parse(response, tofile, kwargs, metrics=metrics)
+
+        # store in memory cache if needed
+        if use_cache and req_prepared.url:
+            self.cache[request_key(req_prepared)] = msg
+
+        metrics.emit()
+        return msg
+
+    def get_many(
+        self,
+        requests: Iterable["Mapping[str, Any] | requests.PreparedRequest"],
+        *,
+        max_workers: int = 4,
+        ordered: bool = True,
+    ) -> Iterator:
+        """Retrieve many SDMX messages concurrently, using a pool of threads.
+
+        All requests are sent through :attr:`session`. Its connection pool is enlarged
+        (if needed) to keep `max_workers` connections open for reuse. Arguments to
+        :meth:`get` such as `stream` or `timeout` in items of `requests` apply to that
+        request only; they are not stored on :attr:`session`.
+
+        The first `max_workers` requests are sent when :meth:`get_many` is called. The
+        result is an iterator; each further request is sent only as a result is taken
+        from it, so at most `max_workers` requests are in progress, and at most
+        `max_workers` results are held in memory. To retrieve all `requests`, iterate
+        over the result to the end. If the result is discarded before then, the
+        requests not yet sent are cancelled.
+
+        Parameters
+        ----------
+        requests :
+            Each item is either a mapping of keyword arguments to :meth:`get`, or a
+            :class:`requests.PreparedRequest`, for instance from :py:`get(...,
+            dry_run=True)`.
+        max_workers : int, optional
+            Maximum number of requests sent at the same time.
+        ordered : bool, optional
+            If :obj:`True` (the default), yield results in the same order as
+            `requests`. Otherwise, yield 2-tuples of (index in `requests`, result) as
+            each request completes.
+
+        Yields
+        ------
+        :class:`~.Message` or :class:`Exception`
+            For each item in `requests`, either the retrieved message, or the exception
+            raised while retrieving it. An exception for one item does not prevent
+            retrieval of the others.
+
+        Example
+        -------
+        >>> client = sdmx.Client("ECB")
+        >>> queries = [dict(resource_type="data", resource_id="EXR", key=k) for k in
+        ...     ("D.CHF.EUR.SP00.A", "D.USD.EUR.SP00.A")]
+        >>> for msg in client.get_many(queries, max_workers=2):
+        ...     print(msg)
+        """
+        _mount_pool(self.session, max_workers)
+
+        # Send the first `max_workers` requests now
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        items = enumerate(requests)
+        futures = {
+            executor.submit(self._get_one, item): i
+            for i, item in islice(items, max_workers)
+        }
+        result = self._iter_many(executor, items, futures, ordered)
+        # Also shut down if the caller discards the iterator without starting it
+        finalize(result, executor.shutdown, wait=False, cancel_futures=True)
+        return result
+
+    def _iter_many(
+        self,
+        executor: ThreadPoolExecutor,
+        items: Iterator,
+        futures: dict,
+        ordered: bool,
+    ) -> Iterator:
+        """Yield results for :meth:`get_many`.
+
+        As each of `futures` completes, one more of `items` is submitted to `executor`.
+        """
+        try:
+            while futures:
+                if ordered:
+                    # The earliest remaining request
+                    f = next(iter(futures))
+                else:
+                    f = next(iter(wait(futures, return_when=FIRST_COMPLETED).done))
+                i = futures.pop(f)
+                result: "sdmx.message.Message | Exception"
+                try:
+                    result = f.result()
+                except Exception as e:
+                    result = e
+
+                # Keep up to `max_workers` requests in progress
+                for j, item in islice(items, 1):
+                    futures[executor.submit(self._get_one, item)] = j
+
+                yield result if ordered else (i, result)
+        finally:
+            # Don't start remaining requests if the caller stops iterating
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_one(self, item) -> "sdmx.message.Message":
+        """Retrieve one item for :meth:`get_many`."""
+        if isinstance(item, Mapping):
+            # Apply arguments such as `stream` and `timeout` to this request only,
+            # instead of storing them on the shared :attr:`session`
+            self._local.send_kwargs = {}
+            try:
+                return self.get(**item)  # type: ignore [return-value]
+            finally:
+                del self._local.send_kwargs
+
+        metrics = Metrics(url=item.url)
+        msg = self._parse(self._send(item, None, metrics), None, {}, metrics=metrics)
+        metrics.emit()
+        return msg
+
+    def _needs_plan(self, resource_type, kwargs) -> bool:
+        """Return :obj:`True` if a query plan is needed for a data query."""
+        key = kwargs.get("key")
+        return resource_type == Resource.data and (
+            isinstance(key, list)
+            or bool(kwargs.get("time_chunks"))
+            or (
+                isinstance(key, dict)
+                and bool(self.source.max_url_length or self.source.max_series)
+            )
+        )
+
+    def _get_planned(self, resource_id, tofile, use_cache, dry_run, kwargs):
+        """Retrieve data for a :class:`dict` key or list of keys, using a query plan.
+
+        See :mod:`.rest.plan`.
+        """
+        key = kwargs.pop("key", None)
+        time_chunks = kwargs.pop("time_chunks", None)
+        workers = kwargs.pop("workers", 4)
+
+        # Time periods: replace any start_period/end_period with values for each chunk
+        windows: list = [{}]
+        if time_chunks:
+            # Don't modify the caller's dict
+            kwargs["params"] = kwargs.get("params", {}).copy()
+            start, end = (
+                _pop_parameter(kwargs, n) for n in ("start_period", "end_period")
+            )
+            if start is None:
+                raise ValueError("time_chunks= without start_period")
+            windows = [
+                dict(start_period=s, end_period=e)
+                for s, e in plan.periods(start, end, time_chunks)
+            ]
+
+        def _kwargs(**extra) -> dict:
+            # Copy `kwargs`, including mutable values such as "headers" and "params"
+            result = {
+                k: (v.copy() if isinstance(v, dict) else v) for k, v in kwargs.items()
+            }
+            result.setdefault("params", {}).update(extra)
+            return result
+
+        keys = self._plan_keys(resource_id, key, kwargs, _kwargs())
+        queries = [
+            dict(
+                resource_type=Resource.data,
+                resource_id=resource_id,
+                key=k,
+                use_cache=use_cache,
+                **_kwargs(**w),
+            )
+            for k in keys
+            for w in windows
+        ]
+        log.info(f"Query for {resource_id} planned as {len(queries)} request(s)")
+
+        if dry_run:
+            return [self.get(dry_run=True, **q) for q in queries]
+        elif len(queries) == 1:
+            return self.get(tofile=tofile, **queries[0])
+        elif tofile is not None:
+            raise ValueError(f"tofile= with a query split in {len(queries)} parts")
+
+        messages = list(self.get_many(queries, max_workers=workers))
+        for msg in messages:
+            if isinstance(msg, Exception):
+                raise msg
+
+        messages[0].merge(*messages[1:])
+        return messages[0]
+
+    def _plan_keys(self, resource_id, key, kwargs, base_kwargs) -> list:
+        """Return a list of :class:`str` keys for :meth:`_get_planned`.
+
+        If `key` is a :class:`dict` or :class:`list`, :attr:`kwargs["dsd"]
+        <.Client.get>` is set to the DSD used to validate it.
+        """
+        if not isinstance(key, (dict, list)):
+            return [key]
+
+        dsd = self._resolve_dsd(resource_id, kwargs.pop("dsd", None))
+        kwargs["dsd"] = dsd
+        dims = [d.id for d in dsd.dimensions if not isinstance(d, common.TimeDimension)]
+
+        # Length available for the key in the URL
+        max_length = None
+        if self.source.max_url_length:
+            base = self.get(Resource.data, resource_id, dry_run=True, **base_kwargs)
+            assert isinstance(base, requests.PreparedRequest) and base.url
+            max_length = self.source.max_url_length - len(base.url) - 1
+
+        result: list[str] = []
+        for k in plan.coalesce(key if isinstance(key, list) else [key], dims):
+            result.extend(
+                dsd.make_constraint(k1).to_query_string(dsd)
+                for k1 in plan.split(
+                    k, dims, max_length=max_length, max_series=self.source.max_series
+                )
+            )
+        return result
+
+    def _from_cache(
+        self, req: "requests.PreparedRequest", use_cache: bool, revalidate: bool
+    ) -> "sdmx.message.Message | None":
+        """Return a message from :attr:`cache` for `req`, or :obj:`None`.
+
+        If `revalidate` is :obj:`True`, also add headers to `req` for a conditional
+        request.
+        """
+        if not (use_cache and req.url):
+            return None
+
+        try:
+            msg = self.cache[request_key(req)]
+        except KeyError:
+            log.info("Not found in cache")
+            return None
+
+        if revalidate and msg.response is not None:
+            headers = msg.response.headers
+            for name, cond in CONDITIONAL_HEADERS.items():
+                if name in headers:
+                    req.headers[cond] = headers[name]
+
+        return msg
+
+    def _prepare(
+        self, resource_type, resource_id, kwargs: dict
+    ) -> tuple["requests.PreparedRequest", dict]:
+        """Prepare a request from the arguments to :meth:`get`.
+
+        Returns
+        -------
+        tuple
+            1. The prepared request.
+            2. Remaining `kwargs` for :meth:`_parse`.
+        """
         # Insert resource_type and resource_id into kwargs
         kwargs.update(dict(resource_type=resource_type, resource_id=resource_id))
 
+        # Arguments only for the Source.finish_message() hook
+        hook_kwargs = {
+            k: kwargs.pop(k) for k in self.source.finish_message_args if k in kwargs
+        }
+
         kwargs = self._handle_get_kwargs(kwargs)
 
         # Handle arguments
@@ -455,25 +995,35 @@ class Client:
         else:
             req = self._request_from_args(kwargs)
 
-        req_prepared = self.session.prepare_request(req)
-        if dry_run:
-            return req_prepared  # type: ignore [return-value]
+        kwargs.update(hook_kwargs)
+        return self.session.prepare_request(req), kwargs
 
-        # Now get the SDMX message via HTTP
-        log.info(f"Request {req_prepared.url}")
-        log.info(f"with headers {req_prepared.headers}")
+    def _send(
+        self,
+        req_prepared: "requests.PreparedRequest",
+        resource_type=None,
+        metrics: Metrics | None = None,
+    ):
+        """Send `req_prepared` and return the response.
 
-        # Try to get resource from memory cache if specified
-        if use_cache and req_prepared.url:
-            try:
-                return self.cache[req_prepared.url]
-            except KeyError:
-                log.info("Not found in cache")
-                pass
+        If `metrics` is given, the times at which the request is sent and the response
+        received are recorded.
 
+        Raises
+        ------
+        NotImplementedError
+            if the web service returns HTTP status 501.
+        """
         try:
             # Send the request
-            response = self.session.send(req_prepared, **self._send_kwargs)
+            with self._lock:
+                send_kwargs = self._send_kwargs.copy()
+            send_kwargs.update(getattr(self._local, "send_kwargs", {}))
+            if metrics:
+                metrics.mark("sent")
+            response = self.session.send(req_prepared, **send_kwargs)
+            if metrics:
+                metrics.received(response)
             response.raise_for_status()
         except requests.exceptions.ConnectionError as e:
             raise e from None
@@ -486,8 +1036,41 @@ class Client:
             else:
                 raise
 
+        return response
+
+    def _parse(
+        self,
+        response: requests.Response,
+        tofile,
+        kwargs: dict,
+        finish: bool = True,
+        metrics: Metrics | None = None,
+    ) -> "sdmx.message.Message":
+        """Parse `response` to a message, applying the :attr:`source` hooks.
+
+        If `finish` is :obj:`False`, the :meth:`.Source.finish_message` hook is not
+        called. Parse times are recorded in `metrics`, if given.
+        """
+        Reader, response, response_content = self._open(response, tofile)
+        return self._convert(
+            Reader, response, response_content, kwargs, finish, metrics
+        )
+
+    def _open(
+        self, response: requests.Response, tofile=None
+    ) -> tuple[type["sdmx.reader.base.BaseReader"], requests.Response, "io.IOBase"]:
+        """Return a reader class, `response`, and its content.
+
+        The :meth:`.Source.handle_response` hook is applied.
+        """
         # Maybe copy the response to file as it's received
-        response_content: "io.IOBase" = ResponseIO(response, tee=tofile)
+        response_content: "io.IOBase" = ResponseIO(
+            response,
+            tee=tofile,
+            stream=getattr(self._local, "send_kwargs", {}).get(
+                "stream", self.session.stream
+            ),
+        )
 
         # Allow a source class to modify the response (e.g. headers) or content
         response, response_content = self.source.handle_response(
@@ -503,23 +1086,103 @@ class Client:
                 + repr(response.headers.get("content-type", None))
             ) from None
 
-        # Instantiate reader
-        reader = Reader()
+        return Reader, response, response_content
+
+    def _convert(
+        self,
+        Reader: type["sdmx.reader.base.BaseReader"],
+        response: requests.Response,
+        response_content: "io.IOBase",
+        kwargs: dict,
+        finish: bool = True,
+        metrics: Metrics | None = None,
+    ) -> "sdmx.message.Message":
+        """Convert `response_content` to a message using `Reader`; see :meth:`_parse`."""
+        metrics = metrics or Metrics(url=response.url)
 
         # Parse the message, using any provided or auto-queried DSD
-        msg = reader.convert(response_content, structure=kwargs.get("dsd", None))
+        metrics.mark("parse_start")
+        msg = Reader().convert(response_content, structure=kwargs.get("dsd", None))
+        metrics.mark("parse_end")
 
-        # Store the HTTP response with the message
+        # Store the HTTP response and metrics with the message
         msg.response = response
+        msg.metrics = metrics
+        if not finish:
+            return msg
 
         # Call the finish_message() hook
         msg = self.source.finish_message(msg, self, **kwargs)
+        metrics.finished(msg, response_content)
+        return msg
 
-        # store in memory cache if needed
-        if use_cache and req_prepared.url:
-            self.cache[req_prepared.url] = msg
+    def refresh(self, msg: "sdmx.message.Message", **kwargs) -> "sdmx.message.Message":
+        """Retrieve changes to the data in `msg` since it was retrieved.
 
-        return msg
+        The query that returned `msg` is repeated with the ``updatedAfter`` query
+        parameter, so that the web service returns only data that was added or changed
+        since then. The time is taken from the ``Date`` header of
+        :attr:`msg.response <.Message.response>` or, if this is missing, from
+        :attr:`.Header.prepared`.
+
+        Only the URL of the earlier query is reused; other arguments to :meth:`get` are
+        not stored on `msg`. If `msg` contains structure-specific data, the data
+        structure of its first data set is used to read the new response, unless `dsd`
+        is given.
+
+        Parameters
+        ----------
+        msg : .Message
+            Message returned by an earlier query.
+        dsd : .BaseDataStructureDefinition, optional
+            Data structure used to read the response.
+        **kwargs
+            Passed to :meth:`get`.
+
+        Raises
+        ------
+        ValueError
+            if `msg` has no :attr:`~.Message.response`, or the time of the query cannot
+            be determined.
+        """
+        if msg.response is None:
+            raise ValueError("Message has no response to refresh")
+
+        since: "datetime | None"
+        try:
+            since = parsedate_to_datetime(msg.response.headers["Date"])
+        except (KeyError, TypeError, ValueError):
+            since = msg.header.prepared
+        if since is None:
+            raise ValueError("Time of the query for message is unknown")
+        elif since.tzinfo:
+            since = since.astimezone(timezone.utc)
+
+        # Name of the query parameter for the source's API version
+        name = cast(
+            QueryParameter,
+            self.source.get_url_class()._all_parameters["updated_after"],
+        ).camelName
+
+        # Replace any existing value in the URL of the earlier query
+        parts = urlsplit(msg.response.url)
+        params = {
+            k: v
+            for k, v in parse_qsl(parts.query)
+            if k not in {"updatedAfter", "updateAfter"}
+        }
+        params[name] = since.isoformat(timespec="seconds")
+
+        # Structure needed to read structure-specific data
+        data = getattr(msg, "data", None)
+        if data and isinstance(
+            data[0], (v21.StructureSpecificDataSet, v30.StructureSpecificDataSet)
+        ):
+            kwargs.setdefault("dsd", data[0].structured_by)
+
+        return self.get(  # type: ignore [return-value]
+            url=urlunsplit(parts._replace(query="")), params=params, **kwargs
+        )
 
     def preview_data(self, flow_id, key={}):
         """Return a preview of data.
@@ -552,21 +1215,243 @@ class Client:
         -------
         list of :class:`.SeriesKey`
         """
-        # Retrieve the series keys
-        all_keys = self.series_keys(flow_id)
+        if not len(key):
+            # No key is provided
+            return list(self.series_keys(flow_id))
 
-        if len(key):
-            # Construct a DSD from the keys
-            dsd = DataStructureDefinition.from_keys(all_keys)
+        # Retrieve the series keys, as a data frame
+        all_keys = self.series_keys(flow_id, frame=True)
 
-            # Make a ContentConstraint from *key*
-            cc = dsd.make_constraint(key)
+        # Construct a DSD from the keys
+        dsd = DataStructureDefinition.from_values(all_keys.to_dict("series"))
 
-            # Filter the keys
-            return [k for k in all_keys if k in cc]
-        else:
-            # No key is provided
-            return list(all_keys)
+        # Make a ContentConstraint from *key*; filter the keys
+        all_keys = all_keys[_mask(all_keys, dsd.make_constraint(key))]
+
+        return [
+            dsd.make_key(common.SeriesKey, dict(zip(all_keys.columns, row)))
+            for row in all_keys.itertuples(index=False)
+        ]
+
+
+class AsyncClient:
+    """Client for concurrent requests to a SDMX REST web service, using :mod:`asyncio`.
+
+    :meth:`get` and the convenience methods (:py:`.data()`, :py:`.dataflow()`, etc.)
+    have the same signatures as those of :class:`Client`, but are coroutines. Many
+    requests can be run concurrently using, for instance, :func:`asyncio.gather`.
+
+    Each request is prepared, sent, and its response parsed by a :class:`Client`,
+    including the hooks of its :attr:`~Client.source`. Because :mod:`requests` is
+    synchronous, these steps run in `executor`, so that the event loop is not blocked.
+    At most `max_connections` requests are sent to the source at the same time; parsing
+    of responses already received does not count against this limit.
+
+    To query several sources concurrently, create one AsyncClient per source.
+
+    Parameters
+    ----------
+    source : str or source.Source
+        Identifier of a data source, as for :class:`Client`.
+    max_connections : int, optional
+        Maximum number of concurrent requests to `source`. The connection pool of the
+        :class:`.Session` is sized to match.
+    executor : concurrent.futures.Executor, optional
+        Executor for preparing requests, sending them, and parsing responses. Default:
+        the default executor of the event loop.
+    session :
+        :class:`.requests.Session` instance. If not supplied, an instance of
+        :class:`.Session` is created.
+    **session_opts
+        Passed to :class:`Client`.
+
+    Example
+    -------
+    >>> async def main():
+    ...     client = sdmx.AsyncClient("ECB", max_connections=4)
+    ...     return await asyncio.gather(
+    ...         *[client.data("EXR", key=dict(CURRENCY=c)) for c in ("CHF", "USD")]
+    ...     )
+    >>> messages = asyncio.run(main())
+    """
+
+    #: :class:`Client` used to prepare requests and parse responses.
+    client: Client
+
+    def __init__(
+        self,
+        source=None,
+        *,
+        max_connections: int = 4,
+        executor: "concurrent.futures.Executor | None" = None,
+        session: "requests.Session | None" = None,
+        **session_opts,
+    ):
+        self.client = Client(source, session=session, **session_opts)
+        self.max_connections = max_connections
+        self.executor = executor
+
+        _mount_pool(self.client.session, max_connections)
+
+        # One semaphore per event loop
+        self._semaphore: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    @property
+    def source(self) -> "sdmx.source.Source":
+        """:attr:`Client.source`."""
+        return self.client.source
+
+    @property
+    def session(self) -> requests.Session:
+        """:attr:`Client.session`."""
+        return self.client.session
+
+    def __getattr__(self, name):
+        """Convenience methods."""
+        try:
+            return partial(self.get, Resource[name])
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __dir__(self):
+        """Include convenience methods in dir()."""
+        return list(super().__dir__()) + [ep.name for ep in Resource]
+
+    async def get(
+        self,
+        resource_type: str | Resource | None = None,
+        resource_id: str | None = None,
+        tofile: "os.PathLike | IO | None" = None,
+        use_cache: bool = False,
+        dry_run: bool = False,
+        revalidate: bool = False,
+        **kwargs,
+    ) -> "sdmx.message.Message | requests.PreparedRequest":
+        """Retrieve SDMX data or metadata.
+
+        See :meth:`Client.get`.
+        """
+        loop = asyncio.get_running_loop()
+        client = self.client
+
+        req, kwargs = await self._run(
+            client._prepare, resource_type, resource_id, kwargs
+        )
+        if dry_run:
+            return req
+
+        log.info(f"Request {req.url}")
+        metrics = Metrics(url=req.url)
+        metrics.mark("prepared")
+
+        cached = client._from_cache(req, use_cache, revalidate)
+        if cached is not None and not revalidate:
+            return _cache_hit(cached, metrics)
+
+        # Limit the number of concurrent requests
+        try:
+            semaphore = self._semaphore[loop]
+        except KeyError:
+            semaphore = self._semaphore[loop] = asyncio.Semaphore(self.max_connections)
+
+        async with semaphore:
+            response = await self._run(client._send, req, resource_type, metrics)
+
+        if cached is not None and response.status_code == 304:
+            return _cache_hit(cached, metrics)
+
+        msg = await self._run(
+            client._parse, response, tofile, kwargs, finish=False, metrics=metrics
+        )
+        msg = await self.source.finish_message_async(msg, self, **kwargs)
+        metrics.finished(msg)
+
+        if use_cache and req.url:
+            client.cache[request_key(req)] = msg
+
+        metrics.emit()
+        return msg
+
+    def _run(self, func, *args, **kwargs) -> asyncio.Future:
+        """Run :py:`func(*args, **kwargs)` in :attr:`executor`."""
+        return asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(func, *args, **kwargs)
+        )
+
+
+def _cache_hit(msg: "sdmx.message.Message", metrics: Metrics) -> "sdmx.message.Message":
+    """Record and emit `metrics` for `msg` returned from a cache.
+
+    :attr:`.Message.metrics` of `msg` is not changed; it describes the original
+    retrieval.
+    """
+    metrics.cache_hit = True
+    metrics.mark("finished")
+    metrics.emit()
+    return msg
+
+
+def _mask(df: pd.DataFrame, constraint) -> pd.Series:
+    """Return a boolean mask of the rows in `df` that are within `constraint`.
+
+    Each row of `df` is a key, with one column per dimension. The result is the same as
+    :py:`key in constraint` for a :class:`.ContentConstraint` with one or more
+    :class:`.CubeRegion`, but computed for all keys at once.
+    """
+    result = pd.Series(True, index=df.index)
+    for cr in constraint.data_content_region:
+        in_cr = pd.Series(True, index=df.index)
+        for dim, ms in cr.member.items():
+            in_ms = df[dim.id].isin([mv.value for mv in ms.values])
+            in_cr &= in_ms if ms.included else ~in_ms
+        result &= in_cr if cr.included else ~in_cr
+    return result
+
+
+def _pop_parameter(kwargs: dict, name: str) -> Any:
+    """Remove and return the query parameter `name` from `kwargs` or its "params".
+
+    Both the snake_case `name` and its camelCase form are recognized.
+    """
+    param = QueryParameter(name)
+    result = None
+    for d in kwargs, kwargs.get("params", {}):
+        for n in param.name, param.camelName:
+            result = d.pop(n, None) or result
+    return result
+
+
+def _has_finish_message(source: "sdmx.source.Source") -> bool:
+    """Return :obj:`True` if `source` overrides :meth:`.Source.finish_message`."""
+    func = getattr(source.finish_message, "__func__", None)
+    return func is not BaseSource.finish_message
+
+
+def _flow_dsd(msg: "sdmx.message.StructureMessage", flow_id: str):
+    """Return the DSD of the dataflow `flow_id` in `msg`."""
+    dsd = msg.dataflow[flow_id].structure
+    return msg.structure[dsd.id] if dsd.is_external_reference else dsd
+
+
+def _mount_pool(session: requests.Session, size: int) -> None:
+    """Ensure the connection pools of `session` keep at least `size` connections.
+
+    Only :class:`requests.adapters.HTTPAdapter` and :class:`.session.HTTPAdapter` are
+    replaced; other adapters (for instance, those used in testing) are left unchanged.
+    """
+    for prefix, adapter in list(session.adapters.items()):
+        if type(adapter) not in (requests.adapters.HTTPAdapter, HTTPAdapter):
+            continue
+        assert isinstance(adapter, requests.adapters.HTTPAdapter)
+        if adapter.poolmanager.connection_pool_kw["maxsize"] >= size:
+            continue
+
+        kw: dict[str, Any] = dict(pool_maxsize=size, max_retries=adapter.max_retries)
+        if isinstance(adapter, HTTPAdapter):
+            kw.update(retry=adapter.retry, rate_limit=adapter.rate_limit)
+        session.mount(prefix, type(adapter)(**kw))
 
 
 def read_url(url, **kwargs):
@@ -114,6 +114,9 @@ def compare_dataclass(left, right, opts: Options, context: str) -> bool:
 
     result = right is not None
     for f in fields(left) if result else []:
+        if not f.compare:
+            continue  # Excluded from comparison, e.g. Message.metrics
+
         l_val, r_val = getattr(left, f.name), getattr(right, f.name)
 
         if opts.visited(l_val):
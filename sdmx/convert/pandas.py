@@ -1,9 +1,9 @@
 """Convert :mod:`sdmx.message` and :mod:`.model` objects to :mod:`pandas` objects."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import InitVar, dataclass, field
-from itertools import chain, product, repeat
+from itertools import chain, islice, product, repeat
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, cast
 from warnings import warn
@@ -152,7 +152,9 @@ class ColumnSpec:
         self,
         pc: "PandasConverter | None" = None,
         ds: "common.BaseDataSet | None" = None,
+        obs: "common.BaseObservation | None" = None,
     ) -> None:
+        """If given, `obs` is used instead of the first observation in `ds`."""
         if pc is None or ds is None:
             return  # Empty/placeholder
 
@@ -167,9 +169,10 @@ class ColumnSpec:
 
         # Either use a provided DSD, or construct one by inspecting the first
         # observation
+        if obs is None:
+            obs = ds.obs[0] if len(ds.obs) else common.BaseObservation()
         dsd = self._maybe_construct_dsd(
-            pc._context.get(common.BaseDataStructureDefinition, None),
-            ds.obs[0] if len(ds.obs) else common.BaseObservation(),
+            pc._context.get(common.BaseDataStructureDefinition, None), obs
         )
 
         # Fixed columns
@@ -688,34 +691,103 @@ def convert_dataset(c: "PandasConverter", obj: common.BaseDataSet):
     c._context.setdefault(common.BaseDataStructureDefinition, obj.structured_by)
     c._columns = ColumnSpec(pc=c, ds=obj)
 
+    # - Convert observations to a pd.DataFrame.
+    # - (Possibly) convert certain columns to datetime.
+    # - (Possibly) reshape.
+    result = (
+        _convert_obs(c, obj.obs)
+        .pipe(_convert_datetime, c)
+        .pipe(_reshape, c)
+        .pipe(_to_periodindex, c)
+    )
+
+    c._context.pop(common.BaseDataSet)
+
+    return result
+
+
+def iter_dataset(
+    c: "PandasConverter",
+    obj: common.BaseDataSet,
+    chunksize: int,
+    observations: Iterable["common.BaseObservation"] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Convert :class:`~.DataSet` to :class:`pandas.DataFrame` in chunks.
+
+    Unlike :func:`convert_dataset`, this does not construct a single data frame with
+    all the observations in `obj`. Each yielded data frame has the same columns as the
+    first, and at most `chunksize` rows. No reshaping or datetime conversion is
+    performed. :mod:`.writer.csv` uses this to write SDMX-CSV.
+
+    Parameters
+    ----------
+    observations :
+        Observations to convert in place of :attr:`.DataSet.obs`, for instance from a
+        generator. `obj` still provides the structure and other metadata.
+
+    Yields
+    ------
+    pandas.DataFrame
+        with one row per observation, in the same order as `observations` or
+        :attr:`.DataSet.obs`.
+
+    Raises
+    ------
+    ValueError
+        if observations after the first chunk have attributes that do not appear in
+        the data structure definition or the first chunk.
+    """
+    c._context[common.BaseDataSet] = obj
+    c._context.setdefault(common.BaseDataStructureDefinition, obj.structured_by)
+
+    obs_iter = iter(obj.obs if observations is None else observations)
+    chunk = list(islice(obs_iter, chunksize))
+    c._columns = ColumnSpec(pc=c, ds=obj, obs=chunk[0] if chunk else None)
+
+    columns: list[str] = []
+    try:
+        while True:
+            df = _convert_obs(c, chunk)
+
+            if not columns:
+                # Column names fixed by the first chunk
+                columns = c._columns.full
+            elif extra := set(c._columns.full) - set(columns):
+                raise ValueError(
+                    f"Column(s) {sorted(extra)} not in first {chunksize} observations"
+                )
+
+            yield df.reindex(columns=columns)
+
+            chunk = list(islice(obs_iter, chunksize))
+            if not chunk:
+                break
+    finally:
+        c._context.pop(common.BaseDataSet)
+
+
+def _convert_obs(
+    c: "PandasConverter", observations: Sequence["common.BaseObservation"]
+) -> pd.DataFrame:
+    """Convert `observations` to a data frame with columns given by ``c._columns``."""
     # - Apply convert_obs() to every obs → iterable of list.
     # - Create a pd.DataFrame.
     # - Drop empty rows (not in constraint).
     # - Set column names.
     # - Assign common values for all rows.
-    # - Set column order.
     # - (Possibly) apply PandasConverter.dtype.
-    # - (Possibly) convert certain columns to datetime.
-    # - (Possibly) reshape.
-    result = (
+    return (
         pd.DataFrame(
-            map(c._columns.convert_obs, obj.obs)
-            if obj.obs
+            map(c._columns.convert_obs, observations)
+            if len(observations)
             else [[None] * len(c._columns.obs)]
         )
         .dropna(how="all")
         .set_axis(c._columns.obs, axis=1)  # NB This must come after DataFrame(map(…))
         .assign(**c._columns.assign)
         .pipe(_apply_dtype, c)
-        .pipe(_convert_datetime, c)
-        .pipe(_reshape, c)
-        .pipe(_to_periodindex, c)
     )
 
-    c._context.pop(common.BaseDataSet)
-
-    return result
-
 
 def _apply_dtype(df: "pd.DataFrame", c: "PandasConverter") -> "pd.DataFrame":
     """Apply `dtype` to 0 or more `columns`."""
@@ -32,6 +32,8 @@ from sdmx.util import direct_fields
 if TYPE_CHECKING:
     import requests
 
+    import sdmx.util.metrics
+
 log = logging.getLogger(__name__)
 
 
@@ -125,6 +127,9 @@ class Message(Comparable):
     #: :class:`requests.Response` instance for the response to the HTTP request that
     #: returned the Message. This is not part of the SDMX standard.
     response: "requests.Response | None" = None
+    #: :class:`.Metrics` recorded while retrieving and parsing the Message. This is not
+    #: part of the SDMX standard, and is ignored by :meth:`.compare`.
+    metrics: "sdmx.util.metrics.Metrics | None" = field(default=None, compare=False)
 
     def __str__(self):
         return repr(self)
@@ -371,6 +376,32 @@ class DataMessage(Message):
 
         return "\n  ".join(lines)
 
+    def merge(self, *others: "DataMessage") -> None:
+        """Add the data in `others` to this message.
+
+        Observations in each of :attr:`data` of `others` are added to the data set at
+        the same position in this message's :attr:`data`, or appended as new data sets.
+        Observations in series with equal :class:`.SeriesKey` are added to the same
+        series, in order. `others` should not be used afterwards.
+        """
+        for other in others:
+            for i, ds in enumerate(other.data):
+                if i >= len(self.data):
+                    self.data.append(ds)
+                    continue
+
+                target = self.data[i]
+                # Existing series keys, to be shared by added observations
+                keys = {sk: sk for sk in target.series}
+                for sk, observations in ds.series.items():
+                    sk = keys.setdefault(sk, sk)
+                    for obs in observations:
+                        obs.series_key = sk
+                    target.add_obs(observations, sk)
+
+                # Observations not in any series
+                target.add_obs(o for o in ds.obs if o.series_key is None)
+
     def update(self) -> None:
         """Update :attr:`.observation_dimension`.
 
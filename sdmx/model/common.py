@@ -1370,15 +1370,45 @@ class BaseDataStructureDefinition(Structure, ConstrainableArtefact):
             or of subclasses such as :class:`SeriesKey` or :class:`GroupKey`.
         """
         iter_keys = iter(keys)
-        dd = DimensionDescriptor.from_key(next(iter_keys))
+
+        # Distinct values for each dimension of the first key, in order of appearance
+        values = {
+            id: {str(kv.value): None} for id, kv in next(iter_keys).values.items()
+        }
+        columns = list(values.values())
 
         for k in iter_keys:
-            for i, (id, kv) in enumerate(k.values.items()):
-                try:
-                    dd[i].local_representation.enumerated.append(Code(id=str(kv.value)))
-                except ValueError:
-                    pass  # Item already exists
+            for column, kv in zip(columns, k.values.values()):
+                column[str(kv.value)] = None
+
+        return cls.from_values(values)
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, Iterable]):
+        """Return a new DSD with dimensions that take some `values`.
 
+        Like :meth:`from_keys`, but faster when the values of each dimension are
+        already collected, for instance in columns of a :class:`pandas.DataFrame`.
+
+        Parameters
+        ----------
+        values :
+            Mapping from dimension IDs, in order, to iterables of their values. The
+            :class:`Codelist` for each dimension contains one :class:`Code` for each
+            distinct value, in order of appearance.
+        """
+        dd = DimensionDescriptor()
+        for order, (id, dim_values) in enumerate(values.items()):
+            cl: Codelist = Codelist(id=id)
+            for value in dict.fromkeys(map(str, dim_values)):
+                cl.append(Code(id=value))
+            dd.components.append(
+                Dimension(
+                    id=id,
+                    local_representation=Representation(enumerated=cl),
+                    order=order,
+                )
+            )
         return cls(dimensions=dd)
 
     def make_key(self, key_cls, values: Mapping, extend=False, group_id=None):
@@ -1,8 +1,11 @@
+import gzip
 import io
 import logging
 import pathlib
+from collections.abc import Iterator
+from contextlib import contextmanager
 from functools import lru_cache
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, TextIO
 from warnings import warn
 
 import requests
@@ -16,6 +19,40 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+#: First bytes of gzip-compressed content.
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+@contextmanager
+def text_stream(data, encoding: str = "utf-8") -> Iterator[TextIO]:
+    """Open binary `data` as a text stream, without reading it all into memory.
+
+    Content that starts with :data:`GZIP_MAGIC` is decompressed incrementally. `data`
+    may be :class:`bytes`, a binary file-like object, or a text stream (returned as-is).
+    On exit, the wrappers are detached so that `data` itself is not closed.
+    """
+    if isinstance(data, io.TextIOBase):
+        yield data  # type: ignore [misc]
+        return
+    elif isinstance(data, bytes):
+        data = io.BytesIO(data)
+
+    # Ensure peek() is available to detect compressed content
+    buffered = data if hasattr(data, "peek") else io.BufferedReader(data)
+    binary = (
+        gzip.GzipFile(fileobj=buffered)
+        if buffered.peek(2)[:2] == GZIP_MAGIC
+        else buffered
+    )
+    # newline="" as required by the csv module
+    text = io.TextIOWrapper(binary, encoding=encoding, newline="")
+    try:
+        yield text
+    finally:
+        text.detach()
+        if buffered is not data:
+            buffered.detach()
+
 
 class BaseReader(Converter):
     """Converter of file/binary data from SDMX formats to :mod:`.model` objects."""
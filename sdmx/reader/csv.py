@@ -3,29 +3,42 @@ import logging
 import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import MutableSequence, Sequence
-from itertools import zip_longest
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterable, Iterator, MutableSequence, Sequence
+from itertools import repeat, zip_longest
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import sdmx.message
 from sdmx.convert import Converter
 from sdmx.format import list_media_types
 from sdmx.format.csv.v2 import FormatOptions
 from sdmx.model import common, v21, v30
-from sdmx.reader.base import BaseReader
+from sdmx.reader.base import BaseReader, text_stream
 
 if TYPE_CHECKING:
     from typing import TypedDict
 
+    import numpy
     import pandas
 
     class DataSetKwargs(TypedDict):
         described_by: common.BaseDataflow | None
         structured_by: common.BaseDataStructureDefinition
 
+    #: STRUCTURE, STRUCTURE_ID, and ACTION values of a row.
+    Target = tuple[str, ...]
+
 
 log = logging.getLogger(__name__)
 
+#: Mapping from values in the ACTION column to :class:`.ActionType`.
+ACTION = {
+    "A": common.ActionType.append,
+    "D": common.ActionType.delete,
+    "I": common.ActionType.information,
+    "R": common.ActionType.replace,
+}
+
 
 class Reader(BaseReader):
     """Read SDMX-CSV 2.x."""
@@ -40,7 +53,7 @@ class Reader(BaseReader):
 
     _dataflow: "common.BaseDataflow | None"
     _structure: v21.DataStructureDefinition | v30.DataStructureDefinition
-    _observations: dict[tuple[str, str, str], list["common.BaseObservation"]]
+    _observations: dict["Target", list["common.BaseObservation"]]
 
     def __init__(self):
         self.options = FormatOptions()
@@ -49,48 +62,116 @@ class Reader(BaseReader):
         self._structure = None
         self._observations = defaultdict(list)
 
-    def convert(self, data, structure=None, *, delimiter: str = ",", **kwargs):
-        """Read a message from `data`."""
-        self.options.delimiter = delimiter
+    @classmethod
+    def handles(cls, data, kwargs) -> bool:
+        """As :meth:`.BaseReader.handles`, also for :class:`.Path` like "*.csv.gz"."""
+        if isinstance(data, Path) and data.suffix.lower() == ".gz":
+            data = data.with_suffix("")
+        return super().handles(data, kwargs)
 
-        if isinstance(structure, (v21.DataflowDefinition, v30.Dataflow)):
-            self._dataflow = structure
-            self._structure = structure.structure
+    def convert(
+        self,
+        data,
+        structure=None,
+        *,
+        delimiter: str = ",",
+        engine: Literal["pandas", "python"] = "python",
+        **kwargs,
+    ):
+        """Read a message from `data`.
+
+        `data` may be gzip-compressed.
+
+        Parameters
+        ----------
+        engine : str, optional
+            "python" (default) to read `data` line by line using :meth:`iter_obs`;
+            "pandas" to read all of `data` at once using :meth:`read_frame`, then
+            process entire columns. The latter is faster for large `data`, but uses
+            more memory.
+        """
+        if engine == "pandas":
+            df = self.read_frame(data, structure, delimiter=delimiter)
+            self._observations.update(self._frame_obs(df))
+        elif engine == "python":
+            # Parse rows to observations
+            for target, obs in self.iter_obs(data, structure, delimiter=delimiter):
+                self._observations[target].append(obs)
         else:
-            self._dataflow = None
-            self._structure = structure
+            raise ValueError(f"engine={engine!r}")
 
-        # Create a CSV reader
-        lines = data.read().decode().splitlines()
-        reader = csv.reader(lines, delimiter=self.options.delimiter)
+        self.message = self._make_message()
 
-        self.inspect_header(next(reader))
+        return self.message
 
-        # Parse remaining rows to observations
-        for i, row in enumerate(reader):
-            self.handle_row(row)
+    def iter_obs(
+        self, data, structure=None, *, delimiter: str = ","
+    ) -> Iterator[tuple["Target", "common.BaseObservation"]]:
+        """Read `data` and yield observations one at a time.
 
-        # Create a data message
-        self.message = sdmx.message.DataMessage(dataflow=self._dataflow)
+        Unlike :meth:`convert`, observations are not stored on the Reader, so memory use
+        does not grow with the size of `data`.
 
-        # Create 1 data set for each of the 4 ActionType values
-        ds_kw: "DataSetKwargs" = dict(
-            described_by=self._dataflow, structured_by=self._structure
-        )
-        for (*_, action), obs in self._observations.items():
-            a = common.ActionType[
-                {"A": "append", "D": "delete", "I": "information", "R": "replace"}[
-                    action
-                ]
-            ]
+        Yields
+        ------
+        tuple
+            The first member is a tuple of values from the STRUCTURE, STRUCTURE_ID, and
+            (if any) ACTION columns. The second is the observation.
+        """
+        self._set_structure(structure, delimiter)
 
-            self.message.data.append(v30.DataSet(action=a, **ds_kw))
-            self.message.data[-1].add_obs(obs)
+        with text_stream(data) as f:
+            # Create a CSV reader
+            reader = csv.reader(f, delimiter=self.options.delimiter)
 
-        return self.message
+            self.inspect_header(next(reader))
+
+            yield from map(self._make_obs, reader)
+
+    def read_frame(
+        self, data, structure=None, *, delimiter: str = ","
+    ) -> "pandas.DataFrame":
+        """Read `data` to a :class:`pandas.DataFrame` using the :mod:`pandas` C parser.
+
+        The header is checked using :meth:`inspect_header` before the remainder of
+        `data` is read. The columns of the result have the names given in the header.
+        All values are :class:`str`; empty fields are empty strings.
+        """
+        import pandas as pd
+
+        self._set_structure(structure, delimiter)
+
+        with text_stream(data) as f:
+            header = next(csv.reader([f.readline()], delimiter=delimiter))
+            self.inspect_header(header)
+
+            return pd.read_csv(
+                f,
+                sep=delimiter,
+                header=None,
+                names=header,
+                dtype=str,
+                keep_default_na=False,
+                engine="c",
+            )
+
+    def _set_structure(self, structure, delimiter: str) -> None:
+        self.options.delimiter = delimiter
+
+        if isinstance(structure, (v21.DataflowDefinition, v30.Dataflow)):
+            self._dataflow = structure
+            self._structure = structure.structure
+        else:
+            self._dataflow = None
+            self._structure = structure
 
     def handle_row(self, row: list[str]) -> None:
         """Handle a single CSV row."""
+        target, obs = self._make_obs(row)
+        self._observations[target].append(obs)
+
+    def _make_obs(self, row: list[str]) -> tuple["Target", "common.BaseObservation"]:
+        """Convert a single CSV row to an observation."""
         obs = v30.Observation(
             dimension=v30.Key(),
             attached_attribute={"__TARGET": v30.AttributeValue(value=[])},
@@ -103,7 +184,80 @@ class Reader(BaseReader):
         # to which this observation belongs
         target = tuple(obs.attached_attribute.pop("__TARGET").value)
 
-        self._observations[target].append(obs)
+        return target, obs
+
+    def _frame_obs(
+        self, df: "pandas.DataFrame"
+    ) -> Iterator[tuple["Target", list["common.BaseObservation"]]]:
+        """Convert `df` to observations grouped by target, processing entire columns.
+
+        The columns of `df` must be in the same order as :attr:`handlers`. Unlike
+        :meth:`_make_obs`, :class:`KeyValues <.KeyValue>` are created once per distinct
+        value in each dimension column, and shared by observations. Each observation
+        has its own :class:`.Key` and :class:`.AttributeValue` instances, so these can
+        be modified without affecting other observations.
+        """
+
+        def columns(cls: type[Handler]) -> list[tuple[int, Any]]:
+            return [(i, h) for i, h in enumerate(self.handlers) if isinstance(h, cls)]
+
+        target = [df.iloc[:, i] for i, _ in columns(StoreTarget)]
+        dims = columns(KeyValue)
+        measures = columns(ObsValue)
+        attrs = columns(AttributeValue)
+        series_key = columns(SeriesKeyHandler)
+
+        for t, group in df.groupby(target, sort=False):
+            # Series keys, if any
+            sk_codes, sks = (
+                _factorize(series_key[0][1].make, group.iloc[:, series_key[0][0]])
+                if series_key
+                else ([0] * len(group), [None])
+            )
+
+            # For each series key, positions in `dims` of the dimensions it does not
+            # include. As with KeyValue.__call__(), these are decided for each row.
+            include = [
+                [
+                    j
+                    for j, (_, h) in enumerate(dims)
+                    if not sk or h.dimension.id not in sk.values
+                ]
+                for sk in sks
+            ]
+
+            keys = _keys(
+                [_factorize(h.make, group.iloc[:, i]) for i, h in dims],
+                include,
+                sk_codes,
+            )
+
+            # Values of the last measure column, if any, as with _make_obs()
+            values = (
+                group.iloc[:, measures[-1][0]].tolist()
+                if measures
+                else [None] * len(group)
+            )
+
+            # Observation-attached attributes
+            aa = [(h.attribute.id, h.make, group.iloc[:, i].tolist()) for i, h in attrs]
+
+            yield (
+                cast("Target", t),
+                [
+                    v30.Observation(
+                        series_key=sks[sk_codes[row]],
+                        dimension=keys[row],
+                        value=values[row],
+                        attached_attribute={id: make(v[row]) for id, make, v in aa},
+                    )
+                    for row in range(len(group))
+                ],
+            )
+
+    def _make_message(self) -> "sdmx.message.DataMessage":
+        """Create a data message from the stored observations."""
+        return make_message(self._dataflow, self._structure, self._observations.items())
 
     def inspect_header(self, header: list[str]) -> None:  # noqa: C901  TODO Reduce complexity from 12 → ≤10
         """Inspect the SDMX-CSV header and determine the format :class:`.Options`.
@@ -147,7 +301,7 @@ class Reader(BaseReader):
 
         if i < len(header) and header[i] == "SERIES_KEY":
             self.options.key = "series"
-            handlers[i] = SeriesKeyHandler()
+            handlers[i] = SeriesKeyHandler(self._structure)
             i += 1
 
         if i < len(header) and header[i] == "OBS_KEY":
@@ -208,28 +362,69 @@ class DataFrameConverter(Converter):
         r._structure = structure.structure
         r.inspect_header(data.columns.to_list())
 
-        # Parse remaining rows to observations
-        for _, row in data.iterrows():
-            r.handle_row(row.to_list())
+        # Convert entire columns to observations
+        r._observations.update(r._frame_obs(data))
 
-        # Create a data message
-        message = sdmx.message.DataMessage(dataflow=r._dataflow)
+        return r._make_message()
 
-        # Create 1 data set for each of the 4 ActionType values
-        ds_kw: "DataSetKwargs" = dict(
-            described_by=r._dataflow, structured_by=r._structure
-        )
-        for (*_, action), obs in r._observations.items():
-            a = common.ActionType[
-                {"A": "append", "D": "delete", "I": "information", "R": "replace"}[
-                    action
-                ]
-            ]
 
-            message.data.append(v30.DataSet(action=a, **ds_kw))
-            message.data[-1].add_obs(obs)
+def make_message(
+    dataflow: "common.BaseDataflow | None",
+    structure: "common.BaseDataStructureDefinition",
+    observations: Iterable[tuple["Target", Iterable["common.BaseObservation"]]],
+) -> "sdmx.message.DataMessage":
+    """Create a data message from `observations` grouped by target."""
+    message = sdmx.message.DataMessage(dataflow=dataflow)
+
+    # Create 1 data set for each of the 4 ActionType values
+    ds_kw: "DataSetKwargs" = dict(described_by=dataflow, structured_by=structure)
+    for (*_, action), obs in observations:
+        message.data.append(v30.DataSet(action=ACTION[action], **ds_kw))
+
+        # Group observations by series key, if any
+        series: dict["common.SeriesKey | None", list] = defaultdict(list)
+        for o in obs:
+            series[o.series_key].append(o)
+
+        for sk, sk_obs in series.items():
+            message.data[-1].add_obs(sk_obs, sk)
 
-        return message
+    return message
+
+
+def _factorize(
+    make: Callable[[Any], Any], column: "pandas.Series"
+) -> tuple["numpy.ndarray", list]:
+    """Return integer codes for `column`, and one object from `make` per distinct value.
+
+    For row ``i`` of `column`, the corresponding object is ``objects[codes[i]]``.
+    """
+    import pandas as pd
+
+    # NB use_na_sentinel=False requires pandas >= 1.5; handle missing values here
+    codes, uniques = pd.factorize(column)
+    objects = list(map(make, uniques))
+    if (na := codes == -1).any():
+        codes[na] = len(objects)
+        objects.append(make(column[na].iloc[0]))
+    return codes, objects
+
+
+def _keys(
+    dims: list[tuple["numpy.ndarray", list]],
+    include: list[list[int]],
+    which: Iterable[int],
+) -> list["common.Key"]:
+    """Return a new :class:`.Key` for each row, given results of :func:`_factorize`.
+
+    The key for row ``i`` contains values for the dimensions at positions
+    ``include[which[i]]`` in `dims`. Keys are distinct, but contain the
+    :class:`KeyValues <.KeyValue>` from `dims`.
+    """
+    rows = zip(*[codes for codes, _ in dims]) if dims else repeat(())
+    return [
+        v30.Key([dims[j][1][row[j]] for j in include[w]]) for row, w in zip(rows, which)
+    ]
 
 
 class Handler(ABC):
@@ -280,16 +475,48 @@ class StoreTarget(Handler):
         obs.attached_attribute["__TARGET"].value.append(value)
 
 
-class SeriesKeyHandler(NotHandled):
-    """ "SERIES_KEY" columns are currently not handled."""
+class SeriesKeyHandler(Handler):
+    """Handle "SERIES_KEY" columns.
+
+    Each distinct value is converted once to a :class:`.SeriesKey`, which is stored as
+    :attr:`Observation.series_key <.BaseObservation.series_key>`. The value contains
+    the values for the first dimensions of the `structure`, separated by ".".
+    """
+
+    #: Previously-created series keys.
+    cache: dict[str, "common.SeriesKey | None"]
+
+    def __init__(self, structure: "common.BaseDataStructureDefinition"):
+        self.structure = structure
+        self.cache = {}
+
+    def __call__(self, obs, value):
+        obs.series_key = self.make(value)
+
+    def make(self, value: str) -> "common.SeriesKey | None":
+        try:
+            return self.cache[value]
+        except KeyError:
+            pass
+
+        sk = None
+        if value:
+            ids = [d.id for d in self.structure.dimensions]
+            sk = self.structure.make_key(
+                common.SeriesKey, dict(zip(ids, value.split(".")))
+            )
 
-    pass
+        return self.cache.setdefault(value, sk)
 
 
-class ObsKey(NotHandled):
-    """ "OBS_KEY" columns are currently not handled."""
+class ObsKey(Handler):
+    """Handle "OBS_KEY" columns.
 
-    pass
+    Values are ignored; the same information is in the columns for each dimension.
+    """
+
+    def __call__(self, obs, value):
+        pass
 
 
 class KeyValue(Handler):
@@ -299,9 +526,12 @@ class KeyValue(Handler):
         self.dimension = dimension
 
     def __call__(self, obs, value):
-        obs.dimension.values[self.dimension.id] = v30.KeyValue(
-            id=self.dimension.id, value=value, value_for=self.dimension
-        )
+        if obs.series_key and self.dimension.id in obs.series_key.values:
+            return  # Already stored on the series key
+        obs.dimension.values[self.dimension.id] = self.make(value)
+
+    def make(self, value) -> v30.KeyValue:
+        return v30.KeyValue(id=self.dimension.id, value=value, value_for=self.dimension)
 
 
 class ObsValue(Handler):
@@ -330,9 +560,10 @@ class AttributeValue(Handler):
             log.info(f"Column {attribute.id!r}: multiple values will not be unpacked")
 
     def __call__(self, obs, value):
-        obs.attached_attribute[self.attribute.id] = v30.AttributeValue(
-            value=value, value_for=self.attribute
-        )
+        obs.attached_attribute[self.attribute.id] = self.make(value)
+
+    def make(self, value) -> v30.AttributeValue:
+        return v30.AttributeValue(value=value, value_for=self.attribute)
 
 
 class Custom(Handler):
@@ -1,8 +1,16 @@
 """SDMX-JSON v2.1 reader"""
 
+import io
 import json
 import logging
-from collections.abc import Mapping, MutableMapping
+import shutil
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
+from importlib.util import find_spec
+from operator import attrgetter
+from typing import IO, Any
 from warnings import warn
 
 from dateutil.parser import isoparse
@@ -27,6 +35,18 @@ from sdmx.reader.base import BaseReader
 
 log = logging.getLogger(__name__)
 
+#: :any:`True` if :mod:`ijson` is installed.
+HAS_IJSON = bool(find_spec("ijson"))
+
+#: Classes of keys at each level of SDMX-JSON messages.
+KEY_CLASS = {"dataSet": Key, "series": SeriesKey, "observation": Key}
+
+#: Items from :func:`_iter_items` marking the start and end of a data set.
+DS_EVENT = {"start_map": "dataSet", "end_map": "dataSetEnd"}
+
+#: Prefixes of the header and structure in SDMX-JSON 1.0 and 2.0 documents.
+META = ("header", "meta", "structure", "data.structures")
+
 
 class Reader(BaseReader):
     """Read SDMX-JSON and expose it as instances from :mod:`sdmx.model`."""
@@ -44,14 +64,21 @@ class Reader(BaseReader):
         )
         return content.startswith(cls.binary_content_startswith)
 
-    def convert(self, data, structure=None, **kwargs):  # noqa: C901  TODO reduce complexity 15 → ≤10
-        # Initialize message instance
-        msg = DataMessage()
+    def convert(self, data, structure=None, *, incremental: bool = False, **kwargs):
+        """Read a message from `data`.
 
-        dsd = self._handle_deprecated_kwarg(structure, kwargs)
-        if dsd:  # pragma: no cover
-            # Store explicit DSD, if any
-            msg.dataflow.structure = dsd
+        Parameters
+        ----------
+        incremental : bool, optional
+            If :obj:`True`, read `data` using :meth:`iter_obs`. This requires
+            :mod:`ijson`, and uses less memory for large `data`.
+        """
+        self._init_message(structure, kwargs)
+
+        if incremental:
+            for ds, obs in self._iter_obs(data):
+                ds.add_obs([obs], obs.series_key)
+            return self.msg
 
         # Read JSON
         data.default_size = -1
@@ -61,16 +88,10 @@ class Reader(BaseReader):
         # TODO handle KeyError here
         try:
             # SDMX-JSON 1.0 (SDMX 2.1)
-            elem = tree["header"]
+            header = tree["header"]
         except KeyError:
             # SDMX-JSON 2.0 (SDMX 3.0.0)
-            elem = tree["meta"]
-
-        msg.header = Header(
-            id=elem["id"],
-            prepared=isoparse(elem["prepared"]),
-            sender=_org(elem["sender"], cls=common.Agency),
-        )
+            header = tree["meta"]
 
         # pre-fetch some structures for efficient use in series and obs
         try:
@@ -80,10 +101,86 @@ class Reader(BaseReader):
             # SDMX-JSON 2.0 (SDMX 3.0.0)
             structure = tree["data"]["structures"]
 
+        self._read_meta(header, structure)
+
+        # Make a SeriesKey for Observations in this DataSet
+        ds_key = self._make_key("dataSet")
+
+        # Read DataSets
+        for ds in tree["dataSets"]:
+            self.msg.data.append(self.read_dataset(ds, ds_key))
+
+        return self.msg
+
+    def iter_obs(
+        self, data, structure=None
+    ) -> Iterator[tuple[DataSet, "common.BaseObservation"]]:
+        """Read `data` and yield observations one at a time.
+
+        This requires :mod:`ijson`. Unlike :meth:`convert`, the complete JSON document
+        is not loaded, and observations are not stored; memory use is bounded by the
+        size of the structure and of the largest single series.
+
+        The header and structure are read in a first pass over `data`, and the data sets
+        in a second pass. If `data` is not seekable, it is first copied to a temporary
+        file. Each :class:`.DataSet` is appended to :py:`msg.data`, but observations
+        are not added to it.
+
+        If the structure has series-level attributes and a data set's "series" appear
+        before its "attributes", the series are held in memory until the attributes
+        (or the end of the data set) are read.
+
+        Yields
+        ------
+        tuple
+            The data set, and one observation in that data set.
+        """
+        self._init_message(structure, {})
+        yield from self._iter_obs(data)
+
+    def _iter_obs(self, data) -> Iterator[tuple[DataSet, "common.BaseObservation"]]:
+        import ijson
+
+        with _seekable(data) as f:
+            # Read only the header and structure
+            pos = f.tell()
+            meta = _read_items(ijson.parse(f), META)
+            self._read_meta(
+                meta.get("header") or meta["meta"],
+                meta.get("structure") or meta["data.structures"],
+            )
+
+            # Read data sets
+            f.seek(pos)
+            yield from self._iter_datasets(_iter_items(ijson.parse(f, use_float=True)))
+
+    def _init_message(self, structure, kwargs) -> None:
+        # Initialize message instance
+        self.msg: DataMessage = DataMessage()
+
+        dsd = self._handle_deprecated_kwarg(structure, kwargs)
+        if dsd:  # pragma: no cover
+            # Store explicit DSD, if any
+            assert self.msg.dataflow is not None
+            self.msg.dataflow.structure = dsd
+
+    def _read_meta(self, header: MutableMapping, structure: Mapping) -> None:
+        """Read the message `header` and the `structure` used by data sets."""
+        self.msg.header = Header(
+            id=header["id"],
+            prepared=isoparse(header["prepared"]),
+            sender=_org(header["sender"], cls=common.Agency),
+        )
+        self._read_dimensions(structure["dimensions"])
+        self._read_attributes(structure["attributes"])
+
+    def _read_dimensions(self, dimensions: Mapping) -> None:
+        msg = self.msg
+
         # Read dimensions and values
-        self._dim_level = dict()
-        self._dim_values = dict()
-        for level_name, level in structure["dimensions"].items():
+        self._dim_level: dict[common.Dimension, str] = dict()
+        self._dim_values: dict[common.Dimension, list[KeyValue]] = dict()
+        for level_name, level in dimensions.items():
             for elem in level:
                 # Create the Dimension
                 d = msg.structure.dimensions.getdefault(
@@ -113,10 +210,26 @@ class Reader(BaseReader):
 
         msg.observation_dimension = dim_at_obs
 
+        # Lookup tables for _make_key(): for each level, the values of the dimensions
+        # in the order of the indices in SDMX-JSON keys; and the position of each
+        # dimension in ordered keys
+        self._level_dims = defaultdict(list)
+        for d in msg.structure.dimensions:
+            self._level_dims[self._dim_level[d]].append(self._dim_values[d])
+        self._dim_pos = {
+            d.id: i
+            for i, d in enumerate(
+                sorted(msg.structure.dimensions, key=attrgetter("order"))
+            )
+        }
+
+    def _read_attributes(self, attributes: Mapping) -> None:
+        msg = self.msg
+
         # Read attributes and values
         self._attr_level = dict()
         self._attr_values = dict()
-        for level_name, level in structure["attributes"].items():
+        for level_name, level in attributes.items():
             for attr in level:
                 # Create a DataAttribute in the DSD
                 da = msg.structure.attributes.getdefault(
@@ -150,27 +263,66 @@ class Reader(BaseReader):
                 # Record the level it appears at
                 self._attr_level[da] = level_name
 
-        self.msg = msg
+        # Lookup table for _make_attrs(): for each level, the values of the attributes
+        self._level_attrs = defaultdict(list)
+        for a in msg.structure.attributes:
+            self._level_attrs[self._attr_level[a]].append(self._attr_values[a])
 
+    def _iter_datasets(
+        self, items: Iterable[tuple[str, Any, Any]]
+    ) -> Iterator[tuple[DataSet, "common.BaseObservation"]]:
+        """Create data sets and observations from `items` of :func:`_iter_items`."""
         # Make a SeriesKey for Observations in this DataSet
         ds_key = self._make_key("dataSet")
 
-        # Read DataSets
-        for ds in tree["dataSets"]:
-            msg.data.append(self.read_dataset(ds, ds_key))
-
-        return msg
+        ds = DataSet()
+        # Data set attribute values; None until read. Series read before these, if
+        # any, are held in `pending`.
+        attrs: list | None = None
+        pending: list[tuple[str, Any]] = []
+        for kind, key, value in items:
+            if kind == "dataSet":
+                ds = DataSet()
+                self.msg.data.append(ds)
+                attrs = None
+            elif kind == "action":
+                ds.action = ActionType[value.lower()]
+            elif kind == "validFrom":
+                ds.valid_from = value
+            elif kind in ("attributes", "dataSetEnd"):
+                attrs = attrs or value or []
+                yield from self._iter_series(ds, ds_key, pending, attrs)
+                pending.clear()
+            elif kind == "series":
+                pending.append((key, value))
+                if attrs is not None or not self._level_attrs["series"]:
+                    yield from self._iter_series(ds, ds_key, pending, attrs or [])
+                    pending.clear()
+            elif kind == "observations":
+                yield ds, self._make_obs(key, value, base_key=ds_key)
+
+    def _iter_series(
+        self, ds: DataSet, ds_key, series: list[tuple[str, Any]], attrs: list
+    ) -> Iterator[tuple[DataSet, "common.BaseObservation"]]:
+        """Create observations in `series` of :meth:`_iter_datasets`."""
+        for key, value in series:
+            series_key = self._make_key("series", key, base=ds_key)
+            series_key.attrib = self._make_attrs("series", attrs)
+            for obs in self.read_obs(value, series_key):
+                yield ds, obs
 
     def read_dataset(self, root, ds_key):
+        # As in _iter_datasets(), the action is optional
+        action = root.get("action", None)
         ds = DataSet(
-            action=ActionType[root["action"].lower()],
+            action=ActionType[action.lower()] if action else None,
             valid_from=root.get("validFrom", None),
         )
 
         # Process series
         for key_values, elem in root.get("series", {}).items():
             series_key = self._make_key("series", key_values, base=ds_key)
-            series_key.attrib = self._make_attrs("series", root.get("attributes", []))
+            series_key.attrib = self._make_attrs("series", root.get("attributes") or [])
             ds.add_obs(self.read_obs(elem, series_key=series_key), series_key)
 
         # Process bare observations
@@ -179,17 +331,27 @@ class Reader(BaseReader):
         return ds
 
     def read_obs(self, root, series_key=None, base_key=None):
-        for key, elem in root.get("observations", {}).items():
-            value = elem.pop(0) if len(elem) else None
-            o = Observation(
+        observations = (root or {}).get("observations", {})
+        keys = self._make_keys("observation", list(observations), base=base_key)
+        for key, elem in zip(keys, observations.values()):
+            value, elem = _split_obs(elem)
+            yield Observation(
                 series_key=series_key,
-                dimension=self._make_key("observation", key, base=base_key),
+                dimension=key,
                 value=value,
                 attached_attribute=self._make_attrs("observation", elem),
             )
-            yield o
 
-    def _make_key(self, level, value=None, base=None):
+    def _make_obs(self, key, elem, series_key=None, base_key=None) -> Observation:
+        value, elem = _split_obs(elem)
+        return Observation(
+            series_key=series_key,
+            dimension=self._make_key("observation", key, base=base_key),
+            value=value,
+            attached_attribute=self._make_attrs("observation", elem),
+        )
+
+    def _make_key(self, level: str, value: str | None = None, base=None):
         """Convert a string observation key *value* to a Key or subclass.
 
         SDMXJSON observations have keys like '2' or '3:4', consisting of colon
@@ -199,45 +361,168 @@ class Reader(BaseReader):
         KeyValues from any *base* Key are copied, and the new values appended.
         *level* species whether a 'series' or 'observation' Key is returned.
         """
-        # Instance of the proper class
-        key = {"dataSet": Key, "series": SeriesKey, "observation": Key}[level]()
+        # KeyValues of the dimensions at the appropriate level
+        tables = self._level_dims[level]
 
-        if base:
-            key.values.update(base.values)
+        if value is None:
+            # Dimensions specified at the dataSet level have only one value, so
+            # pre-fill this
+            indices: Iterable[int] = [0] * len(tables)
+        else:
+            indices = map(int, value.split(":")) if len(value) else []
 
-        # Dimensions at the appropriate level
-        dims = [d for d in self.msg.structure.dimensions if self._dim_level[d] == level]
+        # Look up the values, then order the key
+        return self._order_key(level, [t[i] for i, t in zip(indices, tables)], base)
 
-        # Dimensions specified at the dataSet level have only one value, so
-        # pre-fill this
-        value = ":".join(["0"] * len(dims)) if value is None else value
+    def _make_keys(self, level, values: list[str], base=None) -> list:
+        """Convert many string keys `values` to Keys, as with :meth:`_make_key`.
 
-        if len(value):
-            # Iterate over key indices and the corresponding dimensions
-            for index, dim in zip(map(int, value.split(":")), dims):
-                # Look up the value and assign to the Key
-                key[dim.id] = self._dim_values[dim][index]
+        The indices in all of `values` are decoded in a single pass.
+        """
+        import numpy as np
 
-        # Order the key
-        return self.msg.structure.dimensions.order_key(key)
+        tables = self._level_dims[level]
+        if not (len(values) and len(tables)):
+            return [self._make_key(level, v, base) for v in values]
+
+        # Integer indices, with 1 row per key in `values` and 1 column per dimension
+        codes = np.array(":".join(values).split(":"), dtype=np.intp).reshape(
+            len(values), -1
+        )
+
+        # KeyValues for each dimension, for each of `values`
+        columns = [
+            list(map(t.__getitem__, c)) for t, c in zip(tables, codes.T.tolist())
+        ]
+
+        return [self._order_key(level, list(kvs), base) for kvs in zip(*columns)]
+
+    def _order_key(self, level, kvs: list[KeyValue], base=None):
+        """Return a Key or subclass for `level` with `kvs` and those of `base`.
+
+        The result is ordered according to the DSD.
+        """
+        if base:
+            kvs = list(base.values.values()) + kvs
+        kvs.sort(key=lambda kv: self._dim_pos[kv.id])
+
+        # Instance of the proper class
+        key = KEY_CLASS[level]()
+        key.values.update_fast((kv.id, kv) for kv in kvs)
+        return key
 
     def _make_attrs(self, level, values):
         """Convert integer attribute indices to an iterable of AttributeValues.
 
         'level' must be one of 'dataSet', 'series', or 'observation'.
         """
-        attrs = [
-            a for a in self.msg.structure.attributes if self._attr_level[a] == level
-        ]
         result = {}
-        for index, attr in zip(values, attrs):
+        for index, table in zip(values, self._level_attrs[level]):
             if index is None:
                 continue
-            av = self._attr_values[attr][index]
+            av = table[index]
             result[av.value_for.id] = av
         return result
 
 
+def _split_obs(elem) -> tuple[Any, list]:
+    """Split `elem` of one observation into its value and attribute indices.
+
+    `elem` is usually a list; a bare scalar or :obj:`None` is also accepted.
+    """
+    if not isinstance(elem, list):
+        return elem, []
+    return (elem[0], elem[1:]) if len(elem) else (None, [])
+
+
+@contextmanager
+def _seekable(data) -> Iterator[IO[bytes]]:
+    """Return `data` as a seekable binary file-like object."""
+    if isinstance(data, bytes):
+        yield io.BytesIO(data)
+    elif data.seekable():
+        yield data
+    else:
+        # Copy to a temporary file
+        with tempfile.TemporaryFile() as f:
+            shutil.copyfileobj(data, f)
+            f.seek(0)
+            yield f
+
+
+def _read_items(
+    events: Iterable[tuple[str, str, Any]], prefixes: Sequence[str]
+) -> dict:
+    """Build objects at any of `prefixes` from :mod:`ijson` `events`.
+
+    Other events are skipped without building any objects. Iteration stops once one
+    of the first two and one of the last two `prefixes` have been read.
+    """
+    import ijson
+
+    builders: dict[str, ijson.ObjectBuilder] = {}
+    done: set[str] = set()
+    for prefix, event, value in events:
+        if not prefix.startswith(tuple(prefixes)):
+            continue
+        p = next(p for p in prefixes if prefix == p or prefix.startswith(f"{p}."))
+        builders.setdefault(p, ijson.ObjectBuilder()).event(event, value)
+
+        if prefix == p and event in ("end_map", "end_array"):
+            done.add(p)
+            if done & set(prefixes[:2]) and done & set(prefixes[2:]):
+                break
+
+    return {p: b.value for p, b in builders.items()}
+
+
+def _iter_items(
+    events: Iterable[tuple[str, str, Any]],
+) -> Iterator[tuple[str, Any, Any]]:
+    """Convert :mod:`ijson` `events` within data sets to tuples (kind, key, value).
+
+    - ("dataSet", None, None) and ("dataSetEnd", None, None) mark the start and end of
+      a data set.
+    - ("action", None, …) and ("validFrom", None, …) give properties of the data set.
+    - ("attributes", None, […]) give attribute values of the data set.
+    - ("series", key, {…}) and ("observations", key, […]) give one series or
+      observation, respectively.
+    """
+    import ijson
+
+    builder, kind, key, target = None, "", None, ""
+    for prefix, event, value in events:
+        # Handle both SDMX-JSON 1.0 "dataSets" and 2.0 "data.dataSets"
+        prefix = prefix.removeprefix("data.")
+
+        if builder is None:
+            parts = prefix.split(".")
+            if parts[:2] != ["dataSets", "item"] or len(parts) > 3:
+                continue
+            elif len(parts) == 2:
+                if event in ("start_map", "end_map"):
+                    yield DS_EVENT[event], None, None
+                continue
+            elif parts[2] in ("series", "observations") and event == "map_key":
+                # Build the value of one series or observation
+                builder, kind, key = ijson.ObjectBuilder(), parts[2], value
+                target = f"{prefix}.{value}"
+                continue
+            elif parts[2] in ("action", "validFrom") and event == "string":
+                yield parts[2], None, value
+                continue
+            elif parts[2] != "attributes":
+                continue
+            # Build the attribute values of the data set
+            builder, kind, key, target = ijson.ObjectBuilder(), parts[2], None, prefix
+
+        builder.event(event, value)
+        if prefix == target and event not in ("start_map", "start_array", "map_key"):
+            # End of a map or array, or a scalar or null value
+            yield kind, key, builder.value
+            builder = None
+
+
 def _org(elem: MutableMapping, cls=common.Organisation) -> common.Organisation:
     try:
         elem["contact"] = list(map(_contact, elem.pop("contacts")))
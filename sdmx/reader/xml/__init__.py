@@ -1,7 +1,10 @@
+import io
 from importlib import import_module
 from itertools import chain
+from typing import IO, TYPE_CHECKING
 from warnings import warn
 
+import pandas as pd
 from lxml import etree
 
 from sdmx.format import list_media_types
@@ -9,7 +12,10 @@ from sdmx.reader.base import BaseReader
 
 from .v21 import XMLParseError
 
-__all__ = ["XMLParseError"]
+if TYPE_CHECKING:
+    from sdmx.model import common
+
+__all__ = ["XMLParseError", "read_series_keys"]
 
 
 class Reader(BaseReader):
@@ -53,3 +59,54 @@ class Reader(BaseReader):
             .Reader()
             .convert(None, **kwargs, _events=chain([(event, element)], events))
         )
+
+
+def read_series_keys(
+    data: "IO[bytes] | io.IOBase",
+    dsd: "common.BaseDataStructureDefinition | None" = None,
+) -> pd.DataFrame:
+    """Read only the series keys in SDMX-ML `data`.
+
+    Unlike :meth:`Reader.convert`, no SDMX objects are constructed. This is much faster
+    for large messages, such as responses to data queries with
+    ``detail=serieskeysonly``. Generic and structure-specific data messages in SDMX-ML
+    2.1 and 3.0 are supported.
+
+    Parameters
+    ----------
+    dsd : .BaseDataStructureDefinition, optional
+        Data structure of `data`. For structure-specific data, only the XML attributes
+        of ``<Series>`` elements that are dimensions of `dsd` are read; others, such as
+        series attributes, are ignored. If not given, every attribute without a
+        namespace is read, as :class:`.Reader` does without a DSD.
+
+    Returns
+    -------
+    pandas.DataFrame
+        with one column for each dimension, in order of appearance, and one row for
+        each series. This is the same as :py:`sdmx.to_pandas(list(ds.series))` for the
+        data set `ds` parsed from `data`.
+    """
+    ids = None if dsd is None else {d.id for d in dsd.dimensions}
+    rows = []
+    for _, elem in etree.iterparse(data, events=("end",), tag="{*}Series"):
+        if (key := elem.find("{*}SeriesKey")) is not None:
+            # Generic data: <SeriesKey><Value id="…" value="…"/>…</SeriesKey>
+            rows.append({v.attrib["id"]: v.attrib["value"] for v in key})
+        else:
+            # Structure-specific data: dimensions of `dsd`, or every attribute without a
+            # namespace
+            rows.append(
+                {
+                    k: v
+                    for k, v in elem.attrib.items()
+                    if (k in ids if ids is not None else not k.startswith("{"))
+                }
+            )
+
+        # Discard the element and any preceding siblings
+        elem.clear()
+        if (parent := elem.getparent()) is not None:
+            del parent[: parent.index(elem)]
+
+    return pd.DataFrame(rows)
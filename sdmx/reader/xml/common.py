@@ -128,8 +128,14 @@ class XMLEventReader(BaseReader):
     Reference: ClassVar[type[BaseReference]]
 
     #: Mapping from (QName, ["start", "end"]) to a function that parses the
-    #: element/event or else None (no parsing).
-    parser: ClassVar[dict[tuple[QName, str], Callable]]
+    #: element/event or else None (no parsing). This is populated by :meth:`start` and
+    #: :meth:`end` when the reader module is imported, is shared by all instances and
+    #: threads, and must not be modified while reading; use :meth:`add_parser` instead.
+    parser: ClassVar[dict[tuple[QName, str], Callable | None]]
+
+    #: Parsers for the current message: either :attr:`parser`, or a copy of it with
+    #: additions from :meth:`add_parser`.
+    _parser: dict[tuple[QName, str], Callable | None]
 
     # One-way counter for use in stacks
     _count: Iterator[int]
@@ -148,6 +154,7 @@ class XMLEventReader(BaseReader):
     def __init__(self):
         # Initialize counter
         self._count = count()
+        self._parser = self.parser
 
     # BaseReader methods
 
@@ -164,6 +171,9 @@ class XMLEventReader(BaseReader):
         # Elements to ignore when parsing finishes
         self.ignore = set()
 
+        # Discard any parsers added while reading a previous message
+        self._parser = self.parser
+
         # If calling code provided a {Metad,D}ataStructureDefinition, add it to a stack,
         # and let it be ignored when parsing finishes
         structure = self._handle_deprecated_kwarg(structure, kwargs)
@@ -187,7 +197,7 @@ class XMLEventReader(BaseReader):
             for event, element in events:
                 try:
                     # Retrieve the parsing function for this element & event
-                    func = self.parser[self.format.qname(element.tag), event]
+                    func = self._parser[self.format.qname(element.tag), event]
                 except KeyError:  # pragma: no cover
                     if QName(element.tag).namespace == "http://www.w3.org/1999/xhtml":
                         continue
@@ -229,6 +239,18 @@ class XMLEventReader(BaseReader):
 
         return cast(message.Message, self.get_single(message.Message, subclass=True))
 
+    def add_parser(self, tag: QName, event: str, func: Callable | None) -> None:
+        """Parse `event` for elements with `tag` using `func`.
+
+        Unlike :meth:`start` and :meth:`end`, this does not modify the class
+        :attr:`parser`; it affects only the message being read by this instance. The
+        table is copied on the first addition, so that lookups while reading are not
+        slowed.
+        """
+        if self._parser is self.parser:
+            self._parser = self.parser.copy()
+        self._parser[tag, event] = func
+
     @classmethod
     def start(cls, names: str, only: bool = True):
         """Decorator for a function that parses "start" events for XML elements."""
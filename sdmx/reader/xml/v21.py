@@ -173,8 +173,8 @@ def _message(reader: Reader, elem):
     existing_ns = set(reader.format.NS.values())
     for namespace in filterfalse(existing_ns.__contains__, elem.nsmap.values()):
         # Use _ds_start() and _ds_end() to handle <{namespace}DataSet> elements
-        reader.parser[QName(namespace, "DataSet"), "start"] = _ds_start
-        reader.parser[QName(namespace, "DataSet"), "end"] = _ds_end
+        reader.add_parser(QName(namespace, "DataSet"), "start", _ds_start)
+        reader.add_parser(QName(namespace, "DataSet"), "end", _ds_end)
 
     # Instantiate the message object
     return reader.class_for_tag(elem.tag)()
@@ -1471,9 +1471,10 @@ def _rv(reader: Reader, elem):
 def add_mds_events(reader: Reader, mds: common.BaseMetadataStructureDefinition):
     """Add parser events for structure-specific metadata."""
 
-    # TODO these persist after reading a particular message; avoid this
     def _add_events_for_ma(ma: common.MetadataAttribute):
-        reader.end(f":{ma.id}")(_ra)
+        tag = reader.format.qname(f":{ma.id}")
+        reader.add_parser(tag, "end", _ra)
+        reader.add_parser(tag, "start", None)
         for child in ma.child:
             _add_events_for_ma(child)
 
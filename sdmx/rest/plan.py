@@ -0,0 +1,179 @@
+"""Planning of data queries.
+
+A key is a mapping from dimension IDs to allowable values, as accepted by
+:meth:`.Client.get` and :meth:`.DataStructureDefinition.make_constraint`. The
+functions in this module rewrite one or more keys into a list of keys that select
+exactly the same data, but are each within limits on the length of the query string
+and the number of series. :func:`periods` divides a time period range into shorter
+windows.
+"""
+
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from math import prod
+
+import pandas as pd
+
+#: A key with values for each dimension given as a list.
+Key = dict[str, list[str]]
+
+
+def normalize(key: Mapping) -> Key:
+    """Return `key` with lists of values.
+
+    Values may be given as a '+'-delimited :class:`str` or an iterable of :class:`str`.
+    Duplicate values are removed, and dimensions with no values are omitted.
+    """
+    result = {}
+    for dim, values in key.items():
+        values = values.split("+") if isinstance(values, str) else values
+        if values := sorted(set(values) - {""}):
+            result[dim] = values
+    return result
+
+
+def query_length(key: Key, dims: Sequence[str]) -> int:
+    """Return the length of the query string for `key`.
+
+    This is the length of the string returned by :meth:`.CubeRegion.to_query_string`
+    for the DSD with dimensions `dims`.
+    """
+    return len(dims) - 1 + sum(len("+".join(key.get(d, []))) for d in dims)
+
+
+def n_series(key: Key) -> int:
+    """Return the number of combinations of values in `key`.
+
+    Dimensions not in `key` are not counted.
+    """
+    return prod(map(len, key.values()))
+
+
+def split(
+    key: Key,
+    dims: Sequence[str],
+    *,
+    max_length: int | None = None,
+    max_series: int | None = None,
+) -> list[Key]:
+    """Split `key` into keys within `max_length` and `max_series`.
+
+    The dimension with the most values is divided in half until each key is within
+    the limits.
+
+    Raises
+    ------
+    ValueError
+        if a key with at most one value for each dimension still exceeds the limits.
+    """
+    if (max_length is None or query_length(key, dims) <= max_length) and (
+        max_series is None or n_series(key) <= max_series
+    ):
+        return [key]
+
+    dim = max(key, key=lambda d: len(key[d]), default=None)
+    if dim is None or len(key[dim]) < 2:
+        raise ValueError(
+            f"Cannot split key {key} for max_length={max_length}, "
+            f"max_series={max_series}"
+        )
+
+    half = len(key[dim]) // 2
+    return split(
+        key | {dim: key[dim][:half]}, dims, max_length=max_length, max_series=max_series
+    ) + split(
+        key | {dim: key[dim][half:]}, dims, max_length=max_length, max_series=max_series
+    )
+
+
+def coalesce(keys: Iterable[Mapping], dims: Sequence[str]) -> list[Key]:
+    """Merge `keys` that differ in the values for only one dimension.
+
+    The result selects exactly the same data as `keys`, in fewer keys. For instance,
+    :py:`{"A": "x", "B": "1"}` and :py:`{"A": "x", "B": "2"}` are merged into
+    :py:`{"A": ["x"], "B": ["1", "2"]}`. Duplicate keys are removed. The order of the
+    first occurrence of each merged key is preserved.
+
+    Raises
+    ------
+    ValueError
+        if any of `keys` refers to a dimension not in `dims`.
+    """
+    # Tuples of (frozen) sets of values; an empty set matches any value
+    current = []
+    for key in map(normalize, keys):
+        if extra := set(key) - set(dims):
+            raise ValueError(f"Dimension(s) {sorted(extra)} not among {dims}")
+        current.append(tuple(frozenset(key.get(d, ())) for d in dims))
+
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(dims)):
+            # Group by the values of all other dimensions
+            groups: dict[tuple, set[str]] = {}
+            for k in current:
+                other = k[:i] + k[i + 1 :]
+                if not k[i] or (other in groups and not groups[other]):
+                    # Any value for dimension `i`
+                    groups[other] = set()
+                else:
+                    groups.setdefault(other, set()).update(k[i])
+
+            if len(groups) < len(current):
+                changed = True
+                current = [o[:i] + (frozenset(v),) + o[i:] for o, v in groups.items()]
+
+    return [{d: sorted(v) for d, v in zip(dims, k) if v} for k in current]
+
+
+#: Units for the `length` argument to :func:`periods`.
+PERIOD_UNITS = {"Y": "years", "M": "months", "W": "weeks", "D": "days"}
+
+
+def periods(
+    start: str, end: str | None, length: "str | pd.DateOffset"
+) -> list[tuple[str, str]]:
+    """Divide the range of time periods from `start` to `end` into windows.
+
+    Parameters
+    ----------
+    start : str
+        First time period, for instance "2000", "2000-Q1", "2000-01", or "2000-01-01".
+    end : str, optional
+        Last time period, in the same formats. The end of this period is the end of the
+        range. If not given, the current date is used.
+    length : str or pandas.DateOffset
+        Length of each window. A :class:`str` like "5Y", "6M", "2W", or "30D" gives a
+        number of years, months, weeks, or days; see :data:`PERIOD_UNITS`.
+
+    Returns
+    -------
+    list of tuple of str
+        (start, end) dates of each window, in ISO 8601 format and in order. The windows
+        are contiguous and do not overlap; the last may be shorter than `length`.
+
+    Raises
+    ------
+    ValueError
+        if any argument cannot be parsed.
+    """
+    if isinstance(length, str):
+        if match := re.fullmatch(r"(\d+)([YMWD])", length.strip().upper()):
+            n, unit = match.groups()
+            length = pd.DateOffset(**{PERIOD_UNITS[unit]: int(n)})  # type: ignore [arg-type]
+        else:
+            raise ValueError(f"Invalid length={length!r}")
+
+    first = pd.Period(start).start_time
+    last = (pd.Period(end) if end else pd.Period.now("D")).end_time.normalize()
+
+    result = []
+    while first <= last:
+        next_ = first + length
+        if next_ <= first:
+            raise ValueError(f"Invalid length={length!r}")
+        result.append((first, min(next_ - pd.Timedelta(days=1), last)))
+        first = next_
+
+    return [(a.strftime("%Y-%m-%d"), b.strftime("%Y-%m-%d")) for a, b in result]
@@ -1,13 +1,251 @@
-from io import BufferedIOBase, BufferedRandom, BytesIO
-from typing import IO, TYPE_CHECKING
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from gzip import GzipFile
+from io import BufferedIOBase, BufferedRandom, BytesIO, UnsupportedOperation
+from typing import IO, TYPE_CHECKING, ClassVar
 
 import requests
+import requests.adapters
 
 from sdmx.util.requests import HAS_REQUESTS_CACHE, CacheMixin, SessionAttrs
 
 if TYPE_CHECKING:
     import os
 
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class RetryPolicy:
+    """Policy for retrying requests that receive certain HTTP responses.
+
+    Retries are delayed by exponential backoff with “full jitter”: before retry
+    number *n* (starting from 0), wait a random time between 0 and :py:`backoff *
+    2**n` seconds, but at most :attr:`max_backoff`. If the response includes a
+    ``Retry-After`` header, the delay it gives, also at most :attr:`max_backoff`, is
+    used instead.
+
+    :class:`.Session` and :class:`.HTTPAdapter` do not retry unless given a policy.
+    """
+
+    #: Maximum number of retries for each request. 0 to disable retries.
+    total: int = 3
+
+    #: Base delay, in seconds.
+    backoff: float = 0.5
+
+    #: Maximum delay, in seconds.
+    max_backoff: float = 60.0
+
+    #: HTTP status codes of responses to retry.
+    status: frozenset[int] = frozenset({429, 502, 503, 504})
+
+    def delay(self, attempt: int, response: requests.Response) -> float:
+        """Return the delay in seconds before retry number `attempt` after `response`."""
+        if (retry_after := retry_after_seconds(response)) is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+def retry_after_seconds(response: requests.Response) -> float | None:
+    """Return the delay given by the ``Retry-After`` header of `response`, if any.
+
+    The header may contain either a number of seconds or an HTTP date.
+    """
+    value = response.headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        log.debug(f"Ignore invalid Retry-After: {value}")
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimit:
+    """Thread-safe token bucket limiting the rate of requests.
+
+    Up to `burst` requests may be sent at once; thereafter, requests are sent at most
+    at :attr:`rate` per second. The rate adapts to the responses of the web service,
+    in the manner of “additive increase, multiplicative decrease” (AIMD) congestion
+    control:
+
+    - :meth:`decrease`, on a response indicating overload (HTTP 429 or 503), reduces
+      the rate by a factor, and stops all requests through the limiter for a given
+      delay.
+    - :meth:`increase`, on any other response, raises the rate by a fixed step, up to
+      its initial value.
+
+    Because each request must :meth:`acquire` a token before it is sent, this also
+    limits the number of concurrent requests from, for instance,
+    :meth:`.Client.get_many`.
+
+    Parameters
+    ----------
+    rate : float
+        Maximum and initial rate, in requests per second.
+    burst : float, optional
+        Capacity of the bucket.
+    min_rate : float, optional
+        Minimum rate. Default: 1/16 of `rate`.
+    step : float, optional
+        Additive increase of the rate. Default: 1/10 of `rate`.
+    factor : float, optional
+        Multiplicative decrease of the rate.
+    """
+
+    # Instances shared by key and parameters; see shared()
+    _shared: ClassVar[dict[tuple, "RateLimit"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        *,
+        min_rate: float | None = None,
+        step: float | None = None,
+        factor: float = 0.5,
+    ):
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Invalid rate={rate}, burst={burst}")
+
+        self.max_rate = self.rate = rate
+        self.burst = burst
+        self.min_rate = rate / 16 if min_rate is None else min_rate
+        self.step = rate / 10 if step is None else step
+        self.factor = factor
+
+        self._tokens = burst
+        self._time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<RateLimit {self.rate:.3g}/{self.max_rate:.3g} per s>"
+
+    @classmethod
+    def shared(cls, key: str, **kwargs) -> "RateLimit":
+        """Return an instance shared by all callers with the same `key` and `kwargs`.
+
+        If there is no such instance, create one with `kwargs`. Callers with the same
+        `key` but different `kwargs` receive different instances.
+        """
+        k = (key, tuple(sorted(kwargs.items())))
+        with cls._shared_lock:
+            if k not in cls._shared:
+                cls._shared[k] = cls(**kwargs)
+            return cls._shared[k]
+
+    def acquire(self) -> float:
+        """Wait until a request may be sent.
+
+        Returns
+        -------
+        float
+            Time waited, in seconds.
+        """
+        with self._lock:
+            self._refill()
+            # Reserve a token; the balance may become negative
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate)
+
+        if wait:
+            log.debug(f"Wait {wait:.3f} s for {self!r}")
+            time.sleep(wait)
+        return wait
+
+    def increase(self) -> None:
+        """Increase :attr:`rate` by :attr:`step`, up to the maximum."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.step)
+
+    def decrease(self, delay: float = 0.0) -> None:
+        """Decrease :attr:`rate` by :attr:`factor`, and pause for `delay` seconds."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.factor)
+            self._tokens = min(self._tokens, -delay * self.rate)
+        log.info(f"Decrease to {self!r}")
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._time) * self.rate)
+        self._time = now
+
+
+class HTTPAdapter(requests.adapters.HTTPAdapter):
+    """:class:`requests.adapters.HTTPAdapter` with retries and rate limiting.
+
+    Parameters
+    ----------
+    retry : RetryPolicy, optional
+        Default: no retries.
+    rate_limit : RateLimit, optional
+        If given, each request, including any retry, waits for
+        :meth:`.RateLimit.acquire`. Responses with HTTP status 429 or 503 cause
+        :meth:`.RateLimit.decrease`; other responses :meth:`.RateLimit.increase`.
+    kwargs :
+        Passed to :class:`requests.adapters.HTTPAdapter`.
+    """
+
+    #: HTTP status codes that indicate the web service is overloaded.
+    OVERLOAD = frozenset({429, 503})
+
+    def __init__(
+        self,
+        retry: RetryPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        **kwargs,
+    ):
+        self.retry = RetryPolicy(total=0) if retry is None else retry
+        self.rate_limit = rate_limit
+        super().__init__(**kwargs)
+
+    def send(self, request, *args, **kwargs) -> requests.Response:
+        attempt = 0
+        while True:
+            if self.rate_limit:
+                self.rate_limit.acquire()
+
+            response = super().send(request, *args, **kwargs)
+
+            overload = response.status_code in self.OVERLOAD
+            retry = (
+                response.status_code in self.retry.status and attempt < self.retry.total
+            )
+            if not (overload or retry):
+                if self.rate_limit:
+                    self.rate_limit.increase()
+                return response
+
+            delay = self.retry.delay(attempt, response)
+            if self.rate_limit and overload:
+                # Pause all requests through the limiter, including the retry below
+                self.rate_limit.decrease(delay)
+                delay = 0.0
+
+            if not retry:
+                return response
+
+            log.info(f"HTTP {response.status_code} for {request.url}; retry")
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
 
 class Session(CacheMixin, requests.Session):
     """:class:`requests.Session` with optional caching.
@@ -16,10 +254,16 @@ class Session(CacheMixin, requests.Session):
     :class:`~.requests_cache.CacheMixin` and caches responses. Otherwise, it inherits
     only from the :class:`requests_cache`.
 
+    The session uses :class:`.HTTPAdapter`, so that responses with certain HTTP
+    status codes can be retried according to `retry`. By default, they are not.
+
     Parameters
     ----------
     timeout : float
         Timeout in seconds, used for every request.
+    retry : RetryPolicy or int, optional
+        Policy for retrying requests, or the maximum number of retries. Default: no
+        retries. Give, for instance, :py:`RetryPolicy()` or 3 to enable retries.
 
     Other parameters
     ----------------
@@ -47,7 +291,9 @@ class Session(CacheMixin, requests.Session):
 
     timeout: float
 
-    def __init__(self, timeout: float = 30.0, **kwargs):
+    def __init__(
+        self, timeout: float = 30.0, retry: RetryPolicy | int | None = None, **kwargs
+    ):
         # Store timeout; not an attribute of requests.Session
         self.timeout = timeout
 
@@ -71,6 +317,21 @@ class Session(CacheMixin, requests.Session):
         for name, value in attrs:
             setattr(self, name, value)
 
+        if isinstance(retry, int):
+            retry = RetryPolicy(total=retry)
+        for prefix in "http://", "https://":
+            self.mount(prefix, HTTPAdapter(retry))
+
+    def limit(self, prefix: str, rate_limit: RateLimit) -> None:
+        """Apply `rate_limit` to all requests for URLs starting with `prefix`.
+
+        The :class:`.RetryPolicy` of the adapter for `prefix` is retained.
+        """
+        adapter = self.get_adapter(prefix)
+        self.mount(
+            prefix, HTTPAdapter(getattr(adapter, "retry", None), rate_limit=rate_limit)
+        )
+
 
 class ResponseIO(BufferedIOBase):
     """Buffered wrapper for :class:`requests.Response` with optional file output.
@@ -79,21 +340,42 @@ class ResponseIO(BufferedIOBase):
     attribute, providing a file-like object from which bytes can be :meth:`read`
     incrementally.
 
+    If `stream` is :obj:`True` and the body of `response` has not yet been read (that
+    is, the request was sent with :py:`stream=True`), bytes are instead read from
+    :attr:`requests.Response.raw` as they are received, and written to `tee` as they
+    are read. At most one buffer of content is held in memory, instead of the entire
+    body. Content with a Content-Disposition file name ending in ".gz" is decompressed
+    incrementally.
+
     Parameters
     ----------
     response : :class:`requests.Response`
         HTTP response to wrap.
     tee : binary, writable :py:class:`io.BufferedIOBase`, defaults to io.BytesIO()
-        *tee* is exposed as *self.tee* and not closed explicitly.
+        *tee* is exposed as *self.tee* and not closed explicitly. If `stream` is
+        :obj:`True`, the default is :obj:`None`: content is not stored.
+    stream : bool, optional
+        Read the response body incrementally.
     """
 
-    tee: IO
+    tee: IO | None
 
-    def __init__(self, response, tee: "IO | os.PathLike | None" = None):
+    def __init__(
+        self,
+        response,
+        tee: "IO | os.PathLike | None" = None,
+        *,
+        stream: bool = False,
+    ):
         self.response = response
 
+        # Streaming source, if any
+        self._source: "GzipFile | IO | None" = None
+        self._pos = 0
+        stream = stream and response._content is False
+
         if tee is None:
-            self.tee = BytesIO()
+            self.tee = None if stream else BytesIO()
         elif isinstance(tee, (IO, BufferedRandom)):
             # If tee is a file-like object or tempfile, then use it as cache
             self.tee = tee
@@ -102,13 +384,19 @@ class ResponseIO(BufferedIOBase):
             self.tee = open(tee, "w+b")
 
         content_disposition = response.headers.get("Content-Disposition", "")
-        if content_disposition.endswith('.gz"'):
-            import gzip
+        gz = content_disposition.endswith('.gz"')
 
-            content = gzip.GzipFile(fileobj=BytesIO(response.content)).read()
+        if stream:
+            # Decode any Content-Encoding, e.g. "gzip", applied in transfer
+            response.raw.decode_content = True
+            self._source = GzipFile(fileobj=response.raw) if gz else response.raw
+            return
+        elif gz:
+            content = GzipFile(fileobj=BytesIO(response.content)).read()
         else:
             content = response.content
 
+        assert self.tee is not None
         self.tee.write(content)
         self.tee.seek(0)
 
@@ -116,5 +404,32 @@ class ResponseIO(BufferedIOBase):
         return True
 
     def read(self, size=-1):
-        """Read and return up to `size` bytes by calling ``self.tee.read()``."""
-        return self.tee.read(size)
+        """Read and return up to `size` bytes by calling ``self.tee.read()``.
+
+        If streaming, read from the response instead, and write the bytes to *tee*.
+        """
+        if self._source is None:
+            assert self.tee is not None
+            return self.tee.read(size)
+
+        data = self._source.read(-1 if size is None else size)
+        if self.tee is not None:
+            self.tee.write(data)
+        self._pos += len(data)
+        return data
+
+    read1 = read
+
+    def seekable(self):
+        return self._source is None and self.tee is not None and self.tee.seekable()
+
+    def seek(self, offset, whence=0):
+        if not self.seekable():
+            raise UnsupportedOperation("seek")
+        assert self.tee is not None
+        return self.tee.seek(offset, whence)
+
+    def tell(self):
+        if self._source is not None or self.tee is None:
+            return self._pos
+        return self.tee.tell()
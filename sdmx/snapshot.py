@@ -0,0 +1,461 @@
+"""Binary snapshots of SDMX messages.
+
+:func:`save` writes a :class:`.Message` to a directory and :func:`load` reads it back,
+much faster than parsing SDMX-ML or pickling the message. The observations of each
+:class:`DataSet <.BaseDataSet>` are stored column-wise: each dimension and attribute
+is an array of integer codes into a table of its distinct values (“dictionary
+encoding”), in NumPy's :file:`.npy` format. :func:`load` maps these arrays into memory
+and constructs :class:`Observation <.BaseObservation>` objects only when they are first
+accessed; see :class:`Observations`. All other contents of the message, including any
+structures, are pickled.
+
+A snapshot is meant for passing parsed messages between the stages of a pipeline that
+use the same version of :mod:`sdmx`; it is not an exchange format. As with
+:mod:`pickle`, only load snapshots from trusted sources.
+"""
+
+import gc
+import logging
+import os
+import pickle
+import tempfile
+from collections import UserList
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from copy import copy
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+from uuid import uuid4
+
+import numpy as np
+
+from sdmx.message import DataMessage
+from sdmx.model import common
+from sdmx.util.cache import _without_content
+
+if TYPE_CHECKING:
+    import sdmx.message
+
+log = logging.getLogger(__name__)
+
+#: Version of the snapshot format. :func:`load` raises :class:`ValueError` for
+#: snapshots written with any other version.
+FORMAT = 1
+
+#: Name of the file, in the snapshot directory, with the pickled message.
+MESSAGE = "message.pickle"
+
+
+def save(msg: "sdmx.message.Message", path: os.PathLike | str) -> None:
+    """Save `msg` as a snapshot in the directory `path`.
+
+    The directory is created if it does not exist. Any existing snapshot in it is
+    replaced; other files are not affected. The snapshot is replaced only once it is
+    completely written, so if :func:`save` is interrupted, the existing snapshot can
+    still be loaded. The body of :attr:`.Message.response`, if any, is not stored.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    existing = _files(path)
+
+    # Array files have names distinct from those of any existing snapshot
+    prefix = uuid4().hex[:8]
+    msg = copy(_without_content(msg))
+    files: list[dict[str, str]] = []
+    info = []
+    written: list[Path] = []
+    try:
+        if isinstance(msg, DataMessage):
+            data = []
+            for i, ds in enumerate(msg.data):
+                arrays, skeleton, meta = _encode_dataset(ds)
+                files.append({name: f"{prefix}-{i}-{name}.npy" for name in arrays})
+                for name, array in arrays.items():
+                    written.append(path.joinpath(files[i][name]))
+                    np.save(written[-1], array, allow_pickle=False)
+                data.append(skeleton)
+                info.append(meta)
+            msg.data = data
+
+        # Write to a temporary file in the same directory, then rename
+        fd, tmp = tempfile.mkstemp(dir=path, suffix=".tmp")
+        written.append(Path(tmp))
+        with os.fdopen(fd, "wb") as f:
+            # The format and file names, then the message and column information
+            # together, so that references from the latter to components of the
+            # structure are preserved
+            pickle.dump((FORMAT, files), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump((msg, info), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path.joinpath(MESSAGE))
+    except BaseException:
+        # Remove the files of the incomplete snapshot
+        for p in written:
+            p.unlink(missing_ok=True)
+        raise
+
+    # Delete the arrays of the replaced snapshot
+    for name in existing:
+        path.joinpath(name).unlink(missing_ok=True)
+
+
+def load(path: os.PathLike | str, mmap: bool = True) -> "sdmx.message.Message":
+    """Load a snapshot written by :func:`save` from the directory `path`.
+
+    Parameters
+    ----------
+    mmap : bool, optional
+        If :any:`True` (the default), map the arrays of codes into memory instead of
+        reading them. Pages of the files are read as observations are constructed.
+
+    Returns
+    -------
+    .Message
+        For a :class:`.DataMessage`, the :attr:`~.BaseDataSet.obs` of each data set,
+        and the values of its :attr:`~.BaseDataSet.series` and
+        :attr:`~.BaseDataSet.group`, are :class:`Observations`.
+
+    Raises
+    ------
+    ValueError
+        if the snapshot has a format other than :data:`FORMAT`.
+    """
+    path = Path(path)
+    with open(path.joinpath(MESSAGE), "rb") as f:
+        header = pickle.load(f)
+        if header[0] != FORMAT:
+            raise ValueError(
+                f"Snapshot format {header[0]} in {path}; expected {FORMAT}"
+            )
+        msg, info = pickle.load(f)
+
+    if isinstance(msg, DataMessage):
+        for ds, meta, files in zip(msg.data, info, header[1]):
+            _Loader(ds, meta, path, files, "r" if mmap else None)
+
+    return msg
+
+
+def _files(path: Path) -> list[str]:
+    """Return the names of the array files of the snapshot in `path`, if any."""
+    try:
+        with open(path.joinpath(MESSAGE), "rb") as f:
+            version, files = pickle.load(f)[:2]
+    except (OSError, EOFError, pickle.UnpicklingError, TypeError, ValueError):
+        return []
+    return [name for f in files for name in f.values()] if version == FORMAT else []
+
+
+class Observations(UserList):
+    """List of observations in a data set loaded from a snapshot.
+
+    The observations are constructed the first time that any of the observations in the
+    data set are accessed—for instance, by iterating, indexing or comparing—and then
+    behave like a :class:`list`. Observations with the same key or attribute value
+    share one :class:`.KeyValue` or :class:`.AttributeValue` object. :func:`len` does
+    not construct observations.
+
+    All observations in the data set are constructed at once, even if only those in
+    one series or group are accessed, so that each observation is one object shared by
+    :attr:`~.BaseDataSet.obs`, :attr:`~.BaseDataSet.series`, and
+    :attr:`~.BaseDataSet.group`. Memory use is then about the same as for a message
+    that is parsed. Automatic garbage collection (:mod:`gc`) is disabled while the
+    observations are constructed.
+    """
+
+    def __init__(
+        self,
+        initlist: Iterable | None = None,
+        *,
+        loader: "_Loader | None" = None,
+        which: Hashable = None,
+    ) -> None:
+        self._loader = loader
+        #: :any:`None` for all observations in the data set; else the index of a
+        #: :class:`.SeriesKey`, or a :class:`.GroupKey`.
+        self._which = which
+        # Already loaded, for instance a slice of another instance
+        self._data: list | None = None if loader else list(initlist or [])
+
+    @property
+    def data(self) -> list:  # type: ignore [override]
+        if self._data is None:
+            assert self._loader is not None
+            self._data = self._loader.get(self._which)
+        return self._data
+
+    @data.setter
+    def data(self, value: list) -> None:
+        self._data = value
+
+    @property
+    def loaded(self) -> bool:
+        """:any:`True` if the observations have been constructed."""
+        return self._data is not None
+
+    def __len__(self) -> int:
+        if self._data is None:
+            assert self._loader is not None
+            return self._loader.length(self._which)
+        return len(self._data)
+
+
+def _signature(value: common.KeyValue | common.AttributeValue) -> Hashable:
+    """Return a key that is equal for equivalent `value`."""
+    result = (value.value, id(value.value_for), getattr(value, "start_date", None))
+    try:
+        hash(result)
+    except TypeError:  # For instance, a list of attribute values
+        return id(value)
+    return result
+
+
+def _encode(
+    values: Iterable, key: Callable[[Any], Hashable] = lambda v: v
+) -> tuple[np.ndarray, list]:
+    """Dictionary-encode `values`.
+
+    Returns an array of integer codes, with -1 for :any:`None`, and a list of the
+    distinct values. Values with the same `key` are represented by the first of them.
+    """
+    index: dict[Hashable, int] = {}
+    distinct: list = []
+    codes = []
+    for value in values:
+        if value is None:
+            codes.append(-1)
+            continue
+        k = key(value)
+        if (code := index.get(k)) is None:
+            code = index[k] = len(distinct)
+            distinct.append(value)
+        codes.append(code)
+    return np.array(codes, dtype=np.int32), distinct
+
+
+def _encode_components(
+    rows: list[Mapping[str, Any]], prefix: str, arrays: dict[str, np.ndarray]
+) -> list[tuple[str, list]]:
+    """Encode key or attribute values for each component ID in `rows`.
+
+    Arrays are added to `arrays` with names starting with `prefix`. Returns a list of
+    (component ID, distinct values).
+    """
+    result: list[tuple[str, list]] = []
+    for id_ in dict.fromkeys(k for row in rows for k in row):
+        arrays[f"{prefix}{len(result)}"], distinct = _encode(
+            (row.get(id_) for row in rows), _signature
+        )
+        result.append((id_, distinct))
+    return result
+
+
+def _encode_dataset(ds: common.BaseDataSet) -> tuple[dict, common.BaseDataSet, dict]:
+    """Encode the observations in `ds`.
+
+    Returns arrays to be stored in files, a copy of `ds` without observations, and
+    information needed to construct the observations from the arrays.
+    """
+    # Series keys in `ds`, then any others referenced by observations
+    series = {id(sk): sk for sk in ds.series}
+    for obs in ds.obs:
+        if obs.series_key is not None:
+            series.setdefault(id(obs.series_key), obs.series_key)
+    series_index = {k: i for i, k in enumerate(series)}
+    obs_index = {id(o): i for i, o in enumerate(ds.obs)}
+
+    first = ds.obs[0] if len(ds.obs) else common.BaseObservation()
+    first_sk = next(iter(series.values()), None)
+    arrays = {
+        "series": np.array(
+            [series_index.get(id(o.series_key), -1) for o in ds.obs], dtype=np.int32
+        )
+    }
+    # Indices of the observations in each group
+    for j, members in enumerate(ds.group.values()):
+        arrays[f"g{j}"] = np.array([obs_index[id(o)] for o in members], dtype=np.int32)
+    meta: dict[str, Any] = dict(
+        n_obs=len(ds.obs),
+        n_series=len(series),
+        observation=type(first),
+        value_for=getattr(first, "value_for", None),
+        # Classes of series keys and of observation keys, if any
+        series_class=type(first_sk) if first_sk is not None else common.SeriesKey,
+        dimension=next(
+            (type(o.dimension) for o in ds.obs if o.dimension is not None), None
+        ),
+        described_by=(
+            getattr(first_sk, "described_by", None),
+            getattr(first.dimension, "described_by", None),
+        ),
+        series_key=_encode_components(
+            [sk.values for sk in series.values()], "sk", arrays
+        ),
+        series_attrib=_encode_components(
+            [sk.attrib for sk in series.values()], "sa", arrays
+        ),
+        series_group=[
+            [j for j, gk in enumerate(ds.group) if gk in sk.group_keys]
+            for sk in series.values()
+        ],
+        key=_encode_components(
+            [getattr(o.dimension, "values", {}) for o in ds.obs], "k", arrays
+        ),
+        attrib=_encode_components([o.attached_attribute for o in ds.obs], "a", arrays),
+    )
+
+    values = [o.value for o in ds.obs]
+    if len(values) and all(type(v) is float for v in values):
+        arrays["value"] = np.array(values, dtype=np.float64)
+        meta["value"] = None
+    else:
+        arrays["value"], distinct = _encode(values)
+        if all(type(v) is str for v in distinct):
+            # Store in a file, so it can be memory-mapped
+            arrays["value-distinct"] = np.array(distinct, dtype=str)
+            meta["value"] = "file"
+        else:
+            meta["value"] = distinct
+
+    skeleton = copy(ds)
+    skeleton.obs = []
+    skeleton.series = {}
+    skeleton.group = {gk: [] for gk in ds.group}
+
+    return arrays, skeleton, meta
+
+
+def _decode(codes: np.ndarray, distinct: list | np.ndarray) -> list:
+    """Inverse of :func:`_encode`."""
+    lookup = np.empty(len(distinct) + 1, dtype=object)
+    for i, value in enumerate(distinct):
+        lookup[i] = value
+    return lookup[codes].tolist()  # The last element, None, for code -1
+
+
+class _Loader:
+    """Construct observations in a data set from a snapshot."""
+
+    def __init__(
+        self,
+        ds: common.BaseDataSet,
+        meta: dict,
+        path: Path,
+        files: dict[str, str],
+        mmap_mode: Literal["r"] | None,
+    ) -> None:
+        self.meta = meta
+        self.group = list(ds.group)
+        self.arrays = {
+            name: np.load(path.joinpath(f), mmap_mode=mmap_mode)
+            for name, f in files.items()
+        }
+        self._obs: list | None = None
+        self._series_length: np.ndarray | None = None
+
+        # Construct series keys, which are usually few compared to observations
+        self.series_keys = []
+        dd, n = meta["described_by"][0], meta["n_series"]
+        for values, attrib, groups in zip(
+            self._rows("sk", meta["series_key"], n),
+            self._rows("sa", meta["series_attrib"], n),
+            meta["series_group"],
+        ):
+            sk = meta["series_class"](described_by=dd)
+            sk.values.update_fast(values)
+            sk.attrib.update_fast(attrib)
+            sk.group_keys.update(self.group[j] for j in groups)
+            self.series_keys.append(sk)
+
+        ds.obs = Observations(loader=self)  # type: ignore [assignment]
+        ds.series.update_fast(
+            (sk, Observations(loader=self, which=j))
+            for j, sk in enumerate(self.series_keys)
+        )
+        ds.group.update_fast(
+            (gk, Observations(loader=self, which=gk)) for gk in self.group
+        )
+
+    def _rows(self, prefix: str, columns: list[tuple[str, list]], n: int) -> list[dict]:
+        """Return `n` dicts of component values from the arrays for `prefix`."""
+        ids = [id_ for id_, _ in columns]
+        decoded = [
+            _decode(self.arrays[f"{prefix}{j}"], distinct)
+            for j, (_, distinct) in enumerate(columns)
+        ]
+        return [
+            {k: v for k, v in zip(ids, row) if v is not None}
+            for row in (zip(*decoded) if decoded else [()] * n)
+        ]
+
+    def length(self, which: Hashable) -> int:
+        if which is None:
+            return self.meta["n_obs"]
+        elif isinstance(which, int):
+            if self._series_length is None:
+                codes = np.asarray(self.arrays["series"])
+                self._series_length = np.bincount(
+                    codes[codes >= 0], minlength=len(self.series_keys)
+                )
+            return int(self._series_length[which])
+        return len(self.arrays[f"g{self.group.index(which)}"])
+
+    def get(self, which: Hashable) -> list:
+        if self._obs is None:
+            # Avoid repeated, futile garbage collection while constructing many objects
+            enabled = gc.isenabled()
+            gc.disable()
+            try:
+                self._construct()
+            finally:
+                if enabled:
+                    gc.enable()
+        assert self._obs is not None
+        if which is None:
+            return self._obs
+        return self._members[which]
+
+    def _construct(self) -> None:
+        """Construct all observations, and the lists for series and groups."""
+        meta = self.meta
+        obs_type, value_for = meta["observation"], meta["value_for"]
+        key_type, dd = meta["dimension"], meta["described_by"][1]
+
+        value = self.arrays["value"]
+        if meta["value"] is None:
+            values = value.tolist()
+        else:
+            values = _decode(
+                value,
+                self.arrays["value-distinct"]
+                if meta["value"] == "file"
+                else meta["value"],
+            )
+        series_keys = _decode(self.arrays["series"], self.series_keys)
+
+        self._obs = []
+        self._members: dict[Hashable, list] = {gk: [] for gk in self.group}
+        self._members.update((i, []) for i in range(len(self.series_keys)))
+        for sk, key, attrib, v in zip(
+            series_keys,
+            self._rows("k", meta["key"], meta["n_obs"]),
+            self._rows("a", meta["attrib"], meta["n_obs"]),
+            values,
+        ):
+            if key_type:
+                dimension = key_type(described_by=dd)
+                dimension.values.update_fast(key)
+            else:
+                dimension = None
+            obs = obs_type(series_key=sk, dimension=dimension, value=v)
+            obs.attached_attribute.update_fast(attrib)
+            if value_for is not None:
+                obs.value_for = value_for
+            self._obs.append(obs)
+
+        for i, obs in zip(np.asarray(self.arrays["series"]).tolist(), self._obs):
+            if i >= 0:
+                self._members[i].append(obs)
+
+        for j, gk in enumerate(self.group):
+            for i in np.asarray(self.arrays[f"g{j}"]).tolist():
+                self._obs[i].group_keys.add(gk)
+                self._members[gk].append(self._obs[i])
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from importlib import import_module
 from io import IOBase
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from requests import Response
 
@@ -59,6 +59,7 @@ class Source:
     .. autosummary::
        handle_response
        finish_message
+       finish_message_async
        modify_request_args
     """
 
@@ -93,6 +94,24 @@ class Source:
     #:   specific data messages.
     supports: dict[str | Resource, bool] = field(default_factory=dict)
 
+    #: Maximum length of a query URL. Data queries with :class:`dict` keys that would
+    #: be longer are split into several queries. See :mod:`.rest.plan`.
+    max_url_length: int | None = None
+
+    #: Maximum number of series (combinations of key values) in one data query. Data
+    #: queries with :class:`dict` keys that select more are split.
+    max_series: int | None = None
+
+    #: Keyword arguments to :class:`.session.RateLimit`, for instance
+    #: :py:`{"rate": 0.5, "burst": 10}`. If given, :class:`.Client` applies a rate
+    #: limit to requests to :attr:`url`, shared by all Clients for sources on the same
+    #: host with the same `rate_limit`. Default: no limit.
+    rate_limit: dict[str, float] | None = None
+
+    #: Keyword arguments to :meth:`.Client.get` that are passed to
+    #: :meth:`finish_message`, but not used to build the query URL.
+    finish_message_args: ClassVar[tuple[str, ...]] = ()
+
     def __post_init__(self):
         # Sanity check: _id attribute of a subclass matches the loaded ID.
         assert getattr(self, "_id", self.id) == self.id
@@ -167,6 +186,17 @@ class Source:
         """
         return message
 
+    async def finish_message_async(self, message, client, **kwargs):
+        """Postprocess retrieved message, without blocking.
+
+        This hook is called by :meth:`.AsyncClient.get` instead of
+        :meth:`finish_message`, with `client` being the :class:`.AsyncClient`. The
+        default implementation runs :meth:`finish_message` in the executor of `client`.
+
+        See :meth:`.estat.Source.finish_message_async` for an example implementation.
+        """
+        return await client._run(self.finish_message, message, client.client, **kwargs)
+
     def modify_request_args(self, kwargs):
         """Modify arguments used to build query URL.
 
@@ -175,7 +205,9 @@ class Source:
 
         The default implementation handles requests for 'structure-specific data' by
         adding an HTTP 'Accepts:' header when a 'dsd' is supplied as one of the
-        `kwargs`.
+        `kwargs`, and the source :attr:`supports` structure-specific data. For data
+        queries, :class:`.Client` supplies the `dsd` automatically if it is known; see
+        :meth:`.Client.get`.
 
         See :meth:`.sgr.Source.modify_request_args` for an example override.
 
@@ -183,7 +215,10 @@ class Source:
         -------
         None
         """
-        if self.data_content_type is DataContentType.XML:
+        if (
+            self.data_content_type is DataContentType.XML
+            and self.supports["structure-specific data"]
+        ):
             dsd = kwargs.get("dsd", None)
             if isinstance(dsd, DataStructureDefinition):
                 kwargs.setdefault("headers", {})
@@ -1,5 +1,9 @@
+import asyncio
+import io
 import logging
-from tempfile import NamedTemporaryFile
+import struct
+import zlib
+from collections.abc import Iterator
 from time import sleep
 from urllib.parse import urlparse
 from zipfile import ZipFile
@@ -70,6 +74,8 @@ class Source(BaseSource):
 
     _id = "ESTAT"
 
+    finish_message_args = ("get_footer_url",)
+
     def modify_request_args(self, kwargs):
         """Modify arguments used to build query URL.
 
@@ -95,61 +101,176 @@ class Source(BaseSource):
         ----------
         get_footer_url : (int, int)
             Tuple of the form (`seconds`, `attempts`), controlling the interval
-            between attempts to retrieve the data from the URL, and the
-            maximum number of attempts to make.
-        """
-        # Check the message footer for a text element that is a valid URL
-        url = None
-        for text in getattr(message.footer, "text", []):
-            if urlparse(str(text)).scheme:
-                url = str(text)
-                break
+            before the first attempt to retrieve the data from the URL, and the
+            maximum number of attempts to make. The interval doubles after each
+            attempt that finds the data is not yet available (HTTP 404). With the
+            default (30, 3), the total wait is up to 30 + 60 + 120 = 210 seconds.
 
+        See also
+        --------
+        finish_message_async
+        """
+        url = footer_url(message)
         if not url:
             return message
 
-        # Unpack arguments
-        wait_seconds, attempts = get_footer_url
+        for delay in backoff(*get_footer_url):
+            sleep(delay)
+            try:
+                # The ZIP response is handled by the handle_response() hook below
+                return request.get(url=url)
+            except requests.HTTPError as e:
+                if not_ready(e):
+                    continue
+                raise
+        raise RuntimeError("Maximum attempts exceeded")
+
+    async def finish_message_async(
+        self, message, client, get_footer_url=(30, 3), **kwargs
+    ):
+        """Handle the initial response, without blocking.
 
-        # Create a temporary file to store the ZIP response
-        ntf = NamedTemporaryFile(prefix="sdmx-")
-        # Make a limited number of attempts to retrieve the file
-        for a in range(attempts):
-            sleep(wait_seconds)
+        The same as :meth:`finish_message`, except that polling uses
+        :func:`asyncio.sleep` and the `client`, an :class:`.AsyncClient`. Many deferred
+        responses can thus be polled concurrently from one thread.
+        """
+        url = footer_url(message)
+        if not url:
+            return message
+
+        for delay in backoff(*get_footer_url):
+            await asyncio.sleep(delay)
             try:
-                # This line succeeds if the file exists; the ZIP response is stored to
-                # ntf, and then used by the handle_response() hook below
-                return request.get(url=url, tofile=ntf.file)
-            except requests.HTTPError:
+                return await client.get(url=url)
+            except requests.HTTPError as e:
+                if not_ready(e):
+                    continue
                 raise
-        ntf.close()
         raise RuntimeError("Maximum attempts exceeded")
 
     def handle_response(self, response, content):
         """Handle the polled response.
 
-        The request for the indicated ZIP file URL returns an octet-stream;
-        this handler saves it, opens it, and returns the content of the single
-        contained XML file.
+        The request for the indicated ZIP file URL returns an octet-stream. This
+        handler returns the content of the single XML file it contains, decompressed
+        as it is read.
+
+        If the response is streamed (:py:`Client.get(..., stream=True)`), the archive
+        member is decompressed as the response is received; see
+        :class:`ZipMemberIO`. Otherwise, the archive is opened from the response
+        content already in memory.
         """
 
         if response.headers["content-type"] != "application/octet-stream":
             return response, content
 
-        # Read all the input, forcing it to be copied to
-        # content.tee_filename
-        while True:
-            if len(content.read()) == 0:
-                break
+        # Set the new content type
+        response.headers["content-type"] = "application/xml"
+
+        if not content.seekable():
+            return response, io.BufferedReader(ZipMemberIO(content))
 
         # Open the zip archive
-        with ZipFile(content.tee, mode="r") as zf:
-            # The archive should contain only one file
-            infolist = zf.infolist()
-            assert len(infolist) == 1
+        zf = ZipFile(content, mode="r")
+        # The archive should contain only one file
+        infolist = zf.infolist()
+        if len(infolist) != 1:
+            raise ValueError(
+                f"ZIP archive from {response.url} contains {len(infolist)} files; "
+                "expected 1"
+            )
+
+        # Use the unzipped archive member as the response content
+        return response, zf.open(infolist[0])
+
+
+def footer_url(message) -> str | None:
+    """Return a URL appearing in the footer text of `message`, if any."""
+    for text in getattr(message.footer, "text", []):
+        if urlparse(str(text)).scheme:
+            return str(text)
+    return None
+
+
+def backoff(seconds: float, attempts: int) -> Iterator[float]:
+    """Yield `attempts` delays, starting from `seconds` and doubling each time."""
+    for a in range(attempts):
+        yield seconds * 2**a
+
 
-            # Set the new content type
-            response.headers["content-type"] = "application/xml"
+def not_ready(exc: requests.HTTPError) -> bool:
+    """Return :obj:`True` if `exc` indicates the file at a footer URL is not ready."""
+    ready = getattr(exc.response, "status_code", None) != 404
+    if not ready:
+        log.info(f"Not yet available: {exc.request.url}")
+    return not ready
 
-            # Use the unzipped archive member as the response content
-            return response, zf.open(infolist[0])
+
+class ZipMemberIO(io.RawIOBase):
+    """Decompress the first member of a ZIP archive, reading sequentially.
+
+    Unlike :class:`zipfile.ZipFile`, this does not need the central directory at the
+    end of the archive, so `source` need not be seekable, and the member is
+    decompressed as `source` is read. Only members that are stored or compressed with
+    DEFLATE are supported.
+    """
+
+    #: Size of chunks read from `source`.
+    chunk_size = 2**16
+
+    def __init__(self, source):
+        self._source = source
+
+        # Local file header; see the ZIP "APPNOTE", section 4.3.7
+        header = self._read_exact(30)
+        sig, _, flags, method, _, _, _, size, _, n, m = struct.unpack(
+            "<IHHHHHIIIHH", header
+        )
+        if sig != 0x04034B50:
+            raise ValueError("Not a ZIP archive")
+        self._read_exact(n + m)  # File name and extra field
+
+        if method == 8:
+            self._inflate: "zlib._Decompress | None" = zlib.decompressobj(-15)
+            self._remaining = -1
+        elif method == 0 and not flags & 0x08:
+            self._inflate = None
+            self._remaining = size
+        else:
+            raise NotImplementedError(f"ZIP member with method={method}, {flags=}")
+
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer and not self._eof:
+            self._fill()
+
+        n = min(len(b), len(self._buffer))
+        b[:n], self._buffer = self._buffer[:n], self._buffer[n:]
+        return n
+
+    @property
+    def _eof(self) -> bool:
+        return self._remaining == 0 or bool(self._inflate and self._inflate.eof)
+
+    def _fill(self) -> None:
+        if self._inflate is None:
+            data = self._source.read(min(self.chunk_size, self._remaining))
+            self._remaining -= len(data)
+            self._buffer = data
+        else:
+            data = self._inflate.unconsumed_tail or self._source.read(self.chunk_size)
+            self._buffer = self._inflate.decompress(data, self.chunk_size)
+        if not data:
+            raise EOFError("ZIP member is truncated")
+
+    def _read_exact(self, n: int) -> bytes:
+        result = b""
+        while len(result) < n:
+            if not (data := self._source.read(n - len(result))):
+                raise ValueError("Not a ZIP archive")
+            result += data
+        return result
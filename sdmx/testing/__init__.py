@@ -28,6 +28,9 @@ if TYPE_CHECKING:
     import pytest
     from requests import PreparedRequest
 
+    import sdmx
+    from sdmx.message import StructureMessage
+
 log = logging.getLogger(__name__)
 
 # Pytest stash keys
@@ -241,6 +244,76 @@ class CompareTests:
             raise
 
 
+#: SDMX-ML data messages with the same three series keys and no observations, in
+#: generic and structure-specific formats.
+SERIES_KEYS = {
+    "generic": """<mes:GenericData
+  xmlns:mes="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message"
+  xmlns:com="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/common"
+  xmlns:gen="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic">
+  <mes:Header>
+    <mes:ID>ID</mes:ID>
+    <mes:Test>false</mes:Test>
+    <mes:Prepared>2026-01-01T00:00:00</mes:Prepared>
+    <mes:Sender id="TEST"/>
+    <mes:Structure structureID="DSD" dimensionAtObservation="TIME_PERIOD">
+      <com:Structure><Ref agencyID="TEST" id="DSD" version="1.0"/></com:Structure>
+    </mes:Structure>
+  </mes:Header>
+  <mes:DataSet structureRef="DSD">
+    <gen:Series><gen:SeriesKey>
+      <gen:Value id="A" value="a1"/><gen:Value id="B" value="b1"/>
+    </gen:SeriesKey></gen:Series>
+    <gen:Series><gen:SeriesKey>
+      <gen:Value id="A" value="a1"/><gen:Value id="B" value="b2"/>
+    </gen:SeriesKey></gen:Series>
+    <gen:Series><gen:SeriesKey>
+      <gen:Value id="A" value="a2"/><gen:Value id="B" value="b1"/>
+    </gen:SeriesKey></gen:Series>
+  </mes:DataSet>
+</mes:GenericData>""",
+    "structure-specific": """<mes:StructureSpecificData
+  xmlns:mes="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message"
+  xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+  xmlns:ss="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/structurespecific"
+  xmlns:ns1="urn:sdmx:org.sdmx.infomodel.datastructure.DataStructure=TEST:DSD(1.0)">
+  <mes:DataSet ss:structureRef="DSD" xsi:type="ns1:DataSetType">
+    <Series A="a1" B="b1"/>
+    <Series A="a1" B="b2"/>
+    <Series xsi:type="ns1:SeriesType" A="a2" B="b1"/>
+  </mes:DataSet>
+</mes:StructureSpecificData>""",
+}
+
+
+def sized_message(size: int) -> "StructureMessage":
+    """Return an empty message with a response body of `size` bytes."""
+    import requests
+
+    from sdmx.message import StructureMessage
+
+    response = requests.Response()
+    response._content = size * b" "
+    return StructureMessage(response=response)
+
+
+def structure_message() -> "StructureMessage":
+    """Return a message with a dataflow "FLOW" and data structure "DSD"."""
+    from sdmx.message import StructureMessage
+    from sdmx.model import common, v21
+
+    a = common.Agency(id="TEST")
+    dsd = v21.DataStructureDefinition(id="DSD", maintainer=a, version="1.0")
+    for id in "DIM_1", "DIM_2":
+        dsd.dimensions.getdefault(id)
+    dfd = v21.DataflowDefinition(id="FLOW", maintainer=a, version="1.0", structure=dsd)
+
+    result = StructureMessage()
+    result.add(dsd)
+    result.add(dfd)
+    return result
+
+
 class MessageTest:
     """Base class for tests of specific specimen files."""
 
@@ -306,6 +379,21 @@ def mock_gh_api() -> Iterator[responses.RequestsMock]:
     yield mock
 
 
+@pytest.fixture
+def mock_client(
+    testsource: str,
+) -> Iterator[tuple["sdmx.Client", responses.RequestsMock]]:
+    """Fixture: a :class:`.Client` for :func:`testsource`, and a mock of its responses.
+
+    Requests are answered only by responses added to the
+    :class:`responses.RequestsMock`, all of which must be used by the test.
+    """
+    import sdmx
+
+    with responses.RequestsMock() as mock:
+        yield sdmx.Client(testsource), mock
+
+
 @pytest.fixture(scope="session")
 def session_with_pytest_cache(pytestconfig):
     """Fixture:  A :class:`.Session` that caches within :file:`.pytest_cache`.
@@ -375,7 +375,21 @@ class TestDataStructureDefinition:
         # from_keys()
         key1 = Key(foo=1, bar=2, baz=3)
         key2 = Key(foo=4, bar=5, baz=6)
-        DataStructureDefinition.from_keys([key1, key2])
+        key3 = Key(foo=1, bar=5, baz=7)
+        dsd = DataStructureDefinition.from_keys([key1, key2, key3])
+
+        def codes(dsd) -> dict[str, list[str]]:
+            return {
+                d.id: list(d.local_representation.enumerated.items)
+                for d in dsd.dimensions
+            }
+
+        expected = dict(foo=["1", "4"], bar=["2", "5"], baz=["3", "6", "7"])
+        assert expected == codes(dsd)
+
+        # from_values() gives the same result
+        values = dict(foo=[1, 4, 1], bar=[2, 5, 5], baz=[3, 6, 7])
+        assert expected == codes(DataStructureDefinition.from_values(values))
 
     @pytest.fixture
     def dsd(self) -> DataStructureDefinition:
@@ -1,5 +1,7 @@
+import gzip
 from functools import lru_cache
 from io import BytesIO, StringIO
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -56,7 +58,152 @@ dataflow,ESTAT:NA_MAIN(1.6.0),I,A,B,2014-02,10.8,Y,"Normal, special and other va
         )
 
 
+#: Equivalent to the content of v21/csv/example-01.csv
+CSV_01 = """STRUCTURE,STRUCTURE_ID,ACTION,DIM_1,DIM_2,DIM_3,OBS_VALUE,ATTR_2,ATTR_3,ATTR_1,UPDATED
+dataflow,ESTAT:NA_MAIN(1.6.0),I,A,B,2014-01,12.4,Y,"Normal, special and other values",N,2021-01-22T13:15:41Z
+dataflow,ESTAT:NA_MAIN(1.6.0),I,A,B,2014-02,10.8,Y,"Normal, special and other values",Y,2021-01-22T13:15:41Z
+dataflow,ESTAT:NA_MAIN(1.6.0),D,A,B,2014-03,,,,,
+"""
+
+
 class TestReader:
+    @pytest.mark.parametrize("engine", ("pandas", "python"))
+    @pytest.mark.parametrize(
+        "data",
+        (
+            lambda: BytesIO(CSV_01.encode()),
+            lambda: BytesIO(gzip.compress(CSV_01.encode())),
+            lambda: CSV_01.encode(),
+            lambda: StringIO(CSV_01),
+        ),
+        ids=("bytesio", "gzip", "bytes", "str"),
+    )
+    def test_convert(self, data, engine) -> None:
+        """:meth:`.Reader.convert` handles binary, compressed, and text `data`."""
+        result = Reader().convert(data(), structure=get_dfd(), engine=engine)
+
+        # 2 data sets, for 2 distinct values in the ACTION column
+        assert [2, 1] == list(map(len, result.data))
+        assert [common.ActionType.information, common.ActionType.delete] == [
+            ds.action for ds in result.data
+        ]
+        # Values containing the delimiter are parsed correctly
+        assert (
+            "Normal, special and other values"
+            == result.data[0].obs[0].attached_attribute["ATTR_3"].value
+        )
+
+    def test_convert_engine(self) -> None:
+        """Both engines give the same observations."""
+        r0, r1 = Reader(), Reader()
+        data = CSV_01.encode()
+        m0 = r0.convert(data, structure=get_dfd(), engine="python")
+        m1 = r1.convert(data, structure=get_dfd(), engine="pandas")
+
+        for ds0, ds1 in zip(m0.data, m1.data):
+            for o0, o1 in zip(ds0.obs, ds1.obs):
+                assert o0.dimension == o1.dimension
+                assert o0.value == o1.value
+                assert o0.attached_attribute == o1.attached_attribute
+
+        with pytest.raises(ValueError, match="engine='foo'"):
+            Reader().convert(
+                data,
+                structure=get_dfd(),
+                engine="foo",  # type: ignore [arg-type]
+            )
+
+    def test_convert_engine_series_key(self) -> None:
+        """Both engines give the same observations, with and without series keys."""
+        data = b"""STRUCTURE,STRUCTURE_ID,ACTION,SERIES_KEY,DIM_1,DIM_2,DIM_3,OBS_VALUE
+dataflow,ESTAT:NA_MAIN(1.6.0),I,A.B,A,B,2014-01,1.0
+dataflow,ESTAT:NA_MAIN(1.6.0),I,,A,C,2014-01,2.0
+dataflow,ESTAT:NA_MAIN(1.6.0),I,A.B,A,B,2014-02,3.0
+"""
+        m0, m1 = (
+            Reader().convert(data, structure=get_dfd(), engine=e)
+            for e in ("python", "pandas")
+        )
+
+        for o0, o1 in zip(m0.data[0].obs, m1.data[0].obs, strict=True):
+            assert o0.series_key == o1.series_key
+            assert o0.dimension == o1.dimension
+            assert o0.key == o1.key
+
+        # Row without a series key keeps all its dimension values
+        (o,) = [o for o in m1.data[0].obs if o.series_key is None]
+        assert o.dimension
+        assert ("A", "C", "2014-01") == o.dimension.get_values()
+
+    @pytest.mark.parametrize("engine", ("pandas", "python"))
+    def test_convert_distinct(self, engine) -> None:
+        """Modifying one observation does not affect others."""
+        data = b"""STRUCTURE,STRUCTURE_ID,ACTION,SERIES_KEY,DIM_1,DIM_2,DIM_3,OBS_VALUE,ATTR_2
+dataflow,ESTAT:NA_MAIN(1.6.0),I,A.B,A,B,2014-01,1.0,Y
+dataflow,ESTAT:NA_MAIN(1.6.0),I,A.C,A,C,2014-01,2.0,Y
+"""
+        o0, o1 = Reader().convert(data, structure=get_dfd(), engine=engine).data[0].obs
+        assert o0.dimension is not None and o1.dimension is not None
+
+        # Same dimension and attribute values, in distinct objects
+        assert o0.dimension == o1.dimension
+        del o0.dimension.values["DIM_3"]
+        o0.attached_attribute["ATTR_2"].value = "N"
+
+        assert "2014-01" == o1.dimension["DIM_3"].value
+        assert "Y" == o1.attached_attribute["ATTR_2"].value
+
+    def test_convert_stream_not_closed(self) -> None:
+        data = BytesIO(gzip.compress(CSV_01.encode()))
+        Reader().convert(data, structure=get_dfd())
+        assert not data.closed
+
+    @pytest.mark.parametrize("engine", ("pandas", "python"))
+    def test_convert_series_key(self, caplog, engine) -> None:
+        """Observations are grouped in series using the SERIES_KEY column."""
+        data = b"""STRUCTURE,STRUCTURE_ID,ACTION,SERIES_KEY,OBS_KEY,DIM_1,DIM_2,DIM_3,OBS_VALUE
+dataflow,ESTAT:NA_MAIN(1.6.0),I,A.B,A.B.2014-01,A,B,2014-01,1.0
+dataflow,ESTAT:NA_MAIN(1.6.0),I,A.C,A.C.2014-01,A,C,2014-01,2.0
+dataflow,ESTAT:NA_MAIN(1.6.0),I,A.B,A.B.2014-02,A,B,2014-02,3.0
+"""
+        r = Reader()
+        result = r.convert(data, structure=get_dfd(), engine=engine)
+
+        assert "both" == r.options.key
+        ds = result.data[0]
+        assert 3 == len(ds)
+        assert [2, 1] == list(map(len, ds.series.values()))
+
+        sk0, sk1 = ds.series
+        assert "A" == sk0["DIM_1"].value and "B" == sk0["DIM_2"].value
+        assert "C" == sk1["DIM_2"].value
+
+        # One SeriesKey instance is shared by observations in the same series
+        o0, o1 = ds.series[sk0]
+        assert o0.series_key is o1.series_key is sk0
+        # Observation dimension contains only the dimension not in the series key
+        assert o1.dimension and ["DIM_3"] == list(o1.dimension.values)
+        assert ("A", "B", "2014-02") == o1.key.get_values()
+
+        # Not logged per row
+        assert "Not handled" not in caplog.text
+
+    def test_handles(self) -> None:
+        assert Reader.handles(Path("foo.csv.gz"), {})
+        assert not Reader.handles(Path("foo.xml.gz"), {})
+
+    def test_iter_obs(self) -> None:
+        """:meth:`.Reader.iter_obs` yields observations without storing them."""
+        r = Reader()
+        result = r.iter_obs(BytesIO(CSV_01.encode()), structure=get_dfd())
+
+        target, obs = next(result)
+        assert ("dataflow", "ESTAT:NA_MAIN(1.6.0)", "I") == target
+        assert obs.dimension and "2014-01" == obs.dimension["DIM_3"].value
+
+        assert 2 == len(list(result))
+        assert 0 == len(r._observations)
+
     @pytest.mark.parametrize(
         "mt, expected",
         [
@@ -80,6 +227,17 @@ class TestReader:
         with pytest.raises(ValueError, match=f"Invalid SDMX-CSV 2.0.0: {exc_text}"):
             Reader().convert(BytesIO(content))
 
+    def test_read_frame(self) -> None:
+        result = Reader().read_frame(
+            BytesIO(gzip.compress(CSV_01.encode())), structure=get_dfd()
+        )
+
+        assert (3, 11) == result.shape
+        assert "DIM_1" == result.columns[3]
+        # Values are not converted; empty fields are empty strings
+        assert "12.4" == result.loc[0, "OBS_VALUE"]
+        assert "" == result.loc[2, "OBS_VALUE"]
+
     @pytest.mark.parametrize("value, expected", [(".csv", True), (".xlsx", False)])
     def test_supports_suffix(self, value, expected) -> None:
         with pytest.warns(DeprecationWarning, match="use Converter.handles"):
@@ -140,3 +298,14 @@ def test_read_specimen(path) -> None:
     #         pass
 
     del result
+
+
+def test_factorize() -> None:
+    """Missing values get their own code, as with use_na_sentinel=False."""
+    from sdmx.reader.csv import _factorize
+
+    column = pd.Series(["a", None, "b", "a", None], index=range(5, 10))
+    codes, objects = _factorize(lambda v: v, column)
+
+    assert [0, 2, 1, 0, 2] == codes.tolist()
+    assert ["a", "b"] == objects[:2] and pd.isna(objects[2])
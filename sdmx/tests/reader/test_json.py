@@ -1,14 +1,179 @@
+import json
+from copy import deepcopy
+from io import BytesIO
+from typing import Any
+
 import pytest
 
 import sdmx
 from sdmx.reader.json import Reader
 
+#: Minimal SDMX-JSON 1.0 message, with the structure after the data sets.
+MESSAGE: dict[str, Any] = {
+    "header": {
+        "id": "TEST",
+        "prepared": "2026-01-01T00:00:00Z",
+        "sender": {"id": "TEST", "name": "Test agency"},
+    },
+    "dataSets": [
+        {
+            "action": "Information",
+            "attributes": [0],
+            "series": {
+                "0:0": {"observations": {"0": [1.0, 0], "1": [2.5, None]}},
+                "0:1": {"observations": {"1": [3]}},
+            },
+        },
+        {"action": "Delete", "series": {"0:1": {"observations": {"0": [4.0]}}}},
+    ],
+    "structure": {
+        "dimensions": {
+            "dataSet": [],
+            "series": [
+                {"id": "FREQ", "keyPosition": 0, "values": [{"id": "A"}]},
+                {
+                    "id": "CURRENCY",
+                    "keyPosition": 1,
+                    "values": [{"id": "CHF"}, {"id": "USD"}],
+                },
+            ],
+            "observation": [
+                {"id": "TIME_PERIOD", "values": [{"id": "2025"}, {"id": "2026"}]}
+            ],
+        },
+        "attributes": {
+            "dataSet": [],
+            "series": [{"id": "TITLE", "name": "Title", "values": [{"name": "Foo"}]}],
+            "observation": [
+                {
+                    "id": "OBS_STATUS",
+                    "name": "Status",
+                    "values": [{"id": "A", "name": "Normal"}],
+                }
+            ],
+        },
+    },
+}
+
+
+class NotSeekable(BytesIO):
+    def seekable(self) -> bool:
+        return False
+
 
 class TestReader:
     def test_deprecated_detect(self) -> None:
         with pytest.warns(DeprecationWarning, match="use Converter.handles"):
             assert True is Reader.detect(b"{")
 
+    @pytest.mark.parametrize("cls", (BytesIO, NotSeekable))
+    def test_convert_incremental(self, cls) -> None:
+        content = json.dumps(MESSAGE).encode()
+        expected = Reader().convert(BytesIO(content))
+
+        result = Reader().convert(cls(content), incremental=True)
+
+        assert "TEST" == result.header.id
+        assert [3, 1] == [len(ds) for ds in result.data]
+        for ds_exp, ds in zip(expected.data, result.data):
+            assert ds_exp.action == ds.action
+            assert list(ds_exp.series) == list(ds.series)
+            assert [o.key for o in ds_exp.obs] == [o.key for o in ds.obs]
+            assert [o.value for o in ds_exp.obs] == [o.value for o in ds.obs]
+
+        # Series and observation attributes are read
+        sk = list(result.data[0].series)[0]
+        assert "Foo" == sk.attrib["TITLE"].value
+        assert "A" == result.data[0].obs[0].attrib["OBS_STATUS"].value.id
+
+    @pytest.mark.parametrize("incremental", (False, True))
+    def test_convert_flat(self, incremental) -> None:
+        """Keys with indices for several dimensions are decoded and ordered."""
+        message = deepcopy(MESSAGE)
+        dims = message["structure"]["dimensions"]
+        # All dimensions at the observation level; CURRENCY is listed first
+        dims["observation"] = dims.pop("series")[::-1] + dims["observation"]
+        message["dataSets"] = [
+            {
+                "action": "Information",
+                "observations": {"0:0:0": [1.0], "1:0:1": [2.0], "1:0:0": [3.0]},
+            }
+        ]
+
+        result = Reader().convert(
+            BytesIO(json.dumps(message).encode()), incremental=incremental
+        )
+
+        assert sdmx.model.v21.AllDimensions is result.observation_dimension
+        assert [
+            ("A", "CHF", "2025"),
+            ("A", "USD", "2026"),
+            ("A", "USD", "2025"),
+        ] == [o.key.get_values() for o in result.data[0].obs]
+
+    @pytest.mark.parametrize("incremental", (False, True))
+    def test_convert_attributes_after_series(self, incremental) -> None:
+        """Series attributes are read when "attributes" follows "series"."""
+        message = deepcopy(MESSAGE)
+        ds = message["dataSets"][0]
+        ds["attributes"] = ds.pop("attributes")
+
+        result = Reader().convert(
+            BytesIO(json.dumps(message).encode()), incremental=incremental
+        )
+
+        assert [3, 1] == [len(ds) for ds in result.data]
+        for sk in result.data[0].series:
+            assert "Foo" == sk.attrib["TITLE"].value
+        # No attributes for the second data set
+        assert {} == list(result.data[1].series)[0].attrib
+
+    @pytest.mark.parametrize("incremental", (False, True))
+    def test_convert_scalar(self, incremental) -> None:
+        """Series and observations given as scalar or null values are read."""
+        message = deepcopy(MESSAGE)
+        message["dataSets"][0]["series"] = {
+            "0:0": {"observations": {"0": 1.5, "1": None}},
+            "0:1": None,
+        }
+
+        result = Reader().convert(
+            BytesIO(json.dumps(message).encode()), incremental=incremental
+        )
+
+        assert [1.5, None] == [o.value for o in result.data[0].obs]
+        assert {} == result.data[0].obs[0].attached_attribute
+        # Following data set is read
+        assert [4.0] == [o.value for o in result.data[1].obs]
+
+    @pytest.mark.parametrize("incremental", (False, True))
+    def test_convert_no_action(self, incremental) -> None:
+        """Data sets without "action" are read, with no action."""
+        message = deepcopy(MESSAGE)
+        del message["dataSets"][0]["action"]
+
+        result = Reader().convert(
+            BytesIO(json.dumps(message).encode()), incremental=incremental
+        )
+
+        assert [None, sdmx.model.common.ActionType.delete] == [
+            ds.action for ds in result.data
+        ]
+
+    def test_iter_obs(self) -> None:
+        r = Reader()
+        result = r.iter_obs(BytesIO(json.dumps(MESSAGE).encode()))
+
+        ds, obs = next(result)
+        assert 1.0 == obs.value
+        assert "A.CHF.2025" == ".".join(obs.key.get_values())
+        assert 1 == len(r.msg.data) and ds is r.msg.data[0]
+
+        assert 3 == len(list(result))
+        assert 2 == len(r.msg.data)
+        # Observations are not stored
+        assert 0 == len(ds)
+
 
 @pytest.mark.parametrize_specimens("path", format="json")
 def test_json_read(path):
@@ -1,8 +1,13 @@
+from io import BytesIO
+
+import pandas as pd
 import pytest
 
 import sdmx
-from sdmx.message import Message
+from sdmx.message import DataMessage, Message
+from sdmx.model.v21 import DataStructureDefinition
 from sdmx.reader import xml
+from sdmx.testing import SERIES_KEYS
 
 
 class TestReader:
@@ -60,3 +65,30 @@ def test_read_xml_ss(specimen, message_path, structure_path, structure_id) -> No
         result = sdmx.read_sdmx(f, structure=s)
 
     assert isinstance(result, Message)
+
+
+@pytest.mark.parametrize("kind", SERIES_KEYS)
+def test_read_series_keys(kind) -> None:
+    # A series attribute
+    content = SERIES_KEYS[kind].replace('A="a1" B="b1"', 'A="a1" B="b1" C="c1"')
+    dsd = DataStructureDefinition(id="DSD")
+    for id in "A", "B":
+        dsd.dimensions.getdefault(id)
+
+    result = xml.read_series_keys(BytesIO(content.encode()), dsd)
+
+    expected = pd.DataFrame(
+        [["a1", "b1"], ["a1", "b2"], ["a2", "b1"]], columns=["A", "B"]
+    )
+    pd.testing.assert_frame_equal(expected, result)
+
+    if kind == "generic":
+        # Same as parsing the message and converting the series keys
+        msg = sdmx.read_sdmx(BytesIO(content.encode()))
+        assert isinstance(msg, DataMessage)
+        pd.testing.assert_frame_equal(sdmx.to_pandas(list(msg.data[0].series)), result)
+    else:
+        # Without a DSD, all XML attributes are read, including the series attribute
+        result = xml.read_series_keys(BytesIO(content.encode()))
+        assert ["A", "B", "C"] == list(result.columns)
+        assert ["c1"] == result["C"].dropna().tolist()
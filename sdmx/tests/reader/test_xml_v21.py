@@ -294,6 +294,59 @@ def test_gh_199():
     sdmx.read_sdmx(f2, structure=dsd2)
 
 
+def test_threads() -> None:
+    """Messages with different namespaces can be read concurrently.
+
+    Parsers added for <{namespace}DataSet> apply only to the reader of each message.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    CONTENT = """<mes:StructureSpecificData
+  xmlns:mes="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message"
+  xmlns:com="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/common"
+  xmlns:ss="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/structurespecific"
+  xmlns:u="urn:example:{0}">
+  <mes:Header>
+    <mes:ID>ID{0}</mes:ID>
+    <mes:Test>false</mes:Test>
+    <mes:Prepared>2026-01-01T00:00:00</mes:Prepared>
+    <mes:Sender id="TEST"/>
+    <mes:Structure structureID="DSD" namespace="urn:example:{0}"
+                   dimensionAtObservation="TIME_PERIOD">
+      <com:Structure><Ref agencyID="TEST" id="DSD" version="1.0"/></com:Structure>
+    </mes:Structure>
+  </mes:Header>
+  <u:DataSet ss:structureRef="DSD">
+    <Series A="a{0}"><Obs TIME_PERIOD="2000" OBS_VALUE="{0}"/></Series>
+  </u:DataSet>
+</mes:StructureSpecificData>"""
+
+    parser = Reader.parser.copy()
+
+    def read(i: int) -> tuple:
+        msg = Reader().convert(BytesIO(CONTENT.format(i).encode()))
+        assert isinstance(msg, sdmx.message.DataMessage)
+        (obs,) = msg.data[0].obs
+        return msg.header.id, obs.series_key["A"].value, obs.value
+
+    N = 400
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        result = list(executor.map(read, range(N)))
+
+    assert [(f"ID{i}", f"a{i}", str(i)) for i in range(N)] == result
+
+    # The parsers shared by all Reader instances are unchanged
+    assert parser == Reader.parser
+
+    # Parsers added while reading one message are discarded for the next
+    key = (etree.QName("urn:example:0", "DataSet"), "start")
+    reader = Reader()
+    reader.convert(BytesIO(CONTENT.format(0).encode()))
+    assert key in reader._parser and key not in Reader.parser
+    reader.convert(BytesIO(etree.tostring(E(qname("str:Agency"), id="FOO"))))
+    assert reader._parser is Reader.parser
+
+
 def test_gh_205(caplog, specimen) -> None:
     """Test of https://github.com/khaeru/sdmx/issues/205."""
     with specimen("INSEE/gh-205.xml") as f:
@@ -1,14 +1,21 @@
+import asyncio
 import json
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from io import BytesIO
 from typing import TYPE_CHECKING
 
 import pandas as pd
 import pytest
 from requests import HTTPError, PreparedRequest
+from requests.adapters import HTTPAdapter
 
 import sdmx
+from sdmx.testing import SERIES_KEYS, structure_message
 from sdmx.util.requests import save_response
 
 if TYPE_CHECKING:
@@ -16,7 +23,7 @@ if TYPE_CHECKING:
 
     from requests import Session
 
-    from sdmx import Client
+    from sdmx import AsyncClient, Client
     from sdmx.testing.data import SpecimenCollection
 
 
@@ -91,6 +98,581 @@ class TestClient:
         client.clear_cache()
         assert not client.cache
 
+    def test_cache_instance(
+        self, client: "Client", testsource: str, session_with_stored_responses
+    ) -> None:
+        """Each instance has its own cache and stored arguments."""
+        other = sdmx.Client(testsource, session=session_with_stored_responses)
+        client.get("dataflow", use_cache=True, timeout=123)
+
+        assert 1 == len(client.cache) and 0 == len(other.cache)
+        assert dict(timeout=123) == client._send_kwargs
+        assert {} == other._send_kwargs
+
+    def test_cache_limit(
+        self, testsource: str, session_with_stored_responses: "Session"
+    ) -> None:
+        from sdmx.util.cache import MessageCache
+
+        client = sdmx.Client(
+            testsource,
+            session=session_with_stored_responses,
+            cache=MessageCache(max_entries=1),
+        )
+        client.get("dataflow", use_cache=True)
+        client.get("codelist", use_cache=True)
+        client.get("codelist", use_cache=True)
+
+        assert 1 == len(client.cache)
+        info = client.cache.info()
+        assert 1 == info.hits and 2 == info.misses and 1 == info.evictions
+
+    def test_cache_persist(
+        self, tmp_path, testsource: str, session_with_stored_responses: "Session"
+    ) -> None:
+        from sdmx.message import StructureMessage
+        from sdmx.util.cache import MessageCache, PersistentMessageCache
+
+        def client() -> sdmx.Client:
+            persist = PersistentMessageCache(tmp_path.joinpath("c.sqlite"))
+            return sdmx.Client(
+                testsource,
+                session=session_with_stored_responses,
+                cache=MessageCache(persist=persist),
+            )
+
+        msg0 = client().get("dataflow", use_cache=True)
+
+        # A second client, for instance in another process, reads the parsed message
+        c = client()
+        msg1 = c.get("dataflow", use_cache=True)
+        assert isinstance(msg0, StructureMessage)
+        assert isinstance(msg1, StructureMessage)
+        assert msg1 is not msg0 and set(msg0.dataflow) == set(msg1.dataflow)
+        assert 1 == c.cache.info().hits
+
+    def test_structure_cache(
+        self,
+        monkeypatch,
+        testsource: str,
+        session_with_stored_responses: "Session",
+        tmp_path,
+    ) -> None:
+        """Structures for dict keys are stored persistently and reused."""
+        from sdmx.util.cache import StructureCache
+
+        def client() -> "Client":
+            return sdmx.Client(
+                testsource,
+                session=session_with_stored_responses,
+                structure_cache=StructureCache(tmp_path),
+            )
+
+        c0 = client()
+        # Mock a query for the dataflow
+        monkeypatch.setattr(
+            c0, "dataflow", lambda *args, **kwargs: structure_message(), raising=False
+        )
+        req0 = c0.data("FLOW", key=dict(DIM_2="B"), dry_run=True)
+        assert 1 == len(list(tmp_path.glob("*/*.xml")))
+
+        # A new Client instance uses the stored structure, without a query
+        req1 = client().data("FLOW", key=dict(DIM_2="B"), dry_run=True)
+        assert req1.url == req0.url and req1.url.endswith("/FLOW/.B")
+
+    def test_structure_cache_error(
+        self, caplog, monkeypatch, testsource: str, tmp_path
+    ) -> None:
+        """Errors in the structure cache are logged; the source is queried instead."""
+        from sdmx.util.cache import StructureCache
+
+        sc = StructureCache(tmp_path)
+        c = sdmx.Client(testsource, structure_cache=sc)
+        queries = []
+
+        def dataflow(*args, **kwargs):
+            queries.append(args)
+            return structure_message()
+
+        monkeypatch.setattr(c, "dataflow", dataflow, raising=False)
+
+        # Cached payload is not valid SDMX-ML
+        urn = "urn:sdmx:org.sdmx.infomodel.datastructure.Dataflow=TEST:FLOW(latest)"
+        p = sc._path(c.source.id, urn)
+        p.parent.mkdir(parents=True)
+        p.write_text("<foo")
+        assert "DSD" == c._get_dsd("FLOW").id
+        assert 1 == len(queries)
+        assert "Ignore urn:sdmx" in caplog.messages[-1]
+        # The file is not replaced
+        assert "<foo" == p.read_text()
+
+        # Writing the message fails
+        p.unlink()
+        monkeypatch.setattr("sdmx.writer.xml.to_xml", lambda *args: 1 / 0)
+        assert "DSD" == c._get_dsd("FLOW").id
+        assert 2 == len(queries)
+        assert "Could not store" in caplog.messages[-1]
+        assert not p.exists()
+
+    def test_negotiate(self, monkeypatch, client: "Client", tmp_path) -> None:
+        """Structure-specific data are requested when a DSD is known."""
+        from sdmx.util.cache import StructureCache
+
+        SS = "application/vnd.sdmx.structurespecificdata+xml;version=2.1"
+
+        def accept(**kwargs) -> str | None:
+            req = client.data("FLOW", key="a.x", dry_run=True, **kwargs)
+            return req.headers.get("Accept")
+
+        # DSD not known; no query to retrieve it
+        assert SS != accept()
+
+        # DSD given: requested, and retained for parsing the response
+        dsd = structure_message().structure["DSD"]
+        assert SS == accept(dsd=dsd)
+        _, kwargs = client._prepare("data", "FLOW", dict(key="a.x", dsd=dsd))
+        assert dsd is kwargs["dsd"]
+
+        # DSD retrieved earlier, in the message cache, is supplied automatically
+        req = client.dataflow("FLOW", params=dict(references="all"), dry_run=True)
+        client.cache[req.url] = structure_message()
+        assert SS == accept()
+        client.cache.clear()
+
+        # DSD from the structure cache is supplied automatically
+        client.structure_cache = StructureCache(tmp_path)
+        urn = "urn:sdmx:org.sdmx.infomodel.datastructure.Dataflow=TEST:FLOW(latest)"
+        client.structure_cache.put("TEST", urn, structure_message())
+        assert SS == accept()
+
+        # Not if the source does not support structure-specific data
+        monkeypatch.setitem(client.source.supports, "structure-specific data", False)
+        assert SS != accept()
+
+        # Compressed responses are requested
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+
+    def test_known_dsd(self, monkeypatch, client: "Client", tmp_path) -> None:
+        """_known_dsd() sends no query, and does not modify cached messages."""
+        from sdmx.message import StructureMessage
+        from sdmx.util.cache import StructureCache, request_key
+
+        def send(*args, **kwargs):
+            raise AssertionError("Query sent")
+
+        monkeypatch.setattr(client.session, "send", send)
+        client.structure_cache = StructureCache(tmp_path)
+
+        # Not in the structure cache or message cache
+        assert client._known_dsd("FLOW") is None
+
+        # A dataflow that references a DSD, and the DSD, in separate messages
+        dsd = structure_message().structure["DSD"]
+        dfd = structure_message().dataflow["FLOW"]
+        dfd.structure = type(dsd)(
+            id="DSD",
+            maintainer=dsd.maintainer,
+            version="1.0",
+            is_external_reference=True,
+        )
+        msgs = StructureMessage(), StructureMessage()
+        for msg, obj in zip(msgs, (dfd, dsd)):
+            msg.add(obj)
+
+        req = client.dataflow("FLOW", params=dict(references="all"), dry_run=True)
+        client.cache[request_key(req)] = msgs[0]
+        # Only the dataflow is known
+        assert client._known_dsd("FLOW") is None
+
+        req = client.get(resource=dfd.structure, dry_run=True)
+        assert isinstance(req, PreparedRequest)
+        client.cache[request_key(req)] = msgs[1]
+        assert dsd is client._known_dsd("FLOW")
+
+        # Cached message is not modified
+        assert 0 == len(msgs[1].dataflow)
+        # Combined message is stored in the structure cache
+        assert 1 == len(list(tmp_path.glob("*/*.xml")))
+
+    def test_get_many(self, client: "Client") -> None:
+        resources = ["codelist", "conceptscheme", "dataflow", "datastructure"]
+        requests: list = [dict(resource_type=r) for r in resources]
+        # A prepared request
+        requests.append(client.get("categoryscheme", dry_run=True))
+        # An invalid request
+        requests.append(dict(resource_type="foo"))
+
+        result = list(client.get_many(requests, max_workers=3))
+
+        assert 6 == len(result)
+        for r, msg in zip(resources + ["categoryscheme"], result):
+            assert isinstance(msg, sdmx.message.StructureMessage)
+            assert msg.response and f"/{r}/TEST/all/latest" in msg.response.url
+        # Exception for the invalid request is returned, not raised
+        assert isinstance(result[-1], KeyError)
+
+    def test_get_many_unordered(self, client: "Client") -> None:
+        resources = ["codelist", "conceptscheme", "dataflow", "datastructure"]
+
+        result = client.get_many(
+            [dict(resource_type=r) for r in resources], ordered=False
+        )
+
+        # (index, message) tuples
+        assert set(range(4)) == {i for i, _ in result}
+
+    def test_get_many_lazy(self, mock_client) -> None:
+        """get_many() keeps up to `max_workers` requests in progress."""
+        client, mock = mock_client
+        url = "https://example.com/sdmx-rest/dataflow/TEST/all/latest"
+        content = sdmx.to_xml(sdmx.message.StructureMessage())
+        mock.get(url, body=content, content_type="application/vnd.sdmx.structure+xml")
+
+        taken = []
+
+        def requests():
+            for i in range(5):
+                taken.append(i)
+                yield dict(resource_type="dataflow")
+
+        result = client.get_many(requests(), max_workers=2)
+        # The first 2 requests are sent before iterating
+        assert [0, 1] == taken
+
+        next(result)
+        assert [0, 1, 2] == taken
+        assert 4 == len(list(result))
+        assert 5 == len(taken)
+
+    def test_get_many_discard(self, monkeypatch, client: "Client") -> None:
+        """The thread pool of get_many() is shut down if the result is discarded."""
+        import gc
+
+        import sdmx.client
+
+        executors = []
+
+        class Executor(ThreadPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                executors.append(self)
+
+        monkeypatch.setattr(sdmx.client, "ThreadPoolExecutor", Executor)
+        taken: list = []
+        monkeypatch.setattr(client, "_get_one", taken.append)
+        requests = [dict(resource_type="dataflow")] * 10
+
+        # Partly consumed
+        result = client.get_many(requests, max_workers=2)
+        next(result)
+        del result
+        gc.collect()
+        assert executors[-1]._shutdown and len(taken) < 10
+
+        # Not iterated
+        result = client.get_many(requests, max_workers=2)
+        del result
+        gc.collect()
+        assert executors[-1]._shutdown and len(taken) < 20
+
+    def test_get_many_settings(self, mock_client) -> None:
+        """Arguments like `stream` apply to one request in get_many()."""
+        client, mock = mock_client
+        url = "https://example.com/sdmx-rest/dataflow/TEST/all/latest"
+        content = sdmx.to_xml(sdmx.message.StructureMessage())
+        mock.get(url, body=content, content_type="application/vnd.sdmx.structure+xml")
+
+        requests = [dict(resource_type="dataflow", stream=s) for s in (True, False)]
+        m0, m1 = client.get_many(requests)
+
+        # Only the response for the first request was streamed
+        assert m0.response._content is False
+        assert m1.response._content is not False
+        # Not stored on the session
+        assert client.session.stream is False
+
+    def test_get_stream(self, mock_client, tmp_path: "Path") -> None:
+        """get(…, stream=True) parses and writes the response as it is received."""
+        client, mock = mock_client
+        url = "https://example.com/sdmx-rest/dataflow/TEST/all/latest"
+        content = sdmx.to_xml(sdmx.message.StructureMessage())
+        path = tmp_path.joinpath("foo.xml")
+
+        mock.get(url, body=content, content_type="application/vnd.sdmx.structure+xml")
+        msg = client.get("dataflow", tofile=path, stream=True)
+
+        assert isinstance(msg, sdmx.message.StructureMessage)
+        assert client.session.stream is True
+        # Content was not loaded into memory by the response
+        assert msg.response is not None and msg.response._content is False
+        assert content == path.read_bytes()
+
+    def test_get_planned(self, monkeypatch, client: "Client") -> None:
+        """Data queries with dict keys are split or coalesced."""
+        from sdmx.model import common, v21
+
+        dsd = structure_message().structure["DSD"]
+        monkeypatch.setattr(client.source, "max_series", 2)
+
+        def urls(key) -> list[str]:
+            result = client.data("FLOW", key=key, dsd=dsd, dry_run=True)
+            assert isinstance(result, list)
+            return [r.url.split("/FLOW/")[1] for r in result]
+
+        # Split to at most 2 series per query
+        assert ["a.x", "b+c.x"] == urls(dict(DIM_1="a+b+c", DIM_2="x"))
+        # Combined into one query
+        assert ["a+b.x"] == urls(
+            [dict(DIM_1="a", DIM_2="x"), dict(DIM_1=["b"], DIM_2="x")]
+        )
+        # Combined, then split
+        assert ["a.x+y", "b.x+y"] == urls(
+            [dict(DIM_1=c, DIM_2=d) for c in "ab" for d in "xy"]
+        )
+
+        def get_one(item):
+            """Return a message with one observation per series in the query."""
+            ds = v21.DataSet(structured_by=dsd)
+            for d1 in item["key"].split(".")[0].split("+"):
+                sk = dsd.make_key(common.SeriesKey, dict(DIM_1=d1))
+                ds.add_obs([v21.Observation(value=item["key"])], sk)
+            return sdmx.message.DataMessage(data=[ds])
+
+        monkeypatch.setattr(client, "_get_one", get_one)
+
+        msg = client.data("FLOW", key=dict(DIM_1="a+b+c"), dsd=dsd)
+
+        assert isinstance(msg, sdmx.message.DataMessage)
+        assert 1 == len(msg.data)
+        assert ["a", "b", "c"] == [sk["DIM_1"].value for sk in msg.data[0].series]
+
+        # tofile= is not supported for >1 query
+        with pytest.raises(ValueError, match="query split in 2 parts"):
+            client.data("FLOW", key=dict(DIM_1="a+b+c"), dsd=dsd, tofile="foo")
+
+    def test_get_planned_max_url_length(self, monkeypatch, client: "Client") -> None:
+        """Data queries with dict keys are split to fit :attr:`.max_url_length`."""
+        dsd = structure_message().structure["DSD"]
+        base = client.data("FLOW", dsd=dsd, dry_run=True)
+        assert isinstance(base, PreparedRequest) and base.url
+
+        def urls(key) -> list[str]:
+            result = client.data("FLOW", key=key, dsd=dsd, dry_run=True)
+            assert isinstance(result, list)
+            return [r.url.split("/FLOW/")[1] for r in result]
+
+        key = dict(DIM_1="aaa+bbb+ccc+ddd", DIM_2="x")
+
+        # Long enough for the whole key
+        monkeypatch.setattr(client.source, "max_url_length", len(base.url) + 20)
+        assert ["aaa+bbb+ccc+ddd.x"] == urls(key)
+
+        # Too short for the whole key: split in halves
+        monkeypatch.setattr(client.source, "max_url_length", len(base.url) + 10)
+        assert ["aaa+bbb.x", "ccc+ddd.x"] == urls(key)
+
+        # Each URL is within the limit
+        result = client.data("FLOW", key=key, dsd=dsd, dry_run=True)
+        assert all(len(r.url) <= len(base.url) + 10 for r in result)
+
+    def test_get_time_chunks(self, monkeypatch, client: "Client") -> None:
+        """Data queries with time_chunks= are split into time windows."""
+        from sdmx.model import common, v21
+
+        dsd = structure_message().structure["DSD"]
+        kw = dict(dsd=dsd, time_chunks="5Y", params=dict(startPeriod="2000"))
+
+        result = client.data("FLOW", key="a.x", end_period="2011", dry_run=True, **kw)
+        assert isinstance(result, list)
+        assert [
+            "a.x?startPeriod=2000-01-01&endPeriod=2004-12-31",
+            "a.x?startPeriod=2005-01-01&endPeriod=2009-12-31",
+            "a.x?startPeriod=2010-01-01&endPeriod=2011-12-31",
+        ] == [r.url.split("/FLOW/")[1] for r in result]
+
+        # Combined with a planned key: one query per key and window
+        monkeypatch.setattr(client.source, "max_series", 1)
+        result = client.data(
+            "FLOW", key=dict(DIM_1="a+b"), end_period="2005", dry_run=True, **kw
+        )
+        assert 4 == len(result)
+
+        def get_one(item):
+            """Return a message with one observation for the query's start period."""
+            ds = v21.DataSet(structured_by=dsd)
+            sk = dsd.make_key(common.SeriesKey, dict(DIM_1=item["key"].split(".")[0]))
+            ds.add_obs([v21.Observation(value=item["params"]["start_period"])], sk)
+            return sdmx.message.DataMessage(data=[ds])
+
+        monkeypatch.setattr(client, "_get_one", get_one)
+
+        msg = client.data("FLOW", key=dict(DIM_1="a+b"), end_period="2014", **kw)
+
+        # Observations for each series are merged, in order
+        assert isinstance(msg, sdmx.message.DataMessage)
+        for obs in msg.data[0].series.values():
+            assert ["2000-01-01", "2005-01-01", "2010-01-01"] == [o.value for o in obs]
+
+        with pytest.raises(ValueError, match="without start_period"):
+            client.data("FLOW", key="a.x", dsd=dsd, time_chunks="5Y")
+
+    def test_get_revalidate(self, mock_client) -> None:
+        """get(…, revalidate=True) sends a conditional request; 304 is a cache hit."""
+        client, mock = mock_client
+        url = "https://example.com/sdmx-rest/dataflow/TEST/all/latest"
+        content = sdmx.to_xml(sdmx.message.StructureMessage())
+        ctype = "application/vnd.sdmx.structure+xml"
+        validators = {"ETag": '"abc"', "Last-Modified": "Sun, 18 Oct 2026 12:00:00 GMT"}
+
+        mock.get(url, body=content, content_type=ctype, headers=validators)
+        msg0 = client.get("dataflow", use_cache=True)
+
+        # Cache hit without revalidation; no request
+        assert msg0 is client.get("dataflow", use_cache=True)
+        assert 1 == len(mock.calls)
+
+        mock.replace("GET", url, status=304)
+        assert msg0 is client.get("dataflow", use_cache=True, revalidate=True)
+
+        headers = mock.calls[-1].request.headers
+        assert '"abc"' == headers["If-None-Match"]
+        assert validators["Last-Modified"] == headers["If-Modified-Since"]
+
+        # Changed content replaces the cached message
+        mock.replace("GET", url, body=content, content_type=ctype)
+        msg1 = client.get("dataflow", use_cache=True, revalidate=True)
+        assert msg1 is not msg0 and msg1 is client.cache[url]
+
+    def test_get_metrics(self, mock_client) -> None:
+        """get() records :class:`.Metrics`, attaches them and passes them to sinks."""
+        from sdmx.util.metrics import collect
+
+        client, mock = mock_client
+        url = client.data("FLOW", dry_run=True).url
+        content = SERIES_KEYS["generic"]
+
+        with collect() as records:
+            mock.get(
+                url, body=content, content_type="application/vnd.sdmx.genericdata+xml"
+            )
+            msg = client.data("FLOW", use_cache=True)
+            assert msg is client.data("FLOW", use_cache=True)
+
+        m0, m1 = records
+        assert m0 is msg.metrics and url == m0.url and not m0.cache_hit
+        assert ["prepared", "sent", "first_byte", "body"] == list(m0.times)[:4]
+        assert {"parse_start", "parse_end", "finished"} <= set(m0.times)
+        assert list(m0.times.values()) == sorted(m0.times.values())
+        assert len(content) == m0.bytes_received == m0.bytes_read
+        assert (0, 3) == (m0.observations, m0.series)
+        assert {"prepare", "wait", "parse", "total"} <= set(m0.durations())
+
+        # A cache hit is recorded separately
+        assert m1.cache_hit and "sent" not in m1.times and url == m1.url
+
+    def test_refresh(self, mock_client) -> None:
+        client, mock = mock_client
+        url = "https://example.com/sdmx-rest/data/FOO/all"
+        content = sdmx.to_xml(sdmx.message.DataMessage())
+        kw = dict(content_type="application/vnd.sdmx.genericdata+xml; version=2.1")
+
+        mock.get(
+            url,
+            body=content,
+            headers={"Date": "Sun, 18 Oct 2026 12:00:00 GMT"},
+            **kw,
+        )
+        msg0 = client.get(url=url, params=dict(startPeriod="2020"))
+        assert isinstance(msg0, sdmx.message.DataMessage)
+        msg1 = client.refresh(msg0)
+
+        assert isinstance(msg1, sdmx.message.DataMessage)
+        assert msg1.response and msg1.response.url == (
+            f"{url}?startPeriod=2020&updatedAfter=2026-10-18T12%3A00%3A00%2B00%3A00"
+        )
+
+        # Refreshing a refreshed message replaces the parameter
+        msg1.response.headers["Date"] = "Sun, 18 Oct 2026 13:00:00 GMT"
+        msg2 = client.refresh(msg1)
+        assert msg2.response and msg2.response.url.endswith(
+            "&updatedAfter=2026-10-18T13%3A00%3A00%2B00%3A00"
+        )
+
+        with pytest.raises(ValueError, match="no response"):
+            client.refresh(sdmx.message.DataMessage())
+
+    def test_refresh_structure_specific(self, mock_client) -> None:
+        """refresh() reads structure-specific data using the earlier DSD."""
+        client, mock = mock_client
+        url = "https://example.com/sdmx-rest/data/FLOW/all"
+        content = SERIES_KEYS["structure-specific"].replace(
+            ' xsi:type="ns1:SeriesType"', ""
+        )
+        ct = "application/vnd.sdmx.structurespecificdata+xml; version=2.1"
+        mock.get(url, body=content, content_type=ct)
+
+        def make_dsd():
+            result = sdmx.model.v21.DataStructureDefinition(id="DSD")
+            for id in "AB":
+                result.dimensions.getdefault(id)
+            return result
+
+        dsd = make_dsd()
+        msg0 = client.get(url=url, dsd=dsd)
+        assert isinstance(msg0, sdmx.message.DataMessage)
+
+        # Time from Header.prepared; DSD from the earlier message
+        msg0.header.prepared = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+        msg1 = client.refresh(msg0)
+
+        assert isinstance(msg1, sdmx.message.DataMessage)
+        assert 3 == len(msg1.data[0].series)
+        assert dsd is msg1.data[0].structured_by
+
+        # An explicit `dsd` is used
+        other = make_dsd()
+        assert other is client.refresh(msg0, dsd=other).data[0].structured_by
+
+    def test_get_many_pool(self, testsource: str) -> None:
+        """get_many() enlarges the connection pool of a plain HTTPAdapter."""
+        client = sdmx.Client(testsource)
+        # Pool is enlarged before iterating over the result
+        result = client.get_many([], max_workers=16)
+
+        adapter = client.session.get_adapter("https://example.com")
+        assert isinstance(adapter, HTTPAdapter)
+        assert 16 == adapter.poolmanager.connection_pool_kw["maxsize"]
+        assert [] == list(result)
+
+    def test_rate_limit(self, monkeypatch) -> None:
+        """Sources on the same host share a rate limit given by Source.rate_limit."""
+        from sdmx.session import HTTPAdapter, RateLimit
+        from sdmx.source import get_source
+
+        # No limits for built-in sources
+        assert get_source("OECD").rate_limit is None
+
+        for id in "OECD", "OECD3":
+            monkeypatch.setattr(get_source(id), "rate_limit", dict(rate=1.0, burst=5))
+        c1, c2 = sdmx.Client("OECD"), sdmx.Client("OECD3")
+        a1 = c1.session.get_adapter(c1.source.url)
+        a2 = c2.session.get_adapter(c2.source.url)
+        assert isinstance(a1, HTTPAdapter) and isinstance(a2, HTTPAdapter)
+        assert isinstance(a1.rate_limit, RateLimit)
+        assert a1.rate_limit is a2.rate_limit
+
+        # get_many() retains the rate limit
+        list(c1.get_many([], max_workers=32))
+        a1 = c1.session.get_adapter(c1.source.url)
+        assert isinstance(a1, HTTPAdapter) and a1.rate_limit is a2.rate_limit
+        assert 32 == a1.poolmanager.connection_pool_kw["maxsize"]
+
+        # Other sources are not limited
+        c3 = sdmx.Client("ECB")
+        a3 = c3.session.get_adapter(c3.source.url)
+        assert isinstance(a3, HTTPAdapter) and a3.rate_limit is None
+
     def test_session_attrs0(
         self, caplog: "pytest.LogCaptureFixture", client: "Client"
     ) -> None:
@@ -139,10 +721,13 @@ class TestClient:
             "cache",
             "clear_cache",
             "get",
+            "get_many",
             "preview_data",
+            "refresh",
             "series_keys",
             "session",
             "source",
+            "structure_cache",
             "timeout",
         }
         expected |= set(ep.name for ep in sdmx.Resource)
@@ -230,6 +815,101 @@ class TestClient:
         assert isinstance(keys_df, pd.DataFrame)
         assert N >= len(keys_df)
 
+    @pytest.mark.parametrize("kind", ["generic", "structure-specific"])
+    def test_preview_data_offline(self, mock_client, kind) -> None:
+        from sdmx.message import StructureMessage
+        from sdmx.model import v21
+
+        client, mock = mock_client
+
+        # A DSD with dimensions A, B, TIME_PERIOD and attribute C, known from the cache
+        m = v21.Agency(id="TEST")
+        dsd = v21.DataStructureDefinition(id="DSD", maintainer=m, version="1.0")
+        for id in "A", "B":
+            dsd.dimensions.getdefault(id)
+        dsd.dimensions.getdefault("TIME_PERIOD", cls=v21.TimeDimension)
+        dsd.attributes.getdefault("C")
+        sm = StructureMessage()
+        sm.add(dsd)
+        sm.add(v21.DataflowDefinition(id="FLOW", maintainer=m, structure=dsd))
+        req = client.dataflow("FLOW", params=dict(references="all"), dry_run=True)
+        client.cache[req.url] = sm
+
+        req = client.data("FLOW", params=dict(detail="serieskeysonly"), dry_run=True)
+        content_type = f"application/vnd.sdmx.{kind.replace('-', '')}data+xml"
+        # A series attribute; an xsi:type not handled by the full reader
+        body = (
+            SERIES_KEYS[kind]
+            .replace('A="a1" B="b1"', 'A="a1" B="b1" C="c1"')
+            .replace(' xsi:type="ns1:SeriesType"', "")
+        )
+
+        mock.get(req.url, body=body, content_type=content_type)
+
+        # Series keys as a data frame, including only dimensions
+        df = client.series_keys("FLOW", frame=True)
+        assert isinstance(df, pd.DataFrame) and (3, 2) == df.shape
+        assert ["A", "B"] == list(df.columns)
+
+        # All keys, parsed with the DSD
+        keys = client.preview_data("FLOW")
+        assert ["a1", "a1", "a2"] == [k["A"].value for k in keys]
+        assert keys[0]["A"].value_for is dsd.dimensions.get("A")
+
+        # Keys are filtered
+        keys = client.preview_data("FLOW", dict(A="a1", B=["b2", "b3"]))
+        assert 1 == len(keys) and ("a1", "b2") == keys[0].get_values()
+        assert keys[0]["B"].value_for.id == "B"
+
+        # Invalid dimension ID
+        with pytest.raises(ValueError, match="Dimensions \\['C'\\] not in"):
+            client.preview_data("FLOW", dict(C="c1"))
+
+    def test_series_keys_no_dsd(self, monkeypatch, mock_client) -> None:
+        """Structure-specific series keys are read when no DSD is known."""
+        client, mock = mock_client
+        # Keys are used to construct a DSD
+        monkeypatch.setitem(client.source.supports, sdmx.Resource.datastructure, False)
+
+        req = client.data("FLOW", params=dict(detail="serieskeysonly"), dry_run=True)
+        mock.get(
+            req.url,
+            body=SERIES_KEYS["structure-specific"],
+            content_type="application/vnd.sdmx.structurespecificdata+xml",
+        )
+
+        df = client.series_keys("FLOW", frame=True)
+        assert ["A", "B"] == list(df.columns) and (3, 2) == df.shape
+
+        keys = client.preview_data("FLOW", dict(A="a1"))
+        assert [("a1", "b1"), ("a1", "b2")] == [k.get_values() for k in keys]
+
+        # A dict key is validated using the DSD constructed from the keys
+        req = client.data("FLOW", key=dict(A="a2"), dry_run=True)
+        assert isinstance(req, PreparedRequest) and req.url
+        assert req.url.endswith("/FLOW/a2.")
+
+    def test_series_keys_finish_message(self, monkeypatch, mock_client) -> None:
+        """series_keys(frame=True) applies the :meth:`.Source.finish_message` hook."""
+        client, mock = mock_client
+        req = client.data("FLOW", params=dict(detail="serieskeysonly"), dry_run=True)
+        mock.get(
+            req.url,
+            body=SERIES_KEYS["generic"],
+            content_type="application/vnd.sdmx.genericdata+xml",
+        )
+
+        def finish_message(message, request, **kwargs):
+            # Keep only the first series
+            ds = message.data[0]
+            ds.series = dict(list(ds.series.items())[:1])
+            return message
+
+        monkeypatch.setattr(client.source, "finish_message", finish_message)
+
+        df = client.series_keys("FLOW", frame=True)
+        assert (1, 2) == df.shape
+
     def test_request_from_args(
         self, caplog: "pytest.LogCaptureFixture", client: "Client"
     ) -> None:
@@ -276,6 +956,77 @@ class TestClient:
             client.get("data", resource_id=df_id, key=key)
 
 
+class TestAsyncClient:
+    @pytest.fixture
+    def client(
+        self, testsource: str, session_with_stored_responses: "Session"
+    ) -> "AsyncClient":
+        return sdmx.AsyncClient(
+            testsource, max_connections=2, session=session_with_stored_responses
+        )
+
+    def test_dir(self, client: "AsyncClient") -> None:
+        assert {"get", "data", "dataflow"} <= set(dir(client))
+
+        with pytest.raises(AttributeError):
+            client.foo
+
+    def test_get(self, client: "AsyncClient") -> None:
+        resources = ("codelist", "conceptscheme", "dataflow", "datastructure")
+
+        async def main():
+            return await asyncio.gather(*[getattr(client, r)() for r in resources])
+
+        result = asyncio.run(main())
+
+        assert 4 == len(result)
+        for r, msg in zip(resources, result):
+            assert isinstance(msg, sdmx.message.StructureMessage)
+            assert msg.response and msg.response.url.endswith(f"/{r}/TEST/all/latest")
+
+    def test_get_dry_run(self, client: "AsyncClient") -> None:
+        req = asyncio.run(client.get("dataflow", dry_run=True))
+        assert isinstance(req, PreparedRequest)
+        assert "https://example.com/sdmx-rest/dataflow/TEST/all/latest" == req.url
+
+    def test_get_cache(self, client: "AsyncClient") -> None:
+        client.client.clear_cache()
+
+        async def main():
+            msg0 = await client.dataflow(use_cache=True)
+            return msg0, await client.dataflow(use_cache=True)
+
+        msg0, msg1 = asyncio.run(main())
+        assert msg0 is msg1
+
+    def test_max_connections(
+        self, monkeypatch: "pytest.MonkeyPatch", client: "AsyncClient"
+    ) -> None:
+        """No more than `max_connections` requests are sent at once."""
+        lock = threading.Lock()
+        active, peak = [0], [0]
+        _send = client.client._send
+
+        def send(*args, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            try:
+                return _send(*args, **kwargs)
+            finally:
+                with lock:
+                    active[0] -= 1
+
+        monkeypatch.setattr(client.client, "_send", send)
+
+        async def main():
+            return await asyncio.gather(*[client.dataflow() for _ in range(6)])
+
+        assert 6 == len(asyncio.run(main()))
+        assert 2 == peak[0]
+
+
 @pytest.mark.network
 @pytest.mark.xfail(
     reason="Flaky; see https://github.com/khaeru/sdmx/issues/148", raises=HTTPError
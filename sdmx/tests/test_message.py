@@ -20,6 +20,38 @@ def test_compare(cls):
 
 
 class TestDataMessage:
+    def test_merge(self) -> None:
+        dsd = v21.DataStructureDefinition()
+        for id in "FOO", "BAR":
+            dsd.dimensions.getdefault(id)
+
+        def msg(*values: tuple[str, int]) -> message.DataMessage:
+            ds = v21.DataSet(structured_by=dsd)
+            for foo, bar in values:
+                sk = dsd.make_key(common.SeriesKey, dict(FOO=foo))
+                obs = v21.Observation(
+                    dimension=dsd.make_key(common.Key, dict(BAR=bar)), value=bar
+                )
+                ds.add_obs([obs], sk)
+            return message.DataMessage(data=[ds])
+
+        dm0 = msg(("a", 1), ("b", 1))
+        dm1 = msg(("a", 2), ("c", 1))
+        dm2 = message.DataMessage(data=[v21.DataSet(), v21.DataSet()])
+
+        dm0.merge(dm1, dm2)
+
+        # Data sets beyond the first are appended
+        assert 2 == len(dm0.data)
+        ds = dm0.data[0]
+        assert 4 == len(ds)
+        assert ["a", "b", "c"] == [sk["FOO"].value for sk in ds.series]
+
+        # Observations in equal series keys are merged, in order
+        sk0 = list(ds.series)[0]
+        assert [1, 2] == [obs.value for obs in ds.series[sk0]]
+        assert all(obs.series_key is sk0 for obs in ds.series[sk0])
+
     def test_update(self, caplog):
         dm = message.DataMessage()
 
@@ -1,9 +1,11 @@
 import re
 from typing import TYPE_CHECKING, Any
 
+import pandas as pd
 import pytest
 
 from sdmx import Resource
+from sdmx.rest import plan
 from sdmx.rest.common import PathParameter, PositiveIntParam, QueryParameter
 
 if TYPE_CHECKING:
@@ -62,6 +64,85 @@ class TestQueryParameter:
             p.handle({"snakeName": 3})
 
 
+class TestPlan:
+    DIMS = ["A", "B", "C"]
+
+    def test_coalesce(self) -> None:
+        keys: list[dict[str, Any]] = [
+            dict(A="x", B="1"),
+            dict(A="x", B="2"),
+            dict(A="y", B=["1", "2"]),
+            dict(A="z", B="3", C="c"),
+            dict(A="z", B="3", C="c"),  # Duplicate
+        ]
+        assert [
+            {"A": ["x", "y"], "B": ["1", "2"]},
+            {"A": ["z"], "B": ["3"], "C": ["c"]},
+        ] == plan.coalesce(keys, self.DIMS)
+
+        # A key with no values for a dimension includes one with values
+        assert [{"A": ["x"]}] == plan.coalesce(
+            [dict(A="x", B="1"), dict(A="x")], self.DIMS
+        )
+
+        with pytest.raises(ValueError, match=r"Dimension\(s\) \['D'\] not among"):
+            plan.coalesce([dict(D="x")], self.DIMS)
+
+    def test_query_length(self) -> None:
+        key = plan.normalize(dict(A="x+yy", C=["z"]))
+        assert len("x+yy..z") == plan.query_length(key, self.DIMS)
+        assert 2 == plan.n_series(key)
+
+    @pytest.mark.parametrize(
+        "kwargs, N",
+        (
+            (dict(), 1),
+            (dict(max_series=8), 1),
+            (dict(max_series=4), 2),
+            (dict(max_series=1), 8),
+            (dict(max_length=len("1+2+3+4..a+b")), 1),
+            (dict(max_length=len("1+2..a+b")), 2),
+            (dict(max_length=len("1..a")), 8),
+        ),
+    )
+    def test_split(self, kwargs, N) -> None:
+        key = plan.normalize(dict(A="1+2+3+4", C="a+b"))
+
+        result = plan.split(key, self.DIMS, **kwargs)
+
+        assert N == len(result)
+        # Same combinations of values are selected
+        assert {(a, c) for a in key["A"] for c in key["C"]} == {
+            (a, c) for k in result for a in k["A"] for c in k["C"]
+        }
+
+        with pytest.raises(ValueError, match="Cannot split key"):
+            plan.split(key, self.DIMS, max_length=3)
+
+    @pytest.mark.parametrize(
+        "start, end, length, expected",
+        (
+            ("2000", "2001", "1Y", ["2000-01-01", "2001-01-01"]),
+            ("2000-Q2", "2000-Q3", "2M", ["2000-04-01", "2000-06-01", "2000-08-01"]),
+            ("2000-01-30", "2000-02-02", "2d", ["2000-01-30", "2000-02-01"]),
+        ),
+    )
+    def test_periods(self, start, end, length, expected) -> None:
+        result = plan.periods(start, end, length)
+
+        assert expected == [s for s, _ in result]
+        # Windows are contiguous; the last ends with the end period
+        assert all(
+            pd.Timestamp(e) + pd.Timedelta(days=1) == pd.Timestamp(s)
+            for (_, e), (s, _) in zip(result[:-1], result[1:])
+        )
+        assert pd.Period(end).end_time.strftime("%Y-%m-%d") == result[-1][1]
+
+    def test_periods_invalid(self) -> None:
+        with pytest.raises(ValueError, match="Invalid length"):
+            plan.periods("2000", "2001", "1 year")
+
+
 class TestPositiveIntParam:
     @pytest.fixture
     def p(self):
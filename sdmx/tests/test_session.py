@@ -1,6 +1,18 @@
+import gzip
+from io import BytesIO, UnsupportedOperation
+
 import pytest
+import requests
+from urllib3.response import HTTPResponse
 
-from sdmx.session import Session
+from sdmx.session import (
+    HTTPAdapter,
+    RateLimit,
+    ResponseIO,
+    RetryPolicy,
+    Session,
+    retry_after_seconds,
+)
 
 from . import has_requests_cache
 
@@ -23,6 +35,220 @@ class TestSession:
         # Not an argument handled by sdmx1 or by requests_cache —no exception raised
         Session(foo="bar")
 
+    def test_retry(self) -> None:
+        # No retries by default
+        adapter = Session().get_adapter("https://example.com")
+        assert isinstance(adapter, HTTPAdapter) and 0 == adapter.retry.total
+
+        s = Session(retry=5)
+        adapter = s.get_adapter("https://example.com")
+        assert isinstance(adapter, HTTPAdapter)
+        assert 5 == adapter.retry.total
+
+        # limit() mounts an adapter for a prefix, keeping the retry policy
+        rl = RateLimit(1.0)
+        s.limit("https://example.com/foo", rl)
+        adapter = s.get_adapter("https://example.com/foo/bar")
+        assert isinstance(adapter, HTTPAdapter)
+        assert rl is adapter.rate_limit and 5 == adapter.retry.total
+        adapter = s.get_adapter("https://example.com/baz")
+        assert isinstance(adapter, HTTPAdapter) and adapter.rate_limit is None
+
+
+def response(status: int, **headers) -> requests.Response:
+    result = requests.Response()
+    result.status_code = status
+    result.headers.update(headers)
+    return result
+
+
+class TestRetryPolicy:
+    def test_delay(self) -> None:
+        p = RetryPolicy(backoff=1.0, max_backoff=5.0)
+
+        # Jittered delay within bounds, and capped
+        assert all(0 <= p.delay(1, response(503)) <= 2.0 for _ in range(20))
+        assert all(0 <= p.delay(10, response(503)) <= 5.0 for _ in range(20))
+
+        # Retry-After is honoured, including 0, up to max_backoff
+        assert 3.0 == p.delay(0, response(503, **{"Retry-After": "3"}))
+        assert 0.0 == p.delay(5, response(503, **{"Retry-After": "0"}))
+        assert 5.0 == p.delay(0, response(503, **{"Retry-After": "120"}))
+
+    def test_retry_after_seconds(self) -> None:
+        assert retry_after_seconds(response(429)) is None
+        assert retry_after_seconds(response(429, **{"Retry-After": "foo"})) is None
+        # HTTP date in the past
+        value = "Sun, 06 Nov 1994 08:49:37 GMT"
+        assert 0.0 == retry_after_seconds(response(429, **{"Retry-After": value}))
+
+
+class TestRateLimit:
+    @pytest.fixture
+    def clock(self, monkeypatch) -> list[float]:
+        """Monotonic time that advances only through time.sleep()."""
+        now = [0.0]
+
+        def sleep(seconds: float) -> None:
+            now[0] += seconds
+
+        monkeypatch.setattr("sdmx.session.time.monotonic", lambda: now[0])
+        monkeypatch.setattr("sdmx.session.time.sleep", sleep)
+        return now
+
+    def test_acquire(self, clock) -> None:
+        rl = RateLimit(2.0, burst=3)
+
+        # Burst of 3 without waiting, then 0.5 s between requests
+        assert [0, 0, 0, 0.5, 0.5] == [rl.acquire() for _ in range(5)]
+        assert 1.0 == clock[0]
+
+        # Tokens accumulate up to `burst`
+        clock[0] += 10.0
+        assert [0, 0, 0, 0.5] == [rl.acquire() for _ in range(4)]
+
+    def test_aimd(self, clock) -> None:
+        rl = RateLimit(4.0, step=1.0, min_rate=1.0)
+
+        rl.decrease(delay=2.0)
+        assert 2.0 == rl.rate
+        # The next request waits for the delay
+        assert 2.0 <= rl.acquire()
+
+        rl.decrease()
+        rl.decrease()
+        assert 1.0 == rl.rate  # Not below min_rate
+
+        for _ in range(5):
+            rl.increase()
+        assert 4.0 == rl.rate  # Not above the initial rate
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimit(0)
+
+    def test_shared(self) -> None:
+        a = RateLimit.shared("test_shared.example.com", rate=1.0)
+        assert a is RateLimit.shared("test_shared.example.com", rate=1.0)
+        assert 1.0 == a.max_rate
+
+        # Different parameters give a different instance
+        b = RateLimit.shared("test_shared.example.com", rate=2.0)
+        assert b is not a and 2.0 == b.max_rate
+
+
+class TestHTTPAdapter:
+    URL = "https://example.com/foo"
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch) -> list[float]:
+        result: list[float] = []
+        monkeypatch.setattr("sdmx.session.time.sleep", result.append)
+        return result
+
+    def test_retry(self, sleeps) -> None:
+        import responses
+
+        s = Session(retry=RetryPolicy(total=2))
+        with responses.RequestsMock() as mock:
+            mock.get(self.URL, status=503)
+            mock.get(self.URL, status=429, headers={"Retry-After": "3"})
+            mock.get(self.URL, body="bar")
+
+            assert "bar" == s.get(self.URL).text
+
+        # Retry-After is honoured
+        assert 2 == len(sleeps) and 3.0 == sleeps[1]
+
+    def test_retry_exhausted(self, sleeps) -> None:
+        import responses
+
+        s = Session(retry=1)
+        with responses.RequestsMock() as mock:
+            mock.get(self.URL, status=503)
+
+            # Final response is returned
+            assert 503 == s.get(self.URL).status_code
+            assert 2 == len(mock.calls)
+
+        # No retries
+        s = Session(retry=0)
+        with responses.RequestsMock() as mock:
+            mock.get(self.URL, status=503)
+            assert 503 == s.get(self.URL).status_code
+            assert 1 == len(mock.calls)
+
+    def test_rate_limit(self, sleeps) -> None:
+        import responses
+
+        rl = RateLimit(10.0)
+        s = Session(retry=1)
+        s.limit("https://example.com", rl)
+        with responses.RequestsMock() as mock:
+            mock.get(self.URL, status=429, headers={"Retry-After": "1"})
+            mock.get(self.URL, body="bar")
+
+            assert "bar" == s.get(self.URL).text
+
+        # Rate decreased on 429, then increased on success
+        assert 5.0 + rl.step == rl.rate
+        # The limiter, not the adapter, waited for Retry-After and then 1 / rate
+        assert [0.0] == sleeps[:1] and 1.1 < sleeps[1] <= 1.2
+
+
+class TestResponseIO:
+    CONTENT = b"<foo>" + 1000 * b"<bar/>" + b"</foo>"
+
+    @staticmethod
+    def response(body: bytes, gz: bool = False) -> requests.Response:
+        """A :class:`requests.Response` with a body that has not yet been read."""
+        result = requests.Response()
+        result.status_code = 200
+        result.raw = HTTPResponse(body=BytesIO(body), preload_content=False)
+        if gz:
+            result.headers["Content-Disposition"] = 'attachment; filename="foo.xml.gz"'
+        return result
+
+    @pytest.mark.parametrize("gz", (False, True))
+    def test_read(self, tmp_path, gz) -> None:
+        body = gzip.compress(self.CONTENT) if gz else self.CONTENT
+        path = tmp_path.joinpath("foo.xml")
+
+        rio = ResponseIO(self.response(body, gz), tee=path)
+
+        # Entire content is read and stored
+        assert rio.seekable()
+        assert self.CONTENT == rio.read()
+        assert self.CONTENT == path.read_bytes()
+
+    @pytest.mark.parametrize("gz", (False, True))
+    def test_read_stream(self, tmp_path, gz) -> None:
+        body = gzip.compress(self.CONTENT) if gz else self.CONTENT
+        path = tmp_path.joinpath("foo.xml")
+        response = self.response(body, gz)
+
+        with open(path, "w+b") as f:
+            rio = ResponseIO(response, tee=f, stream=True)
+            assert not rio.seekable()
+            with pytest.raises(UnsupportedOperation):
+                rio.seek(0)
+
+            # Content is read from the response and written to `tee` incrementally
+            assert self.CONTENT[:100] == rio.read(100)
+            assert 100 == rio.tell() == f.tell()
+
+            assert self.CONTENT[100:] == rio.read()
+
+        assert self.CONTENT == path.read_bytes()
+        # Response content was never loaded
+        assert response._content is False
+
+    def test_read_stream_no_tee(self) -> None:
+        rio = ResponseIO(self.response(self.CONTENT), stream=True)
+
+        assert rio.tee is None
+        assert self.CONTENT == rio.read()
+
 
 @pytest.mark.network
 @pytest.mark.xfail(condition=not has_requests_cache, reason="Requires cache")
@@ -0,0 +1,184 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+import sdmx
+from sdmx import snapshot
+from sdmx.message import DataMessage, StructureMessage
+from sdmx.model import common, v21
+from sdmx.testing import sized_message, structure_message
+
+
+def data_message() -> DataMessage:
+    """A message with a series data set, with a group, and a flat data set."""
+    dsd = v21.DataStructureDefinition(id="DSD")
+    for id in "A", "B":
+        dsd.dimensions.getdefault(id)
+    dsd.dimensions.getdefault("TIME_PERIOD", cls=common.TimeDimension)
+    dsd.attributes.getdefault("UNIT")
+    dsd.attributes.getdefault("OBS_STATUS")
+    pm = dsd.measures.getdefault("OBS_VALUE")
+
+    ds0 = v21.StructureSpecificDataSet(structured_by=dsd)
+    gk = dsd.make_key(common.GroupKey, dict(A="a1"))
+    gk.attrib["UNIT"] = common.AttributeValue(value="kg", value_for=dsd.attributes[0])
+    ds0.group[gk] = []
+    for a, b in ("a1", "b1"), ("a1", "b2"), ("a2", "b1"):
+        sk = dsd.make_key(common.SeriesKey, dict(A=a, B=b))
+        ds0.add_obs(
+            [
+                v21.Observation(
+                    dimension=dsd.make_key(common.Key, dict(TIME_PERIOD=str(y))),
+                    value=None if y == 2002 and b == "b2" else f"{y}.{a[1]}",
+                    value_for=pm,
+                    attached_attribute=dict(OBS_STATUS=common.AttributeValue(value="E"))
+                    if y == 2001
+                    else {},
+                )
+                for y in range(2000, 2003)
+            ],
+            sk,
+        )
+    # Like the XML reader, associate observations with groups at the end
+    for obs in ds0.obs:
+        ds0._add_group_refs(obs)
+
+    ds1 = v21.DataSet(structured_by=dsd)
+    ds1.add_obs(
+        v21.Observation(
+            dimension=dsd.make_key(
+                common.Key, dict(A="a1", B="b1", TIME_PERIOD=str(y))
+            ),
+            value=float(y),
+        )
+        for y in range(2000, 2005)
+    )
+
+    msg = DataMessage(data=[ds0, ds1], response=sized_message(10).response)
+    msg.header.id = "ID"
+    return msg
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(tmp_path, mmap) -> None:
+    msg0 = data_message()
+    snapshot.save(msg0, tmp_path)
+    # The original message is unchanged
+    assert msg0.response is not None
+    assert 9 == len(msg0.data[0].obs) and 10 == len(msg0.response.content)
+
+    msg1 = snapshot.load(tmp_path, mmap=mmap)
+    assert isinstance(msg1, DataMessage) and "ID" == msg1.header.id
+    assert msg1.response is not None and msg1.response.content is None
+
+    ds0, ds1 = msg1.data
+    assert isinstance(ds0, v21.StructureSpecificDataSet)
+    dsd = ds0.structured_by
+    assert dsd is ds1.structured_by and ["A", "B", "TIME_PERIOD"] == [
+        d.id for d in dsd.dimensions
+    ]
+
+    # Series keys are constructed; observations are not
+    assert isinstance(ds0.obs, snapshot.Observations) and not ds0.obs.loaded
+    assert 9 == len(ds0) and [3, 3, 3] == list(map(len, ds0.series.values()))
+    sk = list(ds0.series)[0]
+    assert ("a1", "b1") == sk.get_values() and dsd.dimensions[0] is sk["A"].value_for
+    (gk,) = ds0.group
+    assert {gk} == sk.group_keys and "kg" == sk.group_attrib["UNIT"].value
+    assert not ds0.obs.loaded
+
+    # Accessing observations constructs them, with the same contents
+    assert ds0.series[sk][0] is ds0.obs[0] and ds0.obs.loaded
+    for obs0, obs1 in zip(msg0.data[0].obs, ds0.obs):
+        assert obs0.key == obs1.key and obs0.value == obs1.value
+        assert obs1.series_key in ds0.series
+        assert {k: v.value for k, v in obs0.attrib.items()} == {
+            k: v.value for k, v in obs1.attrib.items()
+        }
+    assert dsd.measures[0] is ds0.obs[0].value_for
+    assert 6 == len(ds0.group[gk]) and {gk} == ds0.obs[0].group_keys
+
+    # Data sets without series
+    assert [2000.0, 2001.0] == [o.value for o in ds1.obs[:2]]
+    assert not ds1.series and ds1.obs[0].series_key is None
+
+    # Data frames are the same
+    for a, b in zip(msg0.data, msg1.data):
+        pd.testing.assert_series_equal(sdmx.to_pandas(a), sdmx.to_pandas(b))
+
+
+class _Key(common.Key):
+    pass
+
+
+class _SeriesKey(common.SeriesKey):
+    pass
+
+
+def test_save_load_classes(tmp_path) -> None:
+    """Keys are loaded with the same classes as saved."""
+    dsd = v21.DataStructureDefinition(id="DSD")
+    for id in "A", "B":
+        dsd.dimensions.getdefault(id)
+    ds = v21.DataSet(structured_by=dsd)
+    key = dsd.make_key(_Key, dict(B="b1"))
+    ds.add_obs(
+        [v21.Observation(dimension=key, value=1.0)],
+        dsd.make_key(_SeriesKey, dict(A="a1")),
+    )
+    snapshot.save(DataMessage(data=[ds]), tmp_path)
+
+    msg = snapshot.load(tmp_path)
+    assert isinstance(msg, DataMessage)
+    obs = msg.data[0].obs[0]
+    assert _SeriesKey is type(list(msg.data[0].series)[0]) is type(obs.series_key)
+    assert _Key is type(obs.dimension) and ("b1",) == obs.dimension.get_values()
+
+
+def test_save_load_structure(tmp_path) -> None:
+    snapshot.save(structure_message(), tmp_path)
+    msg = snapshot.load(tmp_path)
+    assert isinstance(msg, StructureMessage)
+    assert msg.dataflow["FLOW"].structure is msg.structure["DSD"]
+
+    # Saving again replaces the snapshot
+    snapshot.save(data_message(), tmp_path)
+    snapshot.save(structure_message(), tmp_path)
+    assert [] == list(tmp_path.glob("*.npy"))
+
+
+def test_save_replace(monkeypatch, tmp_path) -> None:
+    """Saving replaces only the files of an existing snapshot, once complete."""
+    other = tmp_path.joinpath("other.npy")
+    other.write_bytes(b"")
+
+    snapshot.save(data_message(), tmp_path)
+    files = set(tmp_path.glob("*.npy"))
+
+    # Interrupted while writing the message: the existing snapshot is unchanged
+    def dump(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as m:
+        m.setattr(snapshot.pickle, "dump", dump)
+        with pytest.raises(KeyboardInterrupt):
+            snapshot.save(structure_message(), tmp_path)
+
+    msg = snapshot.load(tmp_path)
+    assert isinstance(msg, DataMessage) and 14 == sum(len(ds) for ds in msg.data)
+    assert files == set(tmp_path.glob("*.npy"))
+    assert [] == list(tmp_path.glob("*.tmp"))
+
+    # Saving again deletes the arrays of the existing snapshot, but not other files
+    snapshot.save(data_message(), tmp_path)
+    new = set(tmp_path.glob("*.npy"))
+    assert other in new and len(files) == len(new) and files & new == {other}
+
+
+def test_load_format(tmp_path) -> None:
+    with open(tmp_path.joinpath(snapshot.MESSAGE), "wb") as f:
+        pickle.dump((0, StructureMessage(), []), f)
+
+    with pytest.raises(ValueError, match="Snapshot format 0 in .*; expected 1"):
+        snapshot.load(tmp_path)
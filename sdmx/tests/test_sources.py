@@ -206,6 +206,121 @@ class TestESTAT(DataSourceTest):
 
         assert len(msg.data[0].obs) == 43
 
+    DATA_URL = "https://example.com/data/FOO"
+    FILE_URL = "https://example.com/file/abc"
+
+    @classmethod
+    def footer_responses(cls, mock) -> None:
+        """Add responses to `mock`: a footer with a URL, 404, then a ZIP file."""
+        import zipfile
+        from io import BytesIO
+
+        from sdmx.message import DataMessage, Footer, Header
+        from sdmx.model.common import InternationalString
+
+        footer = DataMessage(
+            header=Header(id="FOOTER"),
+            footer=Footer(code=413, text=[InternationalString(cls.FILE_URL)]),
+        )
+        mock.get(cls.DATA_URL, body=sdmx.to_xml(footer), content_type="text/xml")
+        mock.get(cls.FILE_URL, status=404)
+
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("data.xml", sdmx.to_xml(DataMessage(header=Header(id="DATA"))))
+        mock.get(
+            cls.FILE_URL, body=buf.getvalue(), content_type="application/octet-stream"
+        )
+
+    @pytest.mark.parametrize("stream", (False, True))
+    def test_footer(self, monkeypatch, stream) -> None:
+        import responses
+
+        sleeps: list[float] = []
+        monkeypatch.setattr("sdmx.source.estat.sleep", sleeps.append)
+
+        client = Client(self.source_id)
+        with responses.RequestsMock() as mock:
+            self.footer_responses(mock)
+            msg = client.get(url=self.DATA_URL, get_footer_url=(1, 3), stream=stream)
+
+        # Data from the ZIP file; exponential backoff while the file is not ready
+        assert isinstance(msg, sdmx.message.DataMessage)
+        assert "DATA" == msg.header.id
+        assert [1, 2] == sleeps
+
+    def test_footer_async(self, monkeypatch) -> None:
+        import asyncio
+
+        import responses
+
+        sleeps: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr("sdmx.source.estat.asyncio.sleep", sleep)
+
+        async def main():
+            client = sdmx.AsyncClient(self.source_id)
+            return await client.get(url=self.DATA_URL, get_footer_url=(5, 2))
+
+        with responses.RequestsMock() as mock:
+            self.footer_responses(mock)
+            msg = asyncio.run(main())
+
+        assert "DATA" == msg.header.id
+        assert [5, 10] == sleeps
+
+        # Maximum attempts exceeded
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+            self.footer_responses(mock)
+            with pytest.raises(RuntimeError, match="Maximum attempts"):
+                Client(self.source_id).get(url=self.DATA_URL, get_footer_url=(0, 1))
+
+    def test_handle_response(self) -> None:
+        import zipfile
+        from io import BytesIO
+
+        import requests
+
+        response = requests.Response()
+        response.url = self.FILE_URL
+        response.headers["content-type"] = "application/octet-stream"
+
+        # Archive with 2 members
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("a.xml", "<a/>")
+            zf.writestr("b.xml", "<b/>")
+
+        with pytest.raises(ValueError, match="contains 2 files; expected 1"):
+            Client(self.source_id).source.handle_response(response, buf)
+
+    @pytest.mark.parametrize("compression", ("ZIP_STORED", "ZIP_DEFLATED"))
+    def test_zip_member_io(self, compression) -> None:
+        import zipfile
+        from io import BufferedReader, BytesIO
+
+        from sdmx.source.estat import ZipMemberIO
+
+        content = b"".join(b"<obs value='%d'/>" % i for i in range(10_000))
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, "w", compression=getattr(zipfile, compression)) as zf:
+            zf.writestr("data.xml", content)
+
+        zmio = ZipMemberIO(BytesIO(buf.getvalue()))
+        zmio.chunk_size = 1000
+        assert content == BufferedReader(zmio).read()
+
+        # Truncated archive
+        zmio = ZipMemberIO(BytesIO(buf.getvalue()[: len(buf.getvalue()) // 2]))
+        with pytest.raises(EOFError):
+            BufferedReader(zmio).read()
+
+        with pytest.raises(ValueError, match="Not a ZIP archive"):
+            ZipMemberIO(BytesIO(content))
+
     @pytest.mark.network
     def test_ss_data(self, client):
         """Test a request for structure-specific data.
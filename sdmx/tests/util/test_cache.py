@@ -0,0 +1,250 @@
+import os
+import threading
+import time
+
+import pytest
+import requests
+
+from sdmx.message import StructureMessage
+from sdmx.testing import sized_message, structure_message
+from sdmx.util.cache import (
+    CacheInfo,
+    MessageCache,
+    PersistentMessageCache,
+    StructureCache,
+    request_key,
+    response_size,
+)
+
+
+class TestMessageCache:
+    def test_getitem(self) -> None:
+        c = MessageCache()
+        msg = sized_message(10)
+
+        with pytest.raises(KeyError):
+            c["a"]
+        c["a"] = msg
+
+        assert msg is c["a"]
+        assert "a" in c and "b" not in c
+        assert CacheInfo(1, 1, 0, 0, 1, 10) == c.info()
+
+    def test_max_entries(self) -> None:
+        c = MessageCache(max_entries=2)
+        c["a"], c["b"] = sized_message(1), sized_message(1)
+        c["a"]  # "a" is more recently used than "b"
+        c["c"] = sized_message(1)
+
+        assert ["a", "c"] == list(c)
+        assert 1 == c.info().evictions
+
+    def test_max_bytes(self) -> None:
+        c = MessageCache(max_bytes=100)
+        c["a"], c["b"] = sized_message(40), sized_message(40)
+        c["c"] = sized_message(30)
+
+        assert ["b", "c"] == list(c)
+        assert 70 == c.info().bytes
+
+        # Replacing an entry updates the size
+        c["c"] = sized_message(10)
+        assert 50 == c.info().bytes
+
+        # A message larger than max_bytes is not stored
+        c["d"] = sized_message(101)
+        assert "d" not in c and 2 == len(c)
+
+    def test_ttl(self, monkeypatch) -> None:
+        now = [0.0]
+        monkeypatch.setattr("sdmx.util.cache.time.monotonic", lambda: now[0])
+
+        c = MessageCache(ttl=10)
+        c["a"] = sized_message(1)
+        now[0] = 9.0
+        assert "a" in c
+
+        now[0] = 10.0
+        with pytest.raises(KeyError):
+            c["a"]
+        assert CacheInfo(0, 1, 0, 1, 0, 0) == c.info()
+
+    def test_clear(self) -> None:
+        c = MessageCache()
+        c["a"] = sized_message(5)
+        c["a"]
+
+        c.clear()
+        assert 0 == len(c)
+        # Statistics are retained
+        assert CacheInfo(1, 0, 0, 0, 0, 0) == c.info()
+
+    def test_threads(self) -> None:
+        c = MessageCache(max_entries=10, max_bytes=50)
+
+        def work(i: int) -> None:
+            for j in range(200):
+                c[f"{i}-{j % 20}"] = sized_message(j % 7)
+                c.get(f"{i}-{(j - 1) % 20}")
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        info = c.info()
+        assert info.entries <= 10 and info.bytes <= 50
+        assert info.bytes == sum(response_size(c._data[k][0]) for k in c)
+
+
+class TestPersistentMessageCache:
+    def test_getitem(self, tmp_path) -> None:
+        c = PersistentMessageCache(tmp_path.joinpath("c.sqlite"))
+        msg = structure_message()
+        msg.response = response = sized_message(10).response
+        assert response is not None
+        response.headers["ETag"] = '"abc"'
+
+        with pytest.raises(KeyError):
+            c["a"]
+        c["a"] = msg
+        assert "a" in c and "b" not in c
+        assert ["a"] == list(c) and 1 == len(c)
+
+        # Another instance, for instance in another process, reads the message
+        c2 = PersistentMessageCache(tmp_path.joinpath("c.sqlite"))
+        result = c2["a"]
+        assert isinstance(result, StructureMessage) and result is not msg
+        assert ["DIM_1", "DIM_2"] == [d.id for d in result.structure["DSD"].dimensions]
+        # Response headers are stored, but not the body
+        assert result.response is not None
+        assert '"abc"' == result.response.headers["ETag"]
+        assert result.response.content is None
+        # The original message is unchanged
+        assert 10 == len(response.content)
+
+        del c2["a"]
+        assert "a" not in c
+        with pytest.raises(KeyError):
+            del c2["a"]
+
+    def test_max_bytes(self, tmp_path) -> None:
+        c = PersistentMessageCache(tmp_path.joinpath("c.sqlite"))
+        c["a"] = structure_message()
+        size = c.size
+
+        c = PersistentMessageCache(tmp_path.joinpath("c.sqlite"), max_bytes=2 * size)
+        c["b"] = structure_message()
+        c["a"]  # "a" is more recently used than "b"
+        c["c"] = structure_message()
+
+        assert {"a", "c"} == set(c)
+        assert 2 * size == c.size
+
+        c.clear()
+        assert 0 == len(c)
+
+    def test_ttl(self, monkeypatch, tmp_path) -> None:
+        c = PersistentMessageCache(tmp_path.joinpath("c.sqlite"), ttl=10)
+        c["a"] = StructureMessage()
+
+        now = time.time()
+        monkeypatch.setattr("sdmx.util.cache.time.time", lambda: now + 11)
+        assert "a" not in c
+        with pytest.raises(KeyError):
+            c["a"]
+        assert 0 == len(c)
+
+    def test_threads(self, tmp_path) -> None:
+        """Several instances, each used by several threads, share one database."""
+        caches = [PersistentMessageCache(tmp_path.joinpath("c.sqlite")) for _ in "ab"]
+
+        def work(i: int) -> None:
+            c = caches[i % 2]
+            for j in range(20):
+                c[f"{j}"] = StructureMessage()
+                c.get(f"{j - 1}")
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert 20 == len(caches[0])
+
+    def test_message_cache(self, tmp_path) -> None:
+        """:class:`.PersistentMessageCache` as a second level of MessageCache."""
+        persist = PersistentMessageCache(tmp_path.joinpath("c.sqlite"))
+        c = MessageCache(persist=persist)
+        c["a"] = structure_message()
+        assert "a" in persist
+
+        # A new in-memory cache retrieves from the persistent cache
+        c = MessageCache(persist=persist)
+        assert "a" in c
+        msg = c["a"]
+        assert msg is c["a"]  # Kept in memory
+        assert CacheInfo(2, 0, 0, 0, 1, 0) == c.info()
+
+        with pytest.raises(KeyError):
+            c["b"]
+        assert 1 == c.info().misses
+
+
+def test_request_key() -> None:
+    req = requests.Request("GET", "https://example.com/foo").prepare()
+    assert "https://example.com/foo" == request_key(req)
+
+    req.headers.update({"Accept": "*/*"})
+    assert "https://example.com/foo" == request_key(req)
+
+    req.headers.update({"Accept": "text/csv", "User-Agent": "foo"})
+    assert "https://example.com/foo\nAccept: text/csv" == request_key(req)
+
+
+class TestStructureCache:
+    URN = "urn:sdmx:org.sdmx.infomodel.datastructure.Dataflow=TEST:FLOW(1.0)"
+
+    def test_get_put(self, tmp_path) -> None:
+        c = StructureCache(tmp_path)
+        assert c.get("TEST", self.URN) is None
+
+        c.put("TEST", self.URN, structure_message())
+
+        # Stored in a subdirectory for the source; version is part of the file name
+        assert [tmp_path.joinpath("TEST", "Dataflow=TEST_FLOW(1.0).xml")] == list(
+            tmp_path.glob("*/*")
+        )
+
+        # A new instance reads the stored message
+        msg = StructureCache(tmp_path).get("TEST", self.URN)
+        assert msg is not None
+        dsd = msg.dataflow["FLOW"].structure
+        assert ["DIM_1", "DIM_2"] == [d.id for d in dsd.dimensions]
+
+        c.clear()
+        assert c.get("TEST", self.URN) is None
+
+    def test_ttl(self, tmp_path) -> None:
+        c = StructureCache(tmp_path, ttl=60)
+        c.put("TEST", self.URN, structure_message())
+        assert c.get("TEST", self.URN) is not None
+
+        # Modification time more than `ttl` seconds ago
+        (p,) = tmp_path.glob("*/*")
+        mtime = p.stat().st_mtime - 61
+        os.utime(p, (mtime, mtime))
+
+        assert c.get("TEST", self.URN) is None
+        assert not p.exists()
+
+
+def test_response_size() -> None:
+    assert 3 == response_size(sized_message(3))
+    assert 0 == response_size(StructureMessage())
+
+    response = requests.Response()
+    response.headers["Content-Length"] = "12"
+    assert 12 == response_size(StructureMessage(response=response))
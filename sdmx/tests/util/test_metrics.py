@@ -0,0 +1,68 @@
+import logging
+from datetime import timedelta
+
+import pytest
+import requests
+
+from sdmx.message import StructureMessage
+from sdmx.util.metrics import Metrics, add_sink, collect, remove_sink
+
+
+class TestMetrics:
+    def test_durations(self) -> None:
+        m = Metrics(start=10.0)
+        assert {"total": 0.0} == m.durations()
+
+        for event, t in ("prepared", 10.5), ("sent", 11.0), ("parse_start", 13.0):
+            m.mark(event, t)
+        response = requests.Response()
+        response.elapsed = timedelta(seconds=1.5)
+        # Body not yet read, as with stream=True
+        response._content = False  # type: ignore [assignment]
+        m.received(response)
+        m.mark("parse_end", 14.0)
+
+        assert 2.5 == m.times["first_byte"] and "body" not in m.times
+        assert dict(prepare=0.5, wait=1.5, parse=1.0, total=4.0) == m.durations()
+
+        # Body already read
+        response._content = b"foo"
+        m.received(response)
+        assert "body" in m.times
+
+    def test_finished(self) -> None:
+        m = Metrics()
+        m.mark("parse_end")
+        msg = StructureMessage()
+        m.finished(msg)
+
+        assert msg.metrics is m
+        assert m.times["body"] == m.times["parse_end"]
+        assert m.bytes_received is m.observations is None
+
+        # Metrics are ignored when comparing messages
+        assert msg.compare(StructureMessage(), strict=True)
+
+
+def test_sinks(caplog) -> None:
+    def fail(m: Metrics) -> None:
+        raise RuntimeError("sink failed")
+
+    add_sink(fail)
+    try:
+        with collect() as records:
+            m = Metrics()
+            m.emit()
+    finally:
+        remove_sink(fail)
+
+    # Other sinks receive the metrics, and the exception is logged
+    assert [m] == records
+    assert caplog.records[-1].levelno == logging.ERROR
+    assert "RuntimeError: sink failed" in caplog.text
+
+    # Sinks are removed
+    Metrics().emit()
+    assert 1 == len(records)
+    with pytest.raises(ValueError):
+        remove_sink(fail)
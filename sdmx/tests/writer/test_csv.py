@@ -1,3 +1,5 @@
+import gzip
+import io
 import re
 from functools import partial
 from itertools import product
@@ -225,6 +227,57 @@ def test_write_labels(
     assert len(dm.data[0]) == len(result)
 
 
+@pytest.mark.parametrize("chunksize", [1, 4, 100])
+def test_write_chunks(
+    tmp_path: "Path",
+    messages: tuple[message.StructureMessage, message.DataMessage],
+    chunksize: int,
+) -> None:
+    """SDMX-CSV written in chunks is identical to SDMX-CSV written at once."""
+    sm, dm = messages
+    kw: "ToCSVArgs" = dict(attributes=Attributes.all)
+    expected = sdmx.to_csv(dm, **kw)
+    assert isinstance(expected, str) and expected.startswith("STRUCTURE,")
+
+    # Write to a text stream
+    buf = io.StringIO()
+    assert None is sdmx.to_csv(dm, path=buf, chunksize=chunksize, **kw)
+    assert expected == buf.getvalue()
+
+    # Write to a path with compression inferred from the suffix
+    path = tmp_path.joinpath("data.csv.gz")
+    sdmx.to_csv(dm.data[0], path=path, chunksize=chunksize, **kw)
+    with gzip.open(path, "rt") as f:
+        assert expected == f.read()
+
+    # Write observations from a generator; `obj` only provides structure
+    ds = v21.DataSet(described_by=dm.dataflow, structured_by=dm.data[0].structured_by)
+    buf = io.StringIO()
+    sdmx.to_csv(
+        ds, path=buf, chunksize=chunksize, observations=iter(dm.data[0].obs), **kw
+    )
+    assert expected == buf.getvalue()
+
+
+def test_write_chunks_invalid(
+    messages: tuple[message.StructureMessage, message.DataMessage],
+) -> None:
+    sm, dm = messages
+
+    with pytest.raises(ValueError, match="without path"):
+        sdmx.to_csv(dm, chunksize=10)
+
+    with pytest.raises(ValueError, match="without chunksize"):
+        sdmx.to_csv(dm, path=io.StringIO(), observations=[])
+
+    with pytest.raises(ValueError, match="compression='bz2'"):
+        sdmx.to_csv(dm, path=io.StringIO(), chunksize=10, compression="bz2")  # type: ignore [arg-type]
+
+    dm.data.append(dm.data[0])
+    with pytest.raises(NotImplementedError, match="with 2 data sets"):
+        sdmx.to_csv(dm, path=io.StringIO(), chunksize=10)
+
+
 def test_rtype_str(tmp_path, specimen):
     with specimen("ECB_EXR/1/M.USD.EUR.SP00.A.xml") as f:
         msg = sdmx.read_sdmx(f)
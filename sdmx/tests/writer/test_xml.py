@@ -1,3 +1,4 @@
+import gzip
 import io
 import logging
 from abc import ABC
@@ -333,6 +334,70 @@ def test_MetadataMessage(metadata_message, *, debug: bool = True) -> None:
     assert validate_xml(buf), buf.getvalue().decode()
 
 
+def c14n(data: bytes) -> bytes:
+    """Canonical form of SDMX-ML `data`, ignoring redundant namespace declarations."""
+    return etree.tostring(etree.parse(io.BytesIO(data)), method="c14n2")
+
+
+@pytest.mark.parametrize("struct_spec", [False, True])
+def test_to_xml_stream_data(tmp_path, header, dsd, struct_spec) -> None:
+    """:py:`to_xml(..., stream=True)` gives the same SDMX-ML for data."""
+    pm = m.PrimaryMeasure(id="OBS_VALUE")
+    dsd.measures.append(pm)
+    ds = (m.StructureSpecificDataSet if struct_spec else m.DataSet)(structured_by=dsd)
+    for foo in "01":
+        sk = dsd.make_key(m.SeriesKey, dict(FOO=foo, BAR="2"))
+        ds.add_obs(
+            [
+                m.Observation(
+                    series_key=sk,
+                    dimension=dsd.make_key(m.Key, dict(BAZ=baz)),
+                    value_for=pm,
+                    value=1.0,
+                )
+                for baz in "012"
+            ],
+            sk,
+        )
+    dm = message.DataMessage(
+        header=header, data=[ds], observation_dimension=dsd.dimensions.get("BAZ")
+    )
+
+    # Write to a binary stream
+    buf = io.BytesIO()
+    assert sdmx.to_xml(dm, buf, stream=True) is None
+
+    # Output is equivalent to non-incremental output
+    assert c14n(sdmx.to_xml(dm)) == c14n(buf.getvalue())
+
+    # Output can be read again
+    buf.seek(0)
+    msg = cast(message.DataMessage, sdmx.read_sdmx(buf, structure=dsd))
+    assert 2 == len(msg.data[0].series)
+    assert 6 == len(msg.data[0])
+
+
+def test_to_xml_stream_structure(tmp_path, header, structuremessage) -> None:
+    """:py:`to_xml(..., stream=True)` gives the same SDMX-ML for structures."""
+    structuremessage.header = header
+
+    # Write to a path with gzip compression
+    path = tmp_path.joinpath("output.xml.gz")
+    sdmx.to_xml(structuremessage, path, stream=True, compression=6)
+
+    # Output is equivalent to non-incremental output
+    data = gzip.decompress(path.read_bytes())
+    assert c14n(sdmx.to_xml(structuremessage)) == c14n(data)
+
+    # Message can be read again
+    msg = cast(message.StructureMessage, sdmx.read_sdmx(io.BytesIO(data)))
+    assert msg.compare(structuremessage, strict=False)
+
+    # Path is required
+    with pytest.raises(ValueError, match="without path"):
+        sdmx.to_xml(structuremessage, stream=True)
+
+
 def test_ErrorMessage(errormessage):
     """:class:`.ErrorMessage` can be written."""
     sdmx.to_xml(errormessage)
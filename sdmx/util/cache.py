@@ -0,0 +1,471 @@
+"""Caches of retrieved SDMX messages."""
+
+import copy
+import logging
+import os
+import pickle
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import requests
+
+if TYPE_CHECKING:
+    import sdmx.message
+
+log = logging.getLogger(__name__)
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`MessageCache`, returned by :meth:`.MessageCache.info`."""
+
+    #: Number of lookups that returned a message.
+    hits: int
+    #: Number of lookups that did not, including those of expired entries.
+    misses: int
+    #: Number of entries removed to stay within `max_entries` or `max_bytes`.
+    evictions: int
+    #: Number of entries removed because they were older than `ttl`.
+    expirations: int
+    #: Current number of entries.
+    entries: int
+    #: Current estimated size of all entries, in bytes.
+    bytes: int
+
+
+def response_size(msg: "sdmx.message.Message") -> int:
+    """Estimate the size of `msg` from the body of its :attr:`~.Message.response`.
+
+    If the body was not retained (for instance, with :py:`Client.get(...,
+    stream=True)`), the Content-Length header is used. If neither is available,
+    return 0.
+    """
+    response = msg.response
+    content = getattr(response, "_content", None)
+    if isinstance(content, bytes):
+        return len(content)
+
+    try:
+        return int(response.headers["Content-Length"])  # type: ignore [union-attr]
+    except (AttributeError, KeyError, ValueError):
+        return 0
+
+
+#: HTTP request headers that affect the content of the response, and so are included
+#: in the key returned by :func:`request_key`.
+KEY_HEADERS = ("Accept", "Accept-Language")
+
+
+def request_key(req: requests.PreparedRequest) -> str:
+    """Return a key for caching the message retrieved by `req`.
+
+    The key is the URL of `req`, followed by any :data:`KEY_HEADERS` that have values
+    other than the default ``*/*``, on separate lines.
+    """
+    lines = [req.url or ""]
+    for name in KEY_HEADERS:
+        if (value := req.headers.get(name)) not in (None, "*/*"):
+            lines.append(f"{name}: {value}")
+    return "\n".join(lines)
+
+
+class MessageCache(MutableMapping[str, "sdmx.message.Message"]):
+    """Bounded, thread-safe, in-memory cache of messages, keyed by :func:`request_key`.
+
+    When an entry is added that would exceed either `max_entries` or `max_bytes`, the
+    least recently used entries are evicted. Entries older than `ttl` are discarded
+    when next looked up.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of messages. :obj:`None` for no limit.
+    max_bytes : int, optional
+        Maximum estimated size of all messages. :obj:`None` for no limit. A message
+        larger than this is not stored at all.
+    ttl : float, optional
+        Lifetime of each entry, in seconds. :obj:`None` for no limit.
+    sizeof : callable, optional
+        Function that returns the estimated size of a message, in bytes. Default:
+        :func:`response_size`.
+    persist : PersistentMessageCache, optional
+        Second-level cache. Messages added are also stored in `persist`. Messages not
+        found in memory are looked up in `persist`, and, if found, are kept in memory
+        and counted as hits.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = 128,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[["sdmx.message.Message"], int] = response_size,
+        persist: "PersistentMessageCache | None" = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.persist = persist
+
+        # Key → (message, estimated size, time stored)
+        self._data: OrderedDict[str, tuple["sdmx.message.Message", int, float]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def __getitem__(self, key: str) -> "sdmx.message.Message":
+        with self._lock:
+            try:
+                msg = self._get(key)
+            except KeyError:
+                try:
+                    if self.persist is None:
+                        raise
+                    msg = self.persist[key]
+                except KeyError:
+                    self._misses += 1
+                    raise
+                self._set(key, msg)
+            self._hits += 1
+            return msg
+
+    def __setitem__(self, key: str, value: "sdmx.message.Message") -> None:
+        if self.persist is not None:
+            self.persist[key] = value
+        self._set(key, value)
+
+    def _set(self, key: str, value: "sdmx.message.Message") -> None:
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+            if self.max_bytes is not None and size > self.max_bytes:
+                log.debug(f"Not caching {size} B message for {key}")
+                return
+
+            self._data[key] = (value, size, time.monotonic())
+            self._bytes += size
+
+            # Evict least recently used entries
+            while (self.max_entries is not None and len(self) > self.max_entries) or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._data)))
+                self._evictions += 1
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def __contains__(self, key) -> bool:
+        # Unlike __getitem__, do not update statistics or order
+        with self._lock:
+            if key in self._data and not self._expire(key):
+                return True
+        return self.persist is not None and key in self.persist
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries from memory. Statistics are not reset.
+
+        Entries in :attr:`persist` are not removed; use its :meth:`~.clear` method.
+        """
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def info(self) -> CacheInfo:
+        """Return statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._expirations,
+                len(self._data),
+                self._bytes,
+            )
+
+    def _get(self, key: str) -> "sdmx.message.Message":
+        if self._expire(key):
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        return self._data[key][0]
+
+    def _expire(self, key: str) -> bool:
+        """Remove the entry for `key` if it is older than :attr:`ttl`."""
+        if self.ttl is None or time.monotonic() - self._data[key][2] < self.ttl:
+            return False
+        self._remove(key)
+        self._expirations += 1
+        return True
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._data.pop(key)[1]
+
+
+class PersistentMessageCache(MutableMapping[str, "sdmx.message.Message"]):
+    """Persistent, on-disk cache of parsed messages, shared by processes.
+
+    Unlike caching of HTTP responses with :mod:`requests_cache`, messages are stored
+    after they are parsed, so retrieving one does not parse SDMX again. Messages are
+    stored with :mod:`pickle` in a :mod:`sqlite3` database. SQLite's file locking
+    allows several threads and processes to use one database. When the total size of
+    stored messages would exceed `max_bytes`, the least recently used entries are
+    deleted.
+
+    The body of :attr:`.Message.response` is not stored; only its URL, status code,
+    and headers (for instance, for :py:`Client.get(..., revalidate=True)`).
+
+    Use this as the :attr:`.MessageCache.persist` of :attr:`.Client.cache`. Because
+    :mod:`pickle` can run arbitrary code, do not use a database from an untrusted
+    source.
+
+    Parameters
+    ----------
+    path : os.PathLike, optional
+        Path to the database file. Default: a file named :file:`messages.sqlite`
+        within the :meth:`platformdirs.user_cache_path`.
+    max_bytes : int, optional
+        Maximum total size of stored messages. :obj:`None` for no limit. Default: 1 GiB.
+    ttl : float, optional
+        Lifetime of each entry, in seconds. :obj:`None` for no limit.
+    """
+
+    def __init__(
+        self,
+        path: "os.PathLike | None" = None,
+        max_bytes: int | None = 2**30,
+        ttl: float | None = None,
+    ):
+        if path is None:
+            import platformdirs
+
+            path = platformdirs.user_cache_path("sdmx").joinpath("messages.sqlite")
+
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path, timeout=60, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS message (key TEXT PRIMARY KEY, value BLOB, "
+                "size INTEGER, stored REAL, accessed REAL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS message_accessed ON message (accessed)"
+            )
+
+    def __getitem__(self, key: str) -> "sdmx.message.Message":
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, stored FROM message WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(key)
+            elif self.ttl is not None and now - row[1] >= self.ttl:
+                self._db.execute("DELETE FROM message WHERE key = ?", (key,))
+                raise KeyError(key)
+            self._db.execute(
+                "UPDATE message SET accessed = ? WHERE key = ?", (now, key)
+            )
+
+        try:
+            return pickle.loads(row[0])
+        except Exception as e:  # For instance, a message stored by an older version
+            log.info(f"Discard cached message for {key}: {e!r}")
+            with self._lock:
+                self._db.execute("DELETE FROM message WHERE key = ?", (key,))
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: "sdmx.message.Message") -> None:
+        data = pickle.dumps(_without_content(value), protocol=pickle.HIGHEST_PROTOCOL)
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            log.debug(f"Not caching {len(data)} B message for {key}")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")  # Lock the database for writing
+            try:
+                self._db.execute(
+                    "REPLACE INTO message VALUES (?, ?, ?, ?, ?)",
+                    (key, data, len(data), now, now),
+                )
+                self._evict()
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM message WHERE key = ?", (key,))
+        if not cursor.rowcount:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        # Does not update the access time
+        with self._lock:
+            row = self._db.execute(
+                "SELECT stored FROM message WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and (self.ttl is None or time.time() - row[0] < self.ttl)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._db.execute("SELECT key FROM message").fetchall()
+        return iter([r[0] for r in rows])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM message").fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock:
+            self._db.execute("DELETE FROM message")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    @property
+    def size(self) -> int:
+        """Total size of stored messages, in bytes."""
+        with self._lock:
+            return self._db.execute("SELECT TOTAL(size) FROM message").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the size is within the limit."""
+        if self.max_bytes is None:
+            return
+        excess = self._db.execute("SELECT TOTAL(size) FROM message").fetchone()[0] - (
+            self.max_bytes
+        )
+        rows = self._db.execute(
+            "SELECT key, size FROM message ORDER BY accessed"
+        ).fetchall()
+        for key, size in rows:
+            if excess <= 0:
+                break
+            self._db.execute("DELETE FROM message WHERE key = ?", (key,))
+            excess -= size
+
+
+def _without_content(msg: "sdmx.message.Message") -> "sdmx.message.Message":
+    """Return a shallow copy of `msg` without the body of its response."""
+    if msg.response is None:
+        return msg
+
+    response = requests.Response()
+    for name in "status_code", "headers", "url", "encoding", "reason", "elapsed":
+        setattr(response, name, getattr(msg.response, name))
+    response._content = None
+
+    result = copy.copy(msg)
+    result.response = response
+    return result
+
+
+class StructureCache:
+    """Persistent, on-disk cache of structure messages.
+
+    Each message is stored as an SDMX-ML file in a subdirectory of `path` for the
+    :attr:`.Source.id`, with a file name derived from the URN (including version) of
+    the queried artefact. Files are written atomically, so several processes may share
+    one cache directory.
+
+    :class:`.Client` uses this cache, if given, for the :class:`.Dataflow` and
+    :class:`DataStructureDefinition <.BaseDataStructureDefinition>` needed to validate
+    :class:`dict` keys, so that a new process can skip these queries.
+
+    Parameters
+    ----------
+    path : os.PathLike, optional
+        Directory for cached files. Default: a directory named :file:`structure`
+        within the :meth:`platformdirs.user_cache_path`.
+    ttl : float, optional
+        Lifetime of each entry, in seconds. :obj:`None` for no limit. Default: 1 day.
+    """
+
+    def __init__(self, path: "os.PathLike | None" = None, ttl: float | None = 86400.0):
+        if path is None:
+            import platformdirs
+
+            path = platformdirs.user_cache_path("sdmx").joinpath("structure")
+
+        self.path = Path(path)
+        self.ttl = ttl
+
+    def get(self, source_id: str, urn: str) -> "sdmx.message.StructureMessage | None":
+        """Return the cached message for `source_id` and `urn`, or :obj:`None`.
+
+        Entries older than :attr:`ttl` are deleted.
+        """
+        from sdmx.reader import read_sdmx
+
+        p = self._path(source_id, urn)
+        try:
+            if self.ttl is not None and time.time() - p.stat().st_mtime >= self.ttl:
+                p.unlink()
+                return None
+        except FileNotFoundError:
+            return None
+
+        log.debug(f"Read {urn} from {p}")
+        return read_sdmx(p)  # type: ignore [return-value]
+
+    def put(
+        self, source_id: str, urn: str, msg: "sdmx.message.StructureMessage"
+    ) -> None:
+        """Store `msg` for `source_id` and `urn`."""
+        from sdmx.writer.xml import to_xml
+
+        p = self._path(source_id, urn)
+        p.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file in the same directory, then rename
+        fd, tmp = tempfile.mkstemp(dir=p.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(to_xml(msg))
+            os.replace(tmp, p)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def clear(self) -> None:
+        """Delete all cached files."""
+        for p in self.path.glob("*/*.xml"):
+            p.unlink()
+
+    def _path(self, source_id: str, urn: str) -> Path:
+        # Drop the URN prefix; replace characters not valid in file names
+        name = re.sub(r"^urn:sdmx:org\.sdmx\.infomodel\.\w+\.", "", urn)
+        name = re.sub(r"[^\w.()+=-]", "_", name)
+        return self.path.joinpath(source_id, f"{name}.xml")
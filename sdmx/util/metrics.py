@@ -0,0 +1,211 @@
+"""Timings, sizes, and counts for retrieval of SDMX messages.
+
+Each call to :meth:`.Client.get` (also :meth:`.Client.get_many` and
+:meth:`.AsyncClient.get`) records a :class:`Metrics` instance. This is attached to the
+returned message as :attr:`.Message.metrics`, and passed to every function registered
+with :func:`add_sink`.
+
+>>> from sdmx.util.metrics import add_sink, collect
+>>> add_sink(lambda m: statsd.timing("sdmx.parse", m.durations()["parse"]))
+>>> with collect() as records:
+...     client.get("dataflow")
+>>> records[0].durations()
+{'prepare': 0.0003, 'wait': 0.4121, 'download': 0.1873, ...}
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+    import sdmx.message
+
+log = logging.getLogger(__name__)
+
+#: Events recorded in :attr:`Metrics.times`, in the order in which they occur.
+#:
+#: ``prepared``
+#:    The HTTP request is prepared from the arguments to :meth:`.Client.get`.
+#: ``sent``
+#:    The request is about to be sent.
+#: ``first_byte``
+#:    The response headers are received. The time since ``sent`` includes DNS lookup,
+#:    connecting, TLS negotiation, any retries, and the time taken by the web service to
+#:    respond.
+#: ``body``
+#:    The response body is received. With :py:`Client.get(..., stream=True)`, the body
+#:    is read while it is parsed, and this is the same as ``parse_end``.
+#: ``parse_start``
+#:    The reader begins parsing. The time since ``body`` includes decompression of
+#:    ".gz" content and the :meth:`.Source.handle_response` hook.
+#: ``parse_end``
+#:    The reader returns a message.
+#: ``finished``
+#:    The :meth:`.Source.finish_message` hook returns.
+EVENTS = (
+    "prepared",
+    "sent",
+    "first_byte",
+    "body",
+    "parse_start",
+    "parse_end",
+    "finished",
+)
+
+#: Stages returned by :meth:`Metrics.durations`, each the time between two
+#: :data:`EVENTS`.
+STAGES = {
+    "prepare": (None, "prepared"),
+    "wait": ("sent", "first_byte"),
+    "download": ("first_byte", "body"),
+    "decompress": ("body", "parse_start"),
+    "parse": ("parse_start", "parse_end"),
+    "finish": ("parse_end", "finished"),
+}
+
+_SINKS: list[Callable[["Metrics"], None]] = []
+_LOCK = threading.Lock()
+
+
+@dataclass
+class Metrics:
+    """Timings, sizes, and counts for retrieval of one message."""
+
+    #: URL of the request.
+    url: str | None = None
+    #: Value of :func:`time.perf_counter` when the instance was created.
+    start: float = field(default_factory=time.perf_counter)
+    #: Mapping from names of :data:`EVENTS` to the time, in seconds since
+    #: :attr:`start`, at which each occurred.
+    times: dict[str, float] = field(default_factory=dict)
+    #: :obj:`True` if the message was returned from :attr:`.Client.cache`, including
+    #: after a revalidation request that returned HTTP 304 Not Modified.
+    cache_hit: bool = False
+    #: Size of the response body in bytes, as transferred: before any Content-Encoding,
+    #: such as gzip, is decoded. This is the position of :attr:`requests.Response.raw`
+    #: after the body is read, or :obj:`None` if that is not available.
+    bytes_received: int | None = None
+    #: Number of bytes read by the reader, after any decompression.
+    bytes_read: int | None = None
+    #: Total number of observations in a :class:`.DataMessage`.
+    observations: int | None = None
+    #: Total number of series in a :class:`.DataMessage`.
+    series: int | None = None
+
+    def mark(self, event: str, t: float | None = None) -> None:
+        """Record that `event` occurred at `t`, a value of :func:`time.perf_counter`.
+
+        If `t` is not given, the current time is used.
+        """
+        self.times[event] = (time.perf_counter() if t is None else t) - self.start
+
+    def durations(self) -> dict[str, float]:
+        """Return the duration of each of :data:`STAGES`, in seconds.
+
+        Stages for which either event was not recorded are omitted. The key "total" gives
+        the time until the last recorded event.
+        """
+        result = {}
+        for name, (a, b) in STAGES.items():
+            try:
+                result[name] = self.times[b] - (self.times[a] if a else 0.0)
+            except KeyError:
+                pass
+        result["total"] = max(self.times.values(), default=0.0)
+        return result
+
+    def received(self, response: "requests.Response") -> None:
+        """Record the events ``first_byte`` and, if it was read, ``body`` of `response`.
+
+        Call this immediately after the request is sent.
+        """
+        sent = self.start + self.times.get("sent", 0.0)
+        self.mark("first_byte", sent + response.elapsed.total_seconds())
+        if response._content is not False:
+            self.mark("body")
+
+    def finished(self, msg: "sdmx.message.Message", content=None) -> None:
+        """Record the event ``finished``, sizes, and counts; attach to `msg`.
+
+        `content` is the file-like object from which the message was read, if any.
+        """
+        self.mark("finished")
+        self.times.setdefault(
+            "body", self.times.get("parse_end", self.times["finished"])
+        )
+
+        if msg.response is not None:
+            self.bytes_received = _tell(msg.response.raw)
+        if content is not None:
+            self.bytes_read = _tell(content)
+
+        if data := getattr(msg, "data", None):
+            self.observations = sum(len(ds) for ds in data)
+            self.series = sum(len(ds.series) for ds in data)
+
+        msg.metrics = self
+
+    def emit(self) -> None:
+        """Pass the instance to every function registered with :func:`add_sink`.
+
+        Exceptions raised by these functions are logged, and otherwise ignored.
+        """
+        with _LOCK:
+            sinks = list(_SINKS)
+
+        for func in sinks:
+            try:
+                func(self)
+            except Exception:
+                log.exception(f"Metrics sink {func!r}")
+
+
+def add_sink(func: Callable[[Metrics], None]) -> None:
+    """Register `func` to receive every :class:`Metrics` recorded.
+
+    `func` may be called from any thread that uses a :class:`.Client`, so should be
+    thread-safe and return quickly.
+    """
+    with _LOCK:
+        _SINKS.append(func)
+
+
+def remove_sink(func: Callable[[Metrics], None]) -> None:
+    """Stop passing :class:`Metrics` to `func`.
+
+    Raises
+    ------
+    ValueError
+        if `func` was not registered with :func:`add_sink`.
+    """
+    with _LOCK:
+        _SINKS.remove(func)
+
+
+@contextmanager
+def collect() -> Iterator[list[Metrics]]:
+    """Context manager collecting :class:`Metrics` recorded in the block into a list.
+
+    Metrics from all threads are collected, for instance from :meth:`.Client.get_many`.
+    """
+    result: list[Metrics] = []
+    sink = result.append
+    add_sink(sink)
+    try:
+        yield result
+    finally:
+        remove_sink(sink)
+
+
+def _tell(obj) -> int | None:
+    """Return the position of file-like `obj`, or :obj:`None`."""
+    try:
+        return int(obj.tell())
+    except (AttributeError, OSError, TypeError, ValueError):
+        return None
@@ -1,23 +1,30 @@
 """:ref:`sdmx-csv` writer."""
 
+import gzip
+from collections.abc import Iterable
+from contextlib import nullcontext
 from os import PathLike
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, Literal
 
 import pandas as pd
 
-from sdmx.convert.pandas import PandasConverter
+from sdmx.convert.pandas import PandasConverter, iter_dataset
 from sdmx.format.csv import common, v2
+from sdmx.message import DataMessage
+from sdmx.model.common import BaseDataStructureDefinition
 
 if TYPE_CHECKING:
-    from sdmx.message import DataMessage
-    from sdmx.model.common import BaseDataSet
+    from sdmx.model.common import BaseDataSet, BaseObservation
 
 
 def to_csv(
     obj: "DataMessage | BaseDataSet",
     *,
-    path: PathLike | None = None,
+    path: PathLike | str | IO | None = None,
     rtype: type[str | pd.DataFrame] = str,
+    chunksize: int | None = None,
+    compression: Literal["infer", "gzip"] | None = "infer",
+    observations: "Iterable[BaseObservation] | None" = None,
     **kwargs,
 ) -> None | str | pd.DataFrame:
     """Convert an SDMX *obj* to SDMX-CSV.
@@ -30,11 +37,22 @@ def to_csv(
 
     Parameters
     ----------
-    path : os.PathLike, optional
-        Path to write an SDMX-CSV file.
+    path : os.PathLike or file-like, optional
+        Path or text stream to write an SDMX-CSV file.
     rtype :
         Return type; see below. Pass literally :class:`str` or
         :class:`pandas.DataFrame`; *not* an instance of either class.
+    chunksize : int, optional
+        If given, write to `path` at most this many observations at a time, without
+        converting all of `obj` to a single :class:`pandas.DataFrame`. Memory use is
+        then bounded by `chunksize`, rather than the size of `obj`. `path` is required.
+    compression : "infer" or "gzip" or None, optional
+        Compression of the output. With "infer" (the default), a `path` ending with
+        ".gz" is compressed with gzip. With "gzip" and a file-like `path`, `path` must
+        be opened in binary mode.
+    observations : iterable of Observation, optional
+        With `chunksize`, observations to write instead of those in `obj`, for instance
+        from a generator. `obj` still provides the data structure and data flow.
 
     Other parameters
     ----------------
@@ -75,13 +93,68 @@ def to_csv(
     :ref:`sdmx.writer.csv <writer-csv>`.
     """
     common.kwargs_to_format_options(kwargs, v2.FormatOptions)
-    result = PandasConverter(**kwargs).convert(obj)
+    c = PandasConverter(**kwargs)
+
+    if chunksize:
+        if path is None:
+            raise ValueError("to_csv(…, chunksize=…) without path")
+        _write_chunks(c, obj, path, chunksize, compression, observations)
+        return None
+    elif observations is not None:
+        raise ValueError("to_csv(…, observations=…) without chunksize")
+
+    result = c.convert(obj)
 
     if path:
-        return result.to_csv(path, index=False)
+        return result.to_csv(path, index=False, compression=compression)
     elif rtype is str:
-        return result.to_string(index=False)
+        return result.to_csv(index=False)
     elif rtype is pd.DataFrame:
         return result
     else:
         raise ValueError(f"Invalid rtype={rtype!r}")
+
+
+def _open(path: PathLike | str | IO, compression: str | None):
+    """Open `path` for writing text, with possible `compression`."""
+    if compression == "infer":
+        compression = (
+            "gzip"
+            if isinstance(path, (str, PathLike)) and str(path).endswith(".gz")
+            else None
+        )
+
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    elif compression is not None:
+        raise ValueError(f"compression={compression!r}")
+    elif isinstance(path, (str, PathLike)):
+        return open(path, "w", encoding="utf-8", newline="")
+    else:
+        return nullcontext(path)
+
+
+def _write_chunks(
+    c: PandasConverter,
+    obj: "DataMessage | BaseDataSet",
+    path: PathLike | str | IO,
+    chunksize: int,
+    compression: str | None,
+    observations: "Iterable[BaseObservation] | None",
+) -> None:
+    """Write `obj` to `path` using :func:`.iter_dataset`."""
+    if isinstance(obj, DataMessage):
+        if len(obj.data) != 1:
+            raise NotImplementedError(
+                f"to_csv(…, chunksize=…) of DataMessage with {len(obj.data)} data sets"
+            )
+        # Use the specified structure of the message; same as convert_datamessage()
+        assert obj.dataflow
+        c._context[BaseDataStructureDefinition] = obj.dataflow.structure
+        ds = obj.data[0]
+    else:
+        ds = obj
+
+    with _open(path, compression) as f:
+        for i, df in enumerate(iter_dataset(c, ds, chunksize, observations)):
+            df.to_csv(f, header=i == 0, index=False)
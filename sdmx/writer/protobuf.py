@@ -1,3 +1,11 @@
+"""SDMX protocol buffers writer.
+
+.. note:: This writer is incomplete. :mod:`sdmx.format.protobuf_pb2` in this package is
+   a placeholder, not code generated from an SDMX protocol buffers schema; so no
+   :mod:`protobuf` objects can be constructed, and :func:`write` raises
+   :class:`NotImplementedError`.
+"""
+
 import logging
 
 import sdmx.format.protobuf_pb2 as pb
@@ -22,9 +30,19 @@ def _write(obj, *args, **kwargs):
         return func(obj, *args, **kwargs)
 
 
+def _envelope():
+    """Return a new :py:`protobuf_pb2.Envelope`."""
+    try:
+        return pb.Envelope()
+    except NotImplementedError:
+        raise NotImplementedError(
+            f"write to protobuf; {pb.__name__} is a placeholder, not generated code"
+        ) from None
+
+
 def _copy(obj, pb_obj):
     """Update the attributes of *pb_obj* from the sdmx.message/.model *obj*."""
-    dir_logged = False
+    failed = []
 
     for attr, value in obj.__dict__.items():
         if not value:
@@ -32,18 +50,17 @@ def _copy(obj, pb_obj):
 
         try:
             setattr(pb_obj, attr, value)
-            log.info(f"Set {attr}")
         except Exception as exc:
-            log.error(f"Failed to set {attr}: {exc}")
+            log.debug(f"Failed to set {attr}: {exc}")
+            failed.append(attr)
 
-            if not dir_logged:
-                fields = filter(lambda n: not n.startswith("_"), dir(pb_obj))
-                log.info(sorted(fields))
-                dir_logged = True
+    if failed:
+        fields = filter(lambda n: not n.startswith("_"), dir(pb_obj))
+        log.error(f"Failed to set {failed!r}; available fields {sorted(fields)}")
 
 
 def write_structuremessage(obj, *args, **kwargs):
-    envelope = pb.Envelope()
+    envelope = _envelope()
 
     for cl in obj.codelist.values():
         pb_obj = envelope.data.codelists.add()
@@ -6,8 +6,9 @@
 # - writer functions for sdmx.message classes, in the same order as message.py
 # - writer functions for sdmx.model classes, in the same order as model.py
 import logging
-from collections.abc import Iterable, MutableMapping
+from collections.abc import Iterable, Iterator, MutableMapping
 from datetime import datetime
+from itertools import chain
 from typing import Literal
 
 import lxml
@@ -22,12 +23,21 @@ from sdmx.model import v21 as model
 from sdmx.util import ucfirst
 from sdmx.writer.base import BaseWriter
 
-_element_maker = ElementMaker(nsmap={k: v for k, v in NS.items() if v is not None})
+#: Namespace prefixes declared on the root element of SDMX-ML output. The "xml" prefix
+#: is bound implicitly, and never declared.
+NSMAP = {k: v for k, v in NS.items() if v is not None and k != "xml"}
+
+_element_maker = ElementMaker(nsmap=NSMAP)
 
 log = logging.getLogger(__name__)
 
 writer = BaseWriter("XML")
 
+#: Writer used by :py:`to_xml(..., stream=True)`. Functions registered with this
+#: writer receive an :class:`lxml.etree.xmlfile` context as their second argument and
+#: write to it incrementally, instead of returning an element.
+stream_writer = BaseWriter("XML (incremental)")
+
 
 def Element(name, *args, **kwargs):
     # Remove None
@@ -36,13 +46,24 @@ def Element(name, *args, **kwargs):
     return _element_maker(qname(name), *args, **kwargs)
 
 
-def to_xml(obj, **kwargs):
+def to_xml(obj, path=None, *, stream: bool = False, **kwargs):
     """Convert an SDMX *obj* to SDMX-ML.
 
     Parameters
     ----------
+    path : os.PathLike or str or file-like, optional
+        If given, write SDMX-ML to this file path or binary stream, and return
+        :data:`None`.
+    stream : bool, optional
+        If :obj:`True`, write incrementally using :class:`lxml.etree.xmlfile`, instead
+        of constructing the complete element tree in memory. For instance, each
+        :class:`.Series` of a :class:`.DataSet`, or each :class:`.Item` of an
+        :class:`.ItemScheme`, is written and then discarded. `path` is required.
     kwargs
         Passed to :meth:`lxml.etree.to_string`, e.g. `pretty_print` = :obj:`True`.
+        With `stream` = :obj:`True`, the supported keyword arguments are `encoding`,
+        `xml_declaration`, `pretty_print`, and `compression`: the gzip compression
+        level (0–9) for the output.
 
     Raises
     ------
@@ -51,7 +72,77 @@ def to_xml(obj, **kwargs):
     """
     kwargs.setdefault("encoding", "utf-8")
     kwargs.setdefault("xml_declaration", True)
-    return etree.tostring(writer.recurse(obj), **kwargs)
+
+    if stream:
+        if path is None:
+            raise ValueError("to_xml(…, stream=True) without path")
+        _to_xml_stream(obj, path, **kwargs)
+        return None
+
+    result = etree.tostring(writer.recurse(obj), **kwargs)
+
+    if path is None:
+        return result
+    elif hasattr(path, "write"):
+        path.write(result)
+    else:
+        with open(path, "wb") as f:
+            f.write(result)
+    return None
+
+
+def _to_xml_stream(
+    obj,
+    path,
+    *,
+    encoding: str,
+    xml_declaration: bool,
+    pretty_print: bool = False,
+    compression: int = 0,
+) -> None:
+    """Write `obj` to `path` incrementally; see :func:`to_xml`."""
+    with etree.xmlfile(path, encoding=encoding, compression=compression) as xf:
+        if xml_declaration:
+            xf.write_declaration()
+        stream_writer.recurse(obj, xf, nsmap=NSMAP, pretty_print=pretty_print)
+
+
+def _write_elem(xf, elem: etree._Element, **kwargs) -> None:
+    """Write `elem` to `xf` and discard it.
+
+    `elem` is detached from its parent, if any, and unused namespace declarations are
+    removed, so that each written chunk declares only the namespaces that it uses.
+    """
+    kwargs.pop("nsmap", None)
+
+    parent = elem.getparent()
+    if parent is not None:
+        parent.remove(elem)
+    etree.cleanup_namespaces(elem)
+
+    xf.write(elem, **kwargs)
+
+
+def _write_shell(
+    xf, elem: etree._Element, children: Iterable[etree._Element], **kwargs
+) -> None:
+    """Write `elem`, its existing child elements, and then `children` to `xf`.
+
+    This allows to use the same functions as :data:`writer` to construct an element
+    with its attributes and leading child elements (for instance, annotations and
+    names), while generating a potentially large number of further child elements
+    one at a time.
+    """
+    nsmap = kwargs.pop("nsmap", None)
+    with xf.element(elem.tag, elem.attrib, nsmap=nsmap):
+        for child in chain(list(elem), children):
+            _write_elem(xf, child, **kwargs)
+
+
+@stream_writer
+def _stream_default(obj: object, xf, **kwargs) -> None:
+    """Write any `obj` for which there is no incremental writer, in one chunk."""
+    _write_elem(xf, writer.recurse(obj), **kwargs)
 
 
 RefStyle = Literal["Ref", "URN"]
@@ -121,50 +212,55 @@ def reference(obj, parent=None, tag=None, *, style: RefStyle):
 # Writers for sdmx.message classes
 
 
-@writer
-def _dm(obj: message.DataMessage):
-    """DataMessage, including MetadataMessage."""
-    # Identify root tag
-    if len(obj.data) and isinstance(
-        obj.data[0],
-        (model.StructureSpecificDataSet, model.StructureSpecificTimeSeriesDataSet),
-    ):
-        tag = "mes:StructureSpecificData"
-    else:
-        tag = tag_for_class(type(obj))
-
-    # Create the root element
-    elem = Element(tag)
-
+def _dm_header(obj: message.DataMessage) -> etree._Element:
+    """Write the header of a DataMessage, including references to data structures."""
     header = writer.recurse(obj.header)
-    elem.append(header)
 
     # Set of DSDs already referenced in the header
     structures = set()
 
     for ds in obj.data:
-        attrib = dict()
-        dsd_ref = None
-
         # Add any new DSD reference to header
-        if ds.structured_by and id(ds.structured_by) not in structures:
-            attrib["structureID"] = ds.structured_by.id
+        if not ds.structured_by or id(ds.structured_by) in structures:
+            continue
+
+        attrib = dict(structureID=ds.structured_by.id)
 
-            # Reference by URN if possible, otherwise with a <Ref> tag
-            style: RefStyle = "URN" if ds.structured_by.urn else "Ref"
-            dsd_ref = reference(ds.structured_by, tag="com:Structure", style=style)
+        # Reference by URN if possible, otherwise with a <Ref> tag
+        style: RefStyle = "URN" if ds.structured_by.urn else "Ref"
+        dsd_ref = reference(ds.structured_by, tag="com:Structure", style=style)
 
-            if isinstance(obj.observation_dimension, model.DimensionComponent):
-                attrib["dimensionAtObservation"] = obj.observation_dimension.id
+        if isinstance(obj.observation_dimension, model.DimensionComponent):
+            attrib["dimensionAtObservation"] = obj.observation_dimension.id
 
-            header.append(Element("mes:Structure", **attrib))
-            header[-1].append(dsd_ref)
+        header.append(Element("mes:Structure", **attrib))
+        header[-1].append(dsd_ref)
 
-            # Record this object so it is not added a second time
-            structures.add(id(ds.structured_by))
+        # Record this object so it is not added a second time
+        structures.add(id(ds.structured_by))
 
-        # Add data
-        elem.append(writer.recurse(ds))
+    return header
+
+
+def _dm_tag(obj: message.DataMessage) -> str:
+    """Identify the root tag for a DataMessage."""
+    if len(obj.data) and isinstance(
+        obj.data[0],
+        (model.StructureSpecificDataSet, model.StructureSpecificTimeSeriesDataSet),
+    ):
+        return "mes:StructureSpecificData"
+    else:
+        return tag_for_class(type(obj))
+
+
+@writer
+def _dm(obj: message.DataMessage):
+    """DataMessage, including MetadataMessage."""
+    # Create the root element
+    elem = Element(_dm_tag(obj), _dm_header(obj))
+
+    # Add data
+    elem.extend(writer.recurse(ds) for ds in obj.data)
 
     if obj.footer:
         elem.append(writer.recurse(obj.footer))
@@ -172,6 +268,46 @@ def _dm(obj: message.DataMessage):
     return elem
 
 
+@stream_writer
+def _dm_stream(obj: message.DataMessage, xf, **kwargs) -> None:
+    with xf.element(qname(_dm_tag(obj)), nsmap=kwargs.pop("nsmap", None)):
+        _write_elem(xf, _dm_header(obj), **kwargs)
+
+        for ds in obj.data:
+            stream_writer.recurse(ds, xf, **kwargs)
+
+        if obj.footer:
+            _write_elem(xf, writer.recurse(obj.footer), **kwargs)
+
+
+#: :class:`.StructureMessage` attributes and corresponding SDMX-ML container tags.
+SM_CONTAINERS = [
+    # Order is important here to avoid forward references
+    ("organisation_scheme", "OrganisationSchemes"),
+    ("dataflow", "Dataflows"),
+    ("category_scheme", "CategorySchemes"),
+    ("categorisation", "Categorisations"),
+    ("codelist", "Codelists"),
+    ("concept_scheme", "Concepts"),
+    ("hierarchical_codelist", "HierarchicalCodelists"),
+    ("structure", "DataStructures"),
+    ("constraint", "Constraints"),
+    ("metadatastructure", "MetadataStructures"),
+    ("provisionagreement", "ProvisionAgreements"),
+]
+
+
+def _sm_contents(
+    obj: message.StructureMessage,
+) -> Iterator[tuple[str, list[common.MaintainableArtefact]]]:
+    """Yield container tags and non-empty lists of artefacts to write in each."""
+    for attr, tag in SM_CONTAINERS:
+        coll = getattr(obj, attr)
+        items = [s for s in coll.values() if not s.is_external_reference]
+        if len(items):
+            yield f"str:{tag}", items
+
+
 @writer
 def _sm(obj: message.StructureMessage):
     # Store a reference to the overal Message for writing references
@@ -185,30 +321,8 @@ def _sm(obj: message.StructureMessage):
     structures = Element("mes:Structures")
     elem.append(structures)
 
-    for attr, tag in [
-        # Order is important here to avoid forward references
-        ("organisation_scheme", "OrganisationSchemes"),
-        ("dataflow", "Dataflows"),
-        ("category_scheme", "CategorySchemes"),
-        ("categorisation", "Categorisations"),
-        ("codelist", "Codelists"),
-        ("concept_scheme", "Concepts"),
-        ("hierarchical_codelist", "HierarchicalCodelists"),
-        ("structure", "DataStructures"),
-        ("constraint", "Constraints"),
-        ("metadatastructure", "MetadataStructures"),
-        ("provisionagreement", "ProvisionAgreements"),
-    ]:
-        coll = getattr(obj, attr)
-        if not len(coll):
-            continue
-        container = Element(f"str:{tag}")
-
-        for s in filter(lambda s: not s.is_external_reference, coll.values()):
-            container.append(writer.recurse(s))
-
-        if len(container):
-            structures.append(container)
+    for tag, items in _sm_contents(obj):
+        structures.append(Element(tag, *[writer.recurse(s) for s in items]))
 
     if obj.footer:
         elem.append(writer.recurse(obj.footer))
@@ -216,6 +330,24 @@ def _sm(obj: message.StructureMessage):
     return elem
 
 
+@stream_writer
+def _sm_stream(obj: message.StructureMessage, xf, **kwargs) -> None:
+    # Store a reference to the overal Message for writing references
+    setattr(writer, "_message", obj)
+
+    with xf.element(qname("mes:Structure"), nsmap=kwargs.pop("nsmap", None)):
+        _write_elem(xf, writer.recurse(obj.header), **kwargs)
+
+        with xf.element(qname("mes:Structures")):
+            for tag, items in _sm_contents(obj):
+                with xf.element(qname(tag)):
+                    for s in items:
+                        stream_writer.recurse(s, xf, **kwargs)
+
+        if obj.footer:
+            _write_elem(xf, writer.recurse(obj.footer), **kwargs)
+
+
 @writer
 def _em(obj: message.ErrorMessage):
     elem = Element("mes:Error")
@@ -389,19 +521,32 @@ def _item(obj: model.Item, **kwargs):
     return elem
 
 
-@writer
-def _is(obj: model.ItemScheme):
+def _is_shell(obj: model.ItemScheme) -> etree._Element:
+    """Write an ItemScheme, without its items."""
     kw = dict()
     if obj.is_partial is not None:
         kw["isPartial"] = str(obj.is_partial).lower()
-    elem = maintainable(obj, **kw)
+    return maintainable(obj, **kw)
+
 
+def _is_items(obj: model.ItemScheme) -> Iterator[etree._Element]:
     # Pass _with_urn to identifiable(): don't generate URNs for Items in `obj` which do
     # not already have them
-    elem.extend(writer.recurse(i, _with_urn=False) for i in obj.items.values())
+    return (writer.recurse(i, _with_urn=False) for i in obj.items.values())
+
+
+@writer
+def _is(obj: model.ItemScheme):
+    elem = _is_shell(obj)
+    elem.extend(_is_items(obj))
     return elem
 
 
+@stream_writer
+def _is_stream(obj: model.ItemScheme, xf, **kwargs) -> None:
+    _write_shell(xf, _is_shell(obj), _is_items(obj), **kwargs)
+
+
 # §3.6: Structure
 
 
@@ -729,8 +874,8 @@ def _obs(obj: model.Observation, struct_spec=False):
     return elem
 
 
-@writer
-def _ds(obj: model.DataSet) -> "lxml.etree._Element":
+def _ds_shell(obj: model.DataSet) -> etree._Element:
+    """Write a DataSet, without its series or observations."""
     if len(obj.group):
         raise NotImplementedError("to_xml() for DataSet with groups")
 
@@ -745,6 +890,11 @@ def _ds(obj: model.DataSet) -> "lxml.etree._Element":
     if len(obj.attrib):
         elem.append(_av("gen:Attributes", obj.attrib.values()))
 
+    return elem
+
+
+def _ds_contents(obj: model.DataSet) -> Iterator[etree._Element]:
+    """Yield one element for each series, then for observations not in any series."""
     obs_to_write = set(map(id, obj.obs))
 
     struct_spec = isinstance(
@@ -758,22 +908,33 @@ def _ds(obj: model.DataSet) -> "lxml.etree._Element":
                 series_attrs[key] = str(sk_dim.value)
             for key, sk_att in sk.attrib.items():
                 series_attrs[key] = str(sk_att.value)
-            elem.append(Element(":Series", **series_attrs))
+            elem = Element(":Series", **series_attrs)
         else:
-            elem.append(Element("gen:Series"))
-            elem[-1].extend(writer.recurse(sk))
-        elem[-1].extend(
+            elem = Element("gen:Series")
+            elem.extend(writer.recurse(sk))
+        elem.extend(
             writer.recurse(obs, struct_spec=struct_spec) for obs in observations
         )
         obs_to_write -= set(map(id, observations))
+        yield elem
 
     # Observations not in any series
     for obs in filter(lambda o: id(o) in obs_to_write, obj.obs):
-        elem.append(writer.recurse(obs, struct_spec=struct_spec))
+        yield writer.recurse(obs, struct_spec=struct_spec)
+
 
+@writer
+def _ds(obj: model.DataSet) -> "lxml.etree._Element":
+    elem = _ds_shell(obj)
+    elem.extend(_ds_contents(obj))
     return elem
 
 
+@stream_writer
+def _ds_stream(obj: model.DataSet, xf, **kwargs) -> None:
+    _write_shell(xf, _ds_shell(obj), _ds_contents(obj), **kwargs)
+
+
 # SDMX 2.1 §7.3: Metadata Structure Definition
 
 